@@ -22,30 +22,42 @@
 # THE SOFTWARE.
 #
 import warnings
+from typing import Any
 
-# Maximally flexible approach to obtain version numbers, based on this approach:
-# https://github.com/pypa/setuptools_scm/issues/143#issuecomment-672878863
-# Sadly, this does not work with editable installs, which bake in version info on installation.
-# see also https://github.com/pyusb/pyusb/pull/307#issuecomment-650797688
-try:
-    # If a user has setuptools_scm installed, assume they want the most up to date version string.
-    # Alternatively, we could use a dummy dev module that is never packaged whose presence signals
-    # that we are in an editable install/repo, see https://github.com/pycalphad/pycalphad/pull/341
-    import setuptools_scm
-    __version__ = setuptools_scm.get_version(root='..', relative_to=__file__)
-    del setuptools_scm
-except (ImportError, LookupError):
-    # Setuptools_scm was not found, or it could not find a version, so use installation metadata.
-    from importlib.metadata import PackageNotFoundError, version
 
+def _get_version() -> str:
+    """Return the version of pymeasure."""
+    # Maximally flexible approach to obtain version numbers, based on this approach:
+    # https://github.com/pypa/setuptools_scm/issues/143#issuecomment-672878863
+    # Sadly, this does not work with editable installs, which bake in version info on
+    # installation, see also https://github.com/pyusb/pyusb/pull/307#issuecomment-650797688
     try:
-        __version__ = version("pymeasure")
-        # Alternatively, if the current approach is too slow, we could add
-        # 'write_to = "pymeasure/_version.py"' in pyproject.toml and use the generated file here:
-        # from ._version import version as __version__
-    except PackageNotFoundError:
-        warnings.warn('Could not find pymeasure version, it does not seem to be installed. '
-                      'Either install it (editable or full) or install setuptools_scm')
-        __version__ = '0.0.0'
-    finally:
-        del version, PackageNotFoundError
+        # If a user has setuptools_scm installed, assume they want the most up to date version
+        # string. Alternatively, we could use a dummy dev module that is never packaged whose
+        # presence signals that we are in an editable install/repo, see
+        # https://github.com/pycalphad/pycalphad/pull/341
+        import setuptools_scm
+        return setuptools_scm.get_version(root='..', relative_to=__file__)
+    except (ImportError, LookupError):
+        # Setuptools_scm was not found, or it could not find a version, so use installation
+        # metadata.
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version("pymeasure")
+            # Alternatively, if the current approach is too slow, we could add
+            # 'write_to = "pymeasure/_version.py"' in pyproject.toml and use the generated file:
+            # from ._version import version as __version__
+        except PackageNotFoundError:
+            warnings.warn('Could not find pymeasure version, it does not seem to be installed. '
+                          'Either install it (editable or full) or install setuptools_scm')
+            return '0.0.0'
+
+
+def __getattr__(name: str) -> Any:
+    # The version is determined on first access only, as setuptools_scm is slow to import and
+    # to query git, which would delay every import of pymeasure
+    if name == "__version__":
+        globals()["__version__"] = version = _get_version()
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,130 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Lazy imports of heavy modules and of the instrument classes of the vendor packages."""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from collections.abc import Callable, Collection, Mapping, Sequence
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule(ModuleType):
+    """Placeholder of a module, which imports the module on the first attribute access.
+
+    Unlike :class:`importlib.util.LazyLoader`, which is not thread-safe before Python 3.12,
+    the import is guarded by a lock, as the first access often happens in several threads
+    at once, e.g. in the Worker and the Recorder.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        with self._lazy_lock:
+            module = importlib.import_module(self.__name__)
+        value = getattr(module, name)
+        # Store the attribute, such that __getattr__ is not called again
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self) -> list[str]:
+        return dir(importlib.import_module(self.__name__))
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return the module `name`, which is imported only on its first attribute access.
+
+    Heavy dependencies like pandas or pint are imported like this, such that importing
+    pymeasure does not import them before they are used. An already imported module is
+    returned as it is.
+
+    .. code-block:: python
+
+        pd = lazy_module("pandas")
+
+    :param name: Absolute name of the module.
+    :raises ModuleNotFoundError: If the module is not installed.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return _LazyModule(name)
+
+
+def lazy_import(package: str, modules: Mapping[str, Sequence[str]],
+                optional: Collection[str] = ()
+                ) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Return the module level ``__getattr__``, ``__dir__`` and ``__all__`` of a package,
+    which imports the module of an attribute only on its first access.
+
+    Importing a vendor package is therefore fast, no matter how many drivers it contains.
+    Submodules are accessible as attributes as well, as they are after an eager import.
+
+    .. code-block:: python
+
+        __getattr__, __dir__, __all__ = lazy_import(__name__, {
+            ".agilent33500": ["Agilent33500"],
+        })
+
+    :param package: Name of the package, i.e. its ``__name__``.
+    :param modules: Dictionary of relative module names and the attributes they provide.
+    :param optional: Relative module names of `modules`, which fail to import without
+        an optional dependency. Their attributes are not listed in ``__all__`` and are
+        missing, i.e. raise an :class:`AttributeError`, if the import fails.
+    """
+    attributes = {name: module for module, names in modules.items() for name in names}
+    public = [name for name, module in attributes.items() if module not in optional]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = attributes[name]
+        except KeyError:
+            # Special attributes like __path__ are never submodules. Looking them up with
+            # find_spec would recurse, as it requires __path__ of the package itself.
+            if name.startswith("__") or importlib.util.find_spec(f"{package}.{name}") is None:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+            return importlib.import_module(f"{package}.{name}")
+        try:
+            value = getattr(importlib.import_module(module, package), name)
+        except (ImportError, OSError) as exc:
+            if module not in optional:
+                raise
+            raise AttributeError(f"module {package!r} has no attribute {name!r}, "
+                                 f"as importing {module!r} failed: {exc}") from exc
+        # Store the attribute, such that __getattr__ is not called again
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(public))
+
+    return __getattr__, __dir__, public
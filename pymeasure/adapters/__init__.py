@@ -24,7 +24,10 @@
 import logging
 
 from .adapter import Adapter, FakeAdapter
+from .async_adapter import AsyncAdapter, SocketAsyncAdapter, ThreadedAsyncAdapter
 from .protocol import ProtocolAdapter
+from .simulated import SimulatedAdapter
+from .tracing import AdapterTracer
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
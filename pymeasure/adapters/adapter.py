@@ -23,7 +23,9 @@
 #
 
 import logging
-from collections.abc import Sequence
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from copy import copy
 from typing import Protocol, runtime_checkable
 
@@ -57,6 +59,11 @@ class Adapter:
     """
 
     connection: ConnectionProtocol
+    #: :class:`~pymeasure.adapters.tracing.AdapterTracer` recording the communication,
+    #: or None to disable tracing.
+    tracer = None
+    #: Number of bytes written at once by :meth:`write_ieee_block`.
+    write_chunk_size = 20 * 1024
 
     def __init__(self, log: logging.Logger | None = None, **kwargs):
         super().__init__(**kwargs)
@@ -89,7 +96,12 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
         self.log.debug("WRITE:%s", command)
+        if self.tracer is None:
+            self._write(command, **kwargs)
+            return
+        start = time.perf_counter()
         self._write(command, **kwargs)
+        self.tracer.record(self, "write", command, start, time.perf_counter())
 
     def write_bytes(self, content: bytes, **kwargs) -> None:
         """Write the bytes `content` to the instrument.
@@ -100,7 +112,12 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
         self.log.debug("WRITE:%s", content)
+        if self.tracer is None:
+            self._write_bytes(content, **kwargs)
+            return
+        start = time.perf_counter()
         self._write_bytes(content, **kwargs)
+        self.tracer.record(self, "write", content, start, time.perf_counter())
 
     def read(self, **kwargs) -> str:
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -110,7 +127,12 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
-        read = self._read(**kwargs)
+        if self.tracer is None:
+            read = self._read(**kwargs)
+        else:
+            start = time.perf_counter()
+            read = self._read(**kwargs)
+            self.tracer.record(self, "read", read, start, time.perf_counter())
         self.log.debug("READ:%s", read)
         return read
 
@@ -125,7 +147,12 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns bytes: Bytes response of the instrument (including termination).
         """
-        read = self._read_bytes(count, break_on_termchar, **kwargs)
+        if self.tracer is None:
+            read = self._read_bytes(count, break_on_termchar, **kwargs)
+        else:
+            start = time.perf_counter()
+            read = self._read_bytes(count, break_on_termchar, **kwargs)
+            self.tracer.record(self, "read", read, start, time.perf_counter())
         self.log.debug("READ:%s", read)
         return read
 
@@ -177,6 +204,41 @@ class Adapter:
         else:
             return np.fromstring(data, dtype=dtype, sep=sep, **kwargs)
 
+    def read_ieee_block(
+        self,
+        dtype=np.float32,
+        count: int | None = None,
+        termination_bytes: int = 1,
+    ) -> np.ndarray:
+        """Read an IEEE 488.2 binary block and return its values as a numpy array.
+
+        A definite length block (``#<digits><length><data>``) contains its length in the
+        header, whereas for an indefinite length block (``#0<data>``) the number of values
+        `count` has to be known. The data is read with exactly the required number of bytes,
+        such that termination characters within the data do not end the transfer early.
+
+        :param dtype: The NumPy data type, including the byte order (e.g. ``"<f4"``).
+        :param int count: Number of values in an indefinite length block.
+        :param int termination_bytes: Number of bytes following the block, which are discarded.
+        :returns: NumPy array of values
+        :raises ValueError: if the header is malformed or the length unknown
+        """
+        dtype = np.dtype(dtype)
+        header = self.read_bytes(2)
+        if header[:1] != b"#" or not header[1:2].isdigit():
+            raise ValueError(f"Invalid header {header!r} of an IEEE 488.2 binary block.")
+        digits = int(header[1:2])
+        if digits > 0:
+            length = int(self.read_bytes(digits))
+        elif count is not None:
+            length = count * dtype.itemsize
+        else:
+            raise ValueError("The number of values of an indefinite length block is required.")
+        data = self.read_bytes(length) if length > 0 else b""
+        if termination_bytes > 0:
+            self.read_bytes(termination_bytes)
+        return np.frombuffer(data, dtype=dtype)
+
     def _format_binary_values(
         self,
         values: Sequence[int | float],
@@ -219,6 +281,78 @@ class Adapter:
         self.write_bytes(message)
         return len(message)
 
+    def write_ieee_block(
+        self,
+        command: str,
+        values,
+        dtype="<f4",
+        termination: str = "",
+        chunk_size: int | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> int:
+        """Write `command` followed by a definite length IEEE 488.2 binary block of `values`.
+
+        Unlike :meth:`write_binary_values`, the values are converted to `dtype` once and
+        their data is written in chunks of `chunk_size` bytes directly from the array,
+        such that large waveforms are neither copied several times nor block without
+        feedback.
+
+        If `should_stop` returns True before a chunk, the transfer is cancelled. The
+        instrument still waits for the rest of the block then and has to be cleared.
+
+        :param command: Command string preceding the block.
+        :param values: Array-like values, e.g. a numpy array.
+        :param dtype: The NumPy data type of the block, including the byte order
+            (e.g. ``">i2"``).
+        :param termination: String added afterwards to terminate the message.
+        :param chunk_size: Number of bytes written at once, default is
+            :attr:`write_chunk_size`.
+        :param progress: Function called with the numbers of written and of all data bytes
+            after each chunk.
+        :param should_stop: Function returning True to cancel the transfer.
+        :returns: number of data bytes written
+        """
+        data = np.ascontiguousarray(values, dtype=dtype).reshape(-1).view(np.uint8)
+        total = data.size
+        length = str(total)
+        chunk_size = chunk_size or self.write_chunk_size
+        header = command.encode() + f"#{len(length)}{length}".encode()
+        written = 0
+        with self._message_parts():
+            self.write_bytes(header)
+            while True:
+                if should_stop is not None and should_stop():
+                    self.log.warning("Cancelled an IEEE block transfer after %d of %d bytes.",
+                                     written, total)
+                    return written
+                if total - written <= chunk_size:
+                    break
+                self.write_bytes(self._encode_block_data(data[written:written + chunk_size]))
+                written += chunk_size
+                if progress is not None:
+                    progress(written, total)
+        # The last part ends the message
+        self.write_bytes(self._encode_block_data(data[written:]) + termination.encode())
+        if progress is not None:
+            progress(total, total)
+        return total
+
+    def _encode_block_data(self, data: np.ndarray) -> bytes:
+        """Return the bytes of a part of the data of :meth:`write_ieee_block`.
+
+        Override in a subclass, whose connection requires the data to be escaped.
+        """
+        return data.tobytes()
+
+    @contextmanager
+    def _message_parts(self) -> Iterator[None]:
+        """Context in which consecutive writes are parts of one message.
+
+        Override in a subclass, whose connection ends every write.
+        """
+        yield
+
 
 class FakeAdapter(Adapter):
     """Provides a fake adapter for debugging purposes,
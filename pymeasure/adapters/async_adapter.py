@@ -0,0 +1,299 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import asyncio
+import logging
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TypeVar
+
+import numpy as np
+
+from .adapter import Adapter
+
+T = TypeVar("T")
+
+
+class AsyncAdapter:
+    """Base class for asyncio adapters, which provide awaitable communication methods,
+    such that a single event loop may overlap the communication with many instruments.
+
+    This class should only be inherited from.
+
+    :param log: Parent logger of the 'AsyncAdapter' logger.
+    """
+
+    def __init__(self, log: logging.Logger | None = None, **kwargs):
+        super().__init__(**kwargs)
+        if log is None:
+            self.log = logging.getLogger("AsyncAdapter")
+        else:
+            self.log = log.getChild("AsyncAdapter")
+        self.log.addHandler(logging.NullHandler())
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = \
+            weakref.WeakKeyDictionary()
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Lock of the running event loop to keep a query (writing and reading its response)
+        together.
+
+        An asyncio lock is bound to the event loop using it, therefore each loop gets its own.
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    def close(self) -> None:
+        """Close the connection."""
+
+    # Directly called methods, which ensure proper logging of the communication.
+    async def write(self, command: str, **kwargs) -> None:
+        """Write a string command to the instrument appending `write_termination`.
+
+        :param str command: Command string to be sent to the instrument
+            (without termination).
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        self.log.debug("WRITE:%s", command)
+        await self._write(command, **kwargs)
+
+    async def write_bytes(self, content: bytes, **kwargs) -> None:
+        """Write the bytes `content` to the instrument.
+
+        :param bytes content: The bytes to write to the instrument.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        self.log.debug("WRITE:%s", content)
+        await self._write_bytes(content, **kwargs)
+
+    async def read(self, **kwargs) -> str:
+        """Read up to (excluding) `read_termination` or the whole read buffer.
+
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns str: ASCII response of the instrument (excluding read_termination).
+        """
+        read = await self._read(**kwargs)
+        self.log.debug("READ:%s", read)
+        return read
+
+    async def read_bytes(self, count: int = -1, break_on_termchar: bool = False,
+                         **kwargs) -> bytes:
+        """Read a certain number of bytes from the instrument.
+
+        :param int count: Number of bytes to read. A value of -1 indicates to
+            read from the whole read buffer.
+        :param bool break_on_termchar: Stop reading at a termination character.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns bytes: Bytes response of the instrument (including termination).
+        """
+        read = await self._read_bytes(count, break_on_termchar, **kwargs)
+        self.log.debug("READ:%s", read)
+        return read
+
+    async def read_binary_values(
+        self,
+        header_bytes: int = 0,
+        termination_bytes: int | None = None,
+        dtype=np.float32,
+        **kwargs,
+    ) -> np.ndarray:
+        """Read the whole read buffer and return a numpy array of its binary values.
+
+        :param int header_bytes: Number of bytes to ignore in header.
+        :param int termination_bytes: Number of bytes to strip at end of message or None.
+        :param dtype: The NumPy data type to format the values with.
+        :param \\**kwargs: Further arguments for the NumPy frombuffer method.
+        :returns: NumPy array of values
+        """
+        binary = await self.read_bytes(-1)
+        return np.frombuffer(binary[header_bytes:termination_bytes], dtype=dtype, **kwargs)
+
+    async def run(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking `function` in a thread without blocking the event loop.
+
+        :param function: Function to call.
+        :param \\*args, \\**kwargs: Arguments of the function.
+        :returns: Return value of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(function, *args, **kwargs))
+
+    # Methods to implement in the subclasses.
+    async def _write(self, command: str, **kwargs) -> None:
+        """Write string to the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented writing.")
+
+    async def _write_bytes(self, content: bytes, **kwargs) -> None:
+        """Write bytes to the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented writing bytes.")
+
+    async def _read(self, **kwargs) -> str:
+        """Read string from the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented reading.")
+
+    async def _read_bytes(self, count: int, break_on_termchar: bool, **kwargs) -> bytes:
+        """Read bytes from the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented reading bytes.")
+
+
+class ThreadedAsyncAdapter(AsyncAdapter):
+    """Asyncio adapter for a blocking :class:`~pymeasure.adapters.Adapter`, for example a
+    :class:`~pymeasure.adapters.VISAAdapter` or :class:`~pymeasure.adapters.SerialAdapter`.
+
+    The communication of the adapter runs in a dedicated thread, such that the calls to
+    the adapter remain in order, while the event loop is free to serve other instruments.
+    Closing this adapter does not close the wrapped adapter.
+
+    :param adapter: The blocking adapter.
+    :param log: Parent logger of the 'AsyncAdapter' logger.
+    """
+
+    def __init__(self, adapter: Adapter, log: logging.Logger | None = None, **kwargs):
+        super().__init__(log=log, **kwargs)
+        self.adapter = adapter
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AsyncAdapter")
+        # Stop the thread as well, if this adapter is discarded without closing it
+        weakref.finalize(self, self._executor.shutdown, wait=False)
+
+    def close(self) -> None:
+        """Stop the communication thread."""
+        self._executor.shutdown(wait=False)
+
+    async def run(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking `function` in the communication thread of the adapter.
+
+        :param function: Function to call.
+        :param \\*args, \\**kwargs: Arguments of the function.
+        :returns: Return value of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    # The wrapped adapter logs the communication itself.
+    async def write(self, command: str, **kwargs) -> None:
+        await self.run(self.adapter.write, command, **kwargs)
+
+    async def write_bytes(self, content: bytes, **kwargs) -> None:
+        await self.run(self.adapter.write_bytes, content, **kwargs)
+
+    async def read(self, **kwargs) -> str:
+        return await self.run(self.adapter.read, **kwargs)
+
+    async def read_bytes(self, count: int = -1, break_on_termchar: bool = False,
+                         **kwargs) -> bytes:
+        return await self.run(self.adapter.read_bytes, count, break_on_termchar, **kwargs)
+
+    async def read_binary_values(self, **kwargs) -> np.ndarray:
+        return await self.run(self.adapter.read_binary_values, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<ThreadedAsyncAdapter({self.adapter!r})>"
+
+
+class SocketAsyncAdapter(AsyncAdapter):
+    """Asyncio adapter for a raw TCP socket connection using asyncio streams.
+
+    The connection is opened with the first communication in the running event loop.
+
+    :param host: Host name or IP address of the instrument.
+    :param port: TCP port of the instrument.
+    :param write_termination: String appended to messages before writing them.
+    :param read_termination: String expected at end of read message and removed.
+    :param timeout: Timeout in seconds for connecting and reading, None waits forever.
+    :param log: Parent logger of the 'AsyncAdapter' logger.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        write_termination: str = "\n",
+        read_termination: str = "\n",
+        timeout: float | None = 2,
+        log: logging.Logger | None = None,
+        **kwargs,
+    ):
+        super().__init__(log=log, **kwargs)
+        self.host = host
+        self.port = port
+        self.write_termination = write_termination
+        self.read_termination = read_termination
+        self.timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _connection(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._reader is None or self._writer is None:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        return self._reader, self._writer
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _write(self, command: str, **kwargs) -> None:
+        await self._write_bytes((command + self.write_termination).encode(), **kwargs)
+
+    async def _write_bytes(self, content: bytes, **kwargs) -> None:
+        _, writer = await self._connection()
+        writer.write(content)
+        await writer.drain()
+
+    async def _read(self, **kwargs) -> str:
+        read = (await self._read_bytes(-1, break_on_termchar=True, **kwargs)).decode()
+        return read.removesuffix(self.read_termination) if self.read_termination else read
+
+    async def _read_bytes(self, count: int, break_on_termchar: bool, **kwargs) -> bytes:
+        reader, _ = await self._connection()
+        if break_on_termchar and self.read_termination:
+            read = reader.readuntil(self.read_termination.encode())
+        elif count >= 0:
+            read = reader.readexactly(count)
+        else:
+            return await self._read_bytes_until_timeout(reader)
+        return await asyncio.wait_for(read, self.timeout)
+
+    async def _read_bytes_until_timeout(self, reader: asyncio.StreamReader,
+                                        chunk_size: int = 4096) -> bytes:
+        """Read until no data arrives within the timeout."""
+        data = b""
+        while True:
+            try:
+                data += await asyncio.wait_for(reader.read(chunk_size), self.timeout)
+            except asyncio.TimeoutError:
+                return data
+            if reader.at_eof():
+                return data
+
+    def __repr__(self) -> str:
+        return f"<SocketAsyncAdapter(host='{self.host}', port={self.port})>"
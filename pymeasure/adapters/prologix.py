@@ -268,6 +268,25 @@ class PrologixAdapter(VISAAdapter):
             self.write(address_command)
         return super().write_binary_values(command, values, "\n", **kwargs)
 
+    def write_ieee_block(self, command: str, values, dtype="<f4", termination: str = "",
+                         **kwargs) -> int:
+        """Write `command` followed by a definite length IEEE 488.2 binary block of `values`.
+
+        The data is escaped and the message terminated for the Prologix adapter, see
+        :meth:`~pymeasure.adapters.Adapter.write_ieee_block` for the parameters.
+        A `termination` is ignored, as the message is always terminated by a line feed.
+        """
+        if self.address is not None:
+            address_command = f"++addr {self.address}\n"
+            self.write(address_command)
+        return super().write_ieee_block(command, values, dtype, "\n", **kwargs)
+
+    def _encode_block_data(self, data) -> bytes:
+        """Return the bytes of a part of the data of :meth:`write_ieee_block`, escaping
+        the characters CR, LF, ESC and '+' with an ESC character."""
+        return (data.tobytes().replace(b"\x1b", b"\x1b\x1b").replace(b"\x0d", b"\x1b\x0d")
+                .replace(b"\x0a", b"\x1b\x0a").replace(b"\x2b", b"\x1b\x2b"))
+
     def _read(self, prologix: bool = False, **kwargs) -> str:
         """Read up to (excluding) `read_termination` or the whole read buffer.
 
@@ -0,0 +1,178 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import time
+from collections.abc import Callable, Mapping
+
+import numpy as np
+
+from .adapter import Adapter
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+RESPONSE = str | bytes | Callable[[str], str | bytes]
+
+
+def values_response(count: int, separator: str = ",", seed: int | None = None
+                    ) -> Callable[[str], str]:
+    """Return a response generator for `count` random float values.
+
+    :param int count: Number of values of each response.
+    :param str separator: Separator between the values.
+    :param int seed: Seed of the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+
+    def response(command: str) -> str:
+        return separator.join(map(repr, rng.random(count).tolist()))
+    return response
+
+
+def ieee_block_response(count: int, dtype="<f4", termination: bytes = b"\n",
+                        seed: int | None = None) -> Callable[[str], bytes]:
+    """Return a response generator for a definite length IEEE 488.2 binary block of
+    `count` random values.
+
+    :param int count: Number of values of each block.
+    :param dtype: The NumPy data type of the values, including the byte order.
+    :param bytes termination: Bytes following the block.
+    :param int seed: Seed of the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+    dtype = np.dtype(dtype)
+    length = str(count * dtype.itemsize)
+    header = f"#{len(length)}{length}".encode()
+
+    def response(command: str) -> bytes:
+        return header + rng.random(count).astype(dtype).tobytes() + termination
+    return response
+
+
+class SimulatedAdapter(Adapter):
+    """Adapter simulating an SCPI-like instrument with the latency of a real connection.
+
+    Unlike the :class:`ProtocolAdapter`, which checks a sequence of messages, this adapter
+    answers any sequence of commands, which makes it suitable to benchmark drivers and
+    measurement code without hardware.
+
+    A written command like ``"VOLT 5"`` stores the value ``"5"`` for the header ``"VOLT"``,
+    such that a later query ``"VOLT?"`` returns it, unless `responses` defines a response
+    for that query. Responses are strings, bytes, or callables returning either for the
+    written command, for example :func:`values_response` and :func:`ieee_block_response`.
+
+    Each write and read takes `transaction_latency` plus `byte_latency` per transferred
+    byte plus a random time up to `jitter`.
+
+    .. code-block:: python
+
+        adapter = SimulatedAdapter(
+            {"*IDN?": "Simulated,Instrument", "CURV?": ieee_block_response(100_000)},
+            transaction_latency=1e-3, byte_latency=1e-7)
+
+    :param responses: Dictionary of queries (without termination) and their responses.
+    :param float transaction_latency: Latency of each write and read in seconds.
+    :param float byte_latency: Transfer time of each byte in seconds.
+    :param float jitter: Maximum random additional latency in seconds.
+    :param int seed: Seed of the random number generator of the jitter.
+    :param \\**kwargs: Keyword arguments for the :class:`Adapter`.
+    """
+
+    def __init__(
+        self,
+        responses: Mapping[str, RESPONSE] | None = None,
+        transaction_latency: float = 0,
+        byte_latency: float = 0,
+        jitter: float = 0,
+        seed: int | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.responses = dict(responses or {})
+        self.transaction_latency = transaction_latency
+        self.byte_latency = byte_latency
+        self.jitter = jitter
+        self._rng = np.random.default_rng(seed)
+        #: Values stored by the written commands, per header.
+        self.state: dict[str, str] = {}
+        self._read_buffer = b""
+
+    def _delay(self, size: int) -> None:
+        """Wait for the time a transaction of `size` bytes takes."""
+        delay = self.transaction_latency + size * self.byte_latency
+        if self.jitter:
+            delay += self._rng.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _respond(self, command: str) -> bytes | None:
+        """Return the response to `command` or store its value, if it is not a query."""
+        response = self.responses.get(command)
+        if response is not None:
+            if callable(response):
+                response = response(command)
+            return response.encode() if isinstance(response, str) else response
+        header, _, value = command.partition(" ")
+        if header.endswith("?"):
+            try:
+                return self.state[header[:-1]].encode()
+            except KeyError:
+                raise ValueError(f"No response defined for query '{command}'.") from None
+        if value:
+            self.state[header] = value
+        return None
+
+    def _write(self, command: str, **kwargs) -> None:
+        """Write the command and prepare its response."""
+        self._write_bytes(command.encode(), **kwargs)
+
+    def _write_bytes(self, content: bytes, **kwargs) -> None:
+        """Write the bytes and prepare the response of the contained commands."""
+        self._delay(len(content))
+        for command in content.decode(errors="replace").split(";"):
+            response = self._respond(command.strip())
+            if response is not None:
+                self._read_buffer += response
+
+    def _read(self, **kwargs) -> str:
+        """Read the whole response."""
+        return self._read_bytes(-1, False).decode()
+
+    def _read_bytes(self, count: int, break_on_termchar: bool, **kwargs) -> bytes:
+        """Read `count` bytes of the response, or the whole response for a count of -1."""
+        if not self._read_buffer:
+            raise TimeoutError("No response to read.")
+        if count < 0:
+            count = len(self._read_buffer)
+        read, self._read_buffer = self._read_buffer[:count], self._read_buffer[count:]
+        self._delay(len(read))
+        return read
+
+    def flush_read_buffer(self) -> None:
+        """Discard the unread response."""
+        self._read_buffer = b""
+
+    def __repr__(self) -> str:
+        return "<SimulatedAdapter>"
@@ -0,0 +1,245 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import json
+import threading
+import weakref
+from collections import deque
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+
+@dataclass
+class Transaction:
+    """A single write or read of an adapter, recorded by an :class:`AdapterTracer`."""
+
+    #: Name of the instrument (or adapter) which communicated.
+    instrument: str
+    #: Either "write" or "read".
+    kind: str
+    #: Command written, or the last command written before the read.
+    command: str
+    #: Start of the transaction in seconds (:func:`time.perf_counter`).
+    start: float
+    #: Duration of the transaction in seconds.
+    duration: float
+    #: Number of bytes (or characters) transferred.
+    size: int
+    #: Time from the start of the preceding write to the end of this read in seconds,
+    #: or None for writes and for reads without a preceding write.
+    latency: float | None = None
+
+
+class AdapterTracer:
+    """Record the transactions of adapters to find out where the time on the bus goes.
+
+    Attach the tracer to instruments or adapters, run the measurement and examine the
+    :meth:`statistics` per instrument or per command, for example the median and 99th
+    percentile of the time between writing a query and having read its response.
+
+    .. code-block:: python
+
+        tracer = AdapterTracer()
+        tracer.attach(smu)
+        tracer.attach(dmm)
+        run_measurement()
+        for (instrument, command), stats in tracer.statistics().items():
+            print(instrument, command, stats["p50"], stats["p99"])
+        tracer.save_chrome_trace("trace.json")  # open in chrome://tracing or Perfetto
+
+    Adapters without tracer only check that their :attr:`~pymeasure.adapters.Adapter.tracer`
+    is None, such that disabled tracing costs next to nothing.
+
+    :param int max_transactions: Number of most recent transactions to keep.
+    """
+
+    def __init__(self, max_transactions: int = 100_000):
+        self.transactions: deque[Transaction] = deque(maxlen=max_transactions)
+        self._lock = threading.Lock()
+        # Last command and the start of its write, if not yet read, per adapter.
+        self._pending: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._names: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def attach(self, target, name: str | None = None) -> None:
+        """Trace the communication of an instrument or adapter.
+
+        :param target: An :class:`~pymeasure.instruments.Instrument` or an
+            :class:`~pymeasure.adapters.Adapter`.
+        :param str name: Name of the target in the statistics. Defaults to the name of the
+            instrument or the representation of the adapter.
+        """
+        adapter = getattr(target, "adapter", target)
+        if name is None:
+            name = getattr(target, "name", None) or repr(adapter)
+        with self._lock:
+            self._names[adapter] = name
+        adapter.tracer = self
+
+    def detach(self, target) -> None:
+        """Stop tracing the communication of an instrument or adapter."""
+        adapter = getattr(target, "adapter", target)
+        if adapter.tracer is self:
+            adapter.tracer = None
+        with self._lock:
+            self._names.pop(adapter, None)
+            self._pending.pop(adapter, None)
+
+    def clear(self) -> None:
+        """Discard all recorded transactions."""
+        with self._lock:
+            self.transactions.clear()
+            self._pending.clear()
+
+    def record(self, adapter, kind: str, content, start: float, stop: float) -> None:
+        """Record a transaction, called by the adapter.
+
+        :param adapter: The adapter which communicated.
+        :param str kind: Either "write" or "read".
+        :param content: The written command or the read response (str or bytes).
+        :param float start: Start time in seconds (:func:`time.perf_counter`).
+        :param float stop: End time in seconds (:func:`time.perf_counter`).
+        """
+        with self._lock:
+            instrument = self._names.get(adapter) or repr(adapter)
+            if kind == "write":
+                command = self._command(content)
+                self._pending[adapter] = (command, start)
+                latency = None
+            else:
+                # Further reads (e.g. of a binary block) belong to the same command.
+                command, write_start = self._pending.get(adapter, ("", None))
+                self._pending[adapter] = (command, None)
+                latency = None if write_start is None else stop - write_start
+            self.transactions.append(Transaction(
+                instrument=instrument,
+                kind=kind,
+                command=command,
+                start=start,
+                duration=stop - start,
+                size=len(content),
+                latency=latency,
+            ))
+
+    @staticmethod
+    def _command(content) -> str:
+        """Return a short command from the written content, omitting binary data."""
+        if isinstance(content, bytes | bytearray):
+            content = bytes(content[:64]).decode(errors="replace")
+        # Omit arguments to group e.g. "VOLT 1" and "VOLT 2" into one command.
+        return content.split(maxsplit=1)[0] if content.strip() else content
+
+    def statistics(self, by: str = "command") -> dict:
+        """Return the statistics of the recorded transactions.
+
+        :param str by: Group the transactions by "command" (the keys are tuples of
+            instrument and command) or by "instrument".
+        :returns: Dictionary of the statistics of each group with the number of
+            transactions ("count"), the total duration ("total") in seconds, the
+            median ("p50"), 99th percentile ("p99") and maximum ("max") of the latency of
+            queries (or of the duration, if a group contains no queries) in seconds, the
+            transferred "bytes" and the "throughput" in bytes per second of bus time.
+        """
+        if by not in ("command", "instrument"):
+            raise ValueError(f"Invalid grouping {by!r}, use 'command' or 'instrument'.")
+        with self._lock:
+            transactions = list(self.transactions)
+        groups: dict = {}
+        for t in transactions:
+            key = (t.instrument, t.command) if by == "command" else t.instrument
+            groups.setdefault(key, []).append(t)
+        stats = {}
+        for key, group in groups.items():
+            latencies = [t.latency for t in group if t.latency is not None]
+            times = np.array(latencies or [t.duration for t in group])
+            total = sum(t.duration for t in group)
+            size = sum(t.size for t in group)
+            stats[key] = {
+                "count": len(group),
+                "total": total,
+                "p50": float(np.percentile(times, 50)),
+                "p99": float(np.percentile(times, 99)),
+                "max": float(times.max()),
+                "bytes": size,
+                "throughput": size / total if total > 0 else 0.,
+            }
+        return stats
+
+    def histogram(self, instrument: str | None = None, command: str | None = None,
+                  bins=20) -> tuple[np.ndarray, np.ndarray]:
+        """Return a histogram of the query latencies in seconds.
+
+        :param str instrument: Only include queries of this instrument.
+        :param str command: Only include queries of this command.
+        :param bins: Bins of :func:`numpy.histogram`.
+        :returns: Tuple of the counts and the bin edges.
+        """
+        with self._lock:
+            latencies = [t.latency for t in self.transactions if t.latency is not None
+                         and (instrument is None or t.instrument == instrument)
+                         and (command is None or t.command == command)]
+        return np.histogram(latencies, bins=bins)
+
+    def to_json(self) -> str:
+        """Return the recorded transactions as JSON list."""
+        with self._lock:
+            return json.dumps([asdict(t) for t in self.transactions])
+
+    def to_chrome_trace(self) -> str:
+        """Return the recorded transactions in the Chrome trace event format.
+
+        The file can be viewed with ``chrome://tracing`` or https://ui.perfetto.dev, which
+        show each instrument as a separate track.
+        """
+        with self._lock:
+            transactions = list(self.transactions)
+        instruments = {name: i for i, name in enumerate(dict.fromkeys(
+            t.instrument for t in transactions))}
+        events = [{"name": "thread_name", "ph": "M", "pid": 0, "tid": tid,
+                   "args": {"name": name}} for name, tid in instruments.items()]
+        for t in transactions:
+            args = {"bytes": t.size}
+            if t.latency is not None:
+                args["latency_us"] = t.latency * 1e6
+            events.append({
+                "name": f"{t.kind} {t.command}",
+                "cat": t.kind,
+                "ph": "X",
+                "ts": t.start * 1e6,
+                "dur": t.duration * 1e6,
+                "pid": 0,
+                "tid": instruments[t.instrument],
+                "args": args,
+            })
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+    def save_json(self, filename: str) -> None:
+        """Save the recorded transactions as JSON file."""
+        with open(filename, "w") as file:
+            file.write(self.to_json())
+
+    def save_chrome_trace(self, filename: str) -> None:
+        """Save the recorded transactions as file in the Chrome trace event format."""
+        with open(filename, "w") as file:
+            file.write(self.to_chrome_trace())
@@ -23,9 +23,13 @@
 #
 
 import logging
-from typing import Union, cast
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Union, cast
 
 import pyvisa
+from pyvisa.highlevel import ResourceInfo
 
 from .adapter import Adapter
 from .protocol import ProtocolAdapter
@@ -33,6 +37,56 @@ from .protocol import ProtocolAdapter
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Resource managers shared by all adapters, as creating them and looking up the
+# VISA library is expensive. Keyed by the visa_library argument.
+# Reentrant, as the garbage collector may release a manager in Adapter.__del__ while the
+# same thread holds the lock.
+_managers_lock = threading.RLock()
+_managers: dict[Any, list] = {}  # visa_library: [manager, number of adapters using it]
+_resource_infos: dict[tuple[Any, str], ResourceInfo] = {}
+_resource_classes: dict[tuple[Any, str], type[pyvisa.resources.Resource]] = {}
+
+
+def _acquire_manager(visa_library: Any) -> pyvisa.ResourceManager:
+    """Return the shared resource manager of `visa_library` and count its usage."""
+    with _managers_lock:
+        entry = _managers.get(visa_library)
+        # A manager closed elsewhere is not registered with its library anymore.
+        if entry is None or entry[0].visalib.resource_manager is not entry[0]:
+            entry = _managers[visa_library] = [pyvisa.ResourceManager(visa_library), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_manager(visa_library: Any, manager: pyvisa.ResourceManager) -> None:
+    """Release the shared resource manager, closing it if required and no longer in use."""
+    with _managers_lock:
+        entry = _managers.get(visa_library)
+        if entry is None or entry[0] is not manager:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _managers[visa_library]
+        for cache in (_resource_infos, _resource_classes):
+            for key in [key for key in cache if key[0] == visa_library]:
+                del cache[key]
+    if manager.visalib.library_path == "unset":
+        # if using the pyvisa-sim library the manager has to be also closed.
+        # this works around https://github.com/pyvisa/pyvisa-sim/issues/82
+        manager.close()
+
+
+def _resource_info(
+    visa_library: Any, manager: pyvisa.ResourceManager, resource_name: str
+) -> ResourceInfo:
+    """Return the (cached) resource information of `resource_name`."""
+    key = (visa_library, resource_name)
+    info = _resource_infos.get(key)
+    if info is None:
+        info = _resource_infos[key] = manager.resource_info(resource_name)
+    return info
+
 
 # noinspection PyPep8Naming,PyUnresolvedReferences
 class VISAAdapter(Adapter):
@@ -72,6 +126,7 @@ class VISAAdapter(Adapter):
     """
 
     connection: ProtocolAdapter | pyvisa.resources.MessageBasedResource
+    _manager_released = False
 
     def __init__(
         self,
@@ -90,16 +145,18 @@ class VISAAdapter(Adapter):
             # Allow to reuse the connection.
             self.resource_name = getattr(resource_name, "resource_name", None)
             self.connection = resource_name.connection
-            self.manager = resource_name.manager
+            self._visa_library = resource_name._visa_library
+            self.manager = _acquire_manager(self._visa_library)
             return
         elif isinstance(resource_name, int):
             resource_name = f"GPIB0::{resource_name}::INSTR"
 
         self.resource_name = resource_name
-        self.manager = pyvisa.ResourceManager(visa_library)
+        self._visa_library = visa_library
+        self.manager = _acquire_manager(visa_library)
 
         # Clean up kwargs considering the interface type matching resource_name
-        if_type = self.manager.resource_info(self.resource_name).interface_type
+        if_type = _resource_info(visa_library, self.manager, resource_name).interface_type
         for key in list(kwargs.keys()):  # iterate over a copy of the keys as we modify kwargs
             # Remove all interface-specific kwargs:
             if key in pyvisa.constants.InterfaceType.__members__:
@@ -111,28 +168,30 @@ class VISAAdapter(Adapter):
                         kwargs.setdefault(k, v)
                 del kwargs[key]
 
+        # The cached resource class avoids looking up the resource information again.
+        key = (visa_library, resource_name)
         self.connection = cast(pyvisa.resources.MessageBasedResource, self.manager.open_resource(
             resource_name,
+            resource_pyclass=_resource_classes.get(key),
             **kwargs
         ))
+        _resource_classes[key] = type(self.connection)
 
     def close(self) -> None:
         """Close the connection.
 
+        The resource manager is shared by all adapters using the same VISA library
+        and released, once the last of them is closed.
+
         .. note::
 
             This closes the connection to the resource for all adapters using
             it currently (e.g. different adapters using the same GPIB line).
         """
         super().close()
-        try:
-            if self.manager.visalib.library_path == "unset":
-                # if using the pyvisa-sim library the manager has to be also closed.
-                # this works around https://github.com/pyvisa/pyvisa-sim/issues/82
-                self.manager.close()
-        except AttributeError:
-            # AttributeError can occur during __del__ calling close
-            pass
+        if getattr(self, "manager", None) is not None and not self._manager_released:
+            self._manager_released = True
+            _release_manager(self._visa_library, self.manager)
 
     def _write(self, command: str, **kwargs) -> None:
         """Write a string command to the instrument appending `write_termination`.
@@ -151,6 +210,27 @@ class VISAAdapter(Adapter):
         """
         self.connection.write_raw(content, **kwargs)
 
+    @property
+    def write_chunk_size(self) -> int:
+        """Number of bytes written at once by :meth:`write_ieee_block`, the chunk size
+        of the connection."""
+        return getattr(self.connection, "chunk_size", None) or Adapter.write_chunk_size
+
+    @contextmanager
+    def _message_parts(self) -> Iterator[None]:
+        """Do not assert END after the writes, which are parts of one message."""
+        try:
+            send_end = self.connection.send_end
+            self.connection.send_end = False
+        except (AttributeError, pyvisa.errors.VisaIOError):
+            # The resource has no END indicator
+            yield
+            return
+        try:
+            yield
+        finally:
+            self.connection.send_end = send_end
+
     def _read(self, **kwargs) -> str:
         """Read up to (excluding) `read_termination` or the whole read buffer.
 
@@ -21,17 +21,28 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import importlib.util
 import logging
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_import
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-try:
+if TYPE_CHECKING:
     from .manager import Manager
     from .plotter import Plotter
-except ImportError:
+
+if importlib.util.find_spec("qtpy") is None:
     log.warning("Python bindings for Qt (PySide, PyQt) can not be imported")
 
+# The plotter imports pyqtgraph, which is not required by the ManagedConsole
+__getattr__, __dir__, _ = lazy_import(__name__, {
+    ".manager": ["Manager"],
+    ".plotter": ["Plotter"],
+})
+
 
 def run_in_ipython(app):
     """ Attempts to run the QApplication in the IPython main loop, which
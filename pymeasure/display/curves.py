@@ -41,6 +41,12 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+def results_data(results: Results):
+    """Return the preview of the `results`, if they were loaded as one (see
+    :meth:`Results.load`), otherwise their data."""
+    return results.preview if results.preview is not None else results.data
+
+
 class ResultsCurve(pg.PlotDataItem):
     """ Creates a curve loaded dynamically from a file through the Results object. The data can
     be forced to fully reload on each update, useful for cases when the data is changing across
@@ -94,7 +100,7 @@ class ResultsCurve(pg.PlotDataItem):
         """Updates the data by polling the results"""
         if self.force_reload:
             self.results.reload()
-        data = self.results.data  # get the current snapshot
+        data = results_data(self.results)  # get the current snapshot
         if data is not None:
             # Set x-y data
             self.setData(data[self.x_label], data[self.y_label])
@@ -155,7 +161,7 @@ class ResultsImage(pg.ImageItem):
         if self.force_reload:
             self.results.reload()
 
-        data = self.results.data
+        data = results_data(self.results)
         if data is None:
             return
         zmin = data[self.z].min()
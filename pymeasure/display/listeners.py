@@ -26,7 +26,9 @@ import logging
 from multiprocessing import Queue
 from typing import Any
 
+from .._lazy import lazy_module
 from ..experiment.procedure import ProcedureStatus
+from ..experiment.transport import deserialize
 from .Qt import QtCore
 from .thread import StoppableQThread
 
@@ -34,12 +36,11 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 try:
-    import cloudpickle
-    import zmq
+    # Imported on first use, as it is slow to import
+    zmq = lazy_module("zmq")
 except ImportError:
     zmq = None
-    cloudpickle = None
-    log.warning("ZMQ and cloudpickle are required for TCP communication")
+    log.warning("ZMQ is required for TCP communication")
 
 
 class QListener(StoppableQThread):
@@ -48,13 +49,16 @@ class QListener(StoppableQThread):
     method call
     """
 
-    def __init__(self, port: int, topic: str = '', timeout: float = 0.01):
+    def __init__(self, port: int, topic: str = '', timeout: float = 0.01,
+                 hwm: int | None = None):
         """ Constructs the Listener object with a subscriber port
         over which to listen for messages
 
         :param port: TCP port to listen on
         :param topic: Topic to listen on
         :param timeout: Timeout in seconds to recheck stop flag
+        :param hwm: High-water mark, i.e. the number of received messages queued
+            before further messages are dropped, or None for the ZMQ default
         """
         if zmq is None:
             raise ModuleNotFoundError("QListener needs ZMQ installed for TCP communication.")
@@ -65,6 +69,8 @@ class QListener(StoppableQThread):
         self.context = zmq.Context()
         log.debug(f"{self.__class__.__name__} has ZMQ Context: {self.context!r}")
         self.subscriber = self.context.socket(zmq.SUB)
+        if hwm is not None:
+            self.subscriber.setsockopt(zmq.RCVHWM, hwm)
         self.subscriber.connect(f'tcp://localhost:{port}')
         self.subscriber.setsockopt(zmq.SUBSCRIBE, topic.encode())
         log.info(
@@ -75,11 +81,8 @@ class QListener(StoppableQThread):
         self.timeout = round(timeout * 1000)
 
     def receive(self, flags: int = 0) -> tuple[str, Any]:
-        topic, record = self.subscriber.recv_serialized(
-            deserialize=lambda msg: (msg[0].decode(), cloudpickle.loads(msg[1])),
-            flags=flags
-        )
-        return topic, record
+        frames = self.subscriber.recv_multipart(flags=flags, copy=False)
+        return deserialize(frames)
 
     def message_waiting(self) -> list[tuple[Any, int]]:
         return self.poller.poll(self.timeout)
@@ -142,6 +142,12 @@ class BaseManager(QtCore.QObject):
     """Controls the execution of :class:`.Experiment` classes by implementing
     a queue system in which Experiments are added, removed, executed, or
     aborted.
+
+    If `catalog` is True, the runs are recorded in the
+    :class:`~pymeasure.experiment.catalog.ResultsCatalog` of their data directory.
+
+    If `persistent_worker` is True, a single persistent :class:`.Worker` runs all
+    experiments, until :meth:`close` is called.
     """
     _is_continuous = True
     _start_on_add = True
@@ -154,7 +160,12 @@ class BaseManager(QtCore.QObject):
     log = QtCore.Signal(object)
 
     def __init__(
-        self, port: int = 5888, log_level: int = logging.INFO, parent: QtCore.QObject | None = None
+        self,
+        port: int = 5888,
+        log_level: int = logging.INFO,
+        parent: QtCore.QObject | None = None,
+        catalog: bool = False,
+        persistent_worker: bool = False,
     ):
         super().__init__(parent)
 
@@ -163,6 +174,8 @@ class BaseManager(QtCore.QObject):
         self._running_experiment = None
         self._monitor = None
         self.log_level = log_level
+        self.catalog = catalog
+        self.persistent_worker = persistent_worker
 
         self.port = port
 
@@ -226,7 +239,13 @@ class BaseManager(QtCore.QObject):
                 experiment = self.experiments.next()
                 self._running_experiment = experiment
 
-                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level)
+                if self._worker is not None:
+                    # The persistent worker of the previous experiments runs this one as well
+                    self._worker.submit(experiment.results)
+                    return
+
+                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level,
+                                      catalog=self.catalog, persistent=self.persistent_worker)
                 self._worker.is_last = lambda: not self.experiments.has_next()
 
                 self._monitor = Monitor(self._worker.monitor_queue)
@@ -246,6 +265,13 @@ class BaseManager(QtCore.QObject):
             self.running.emit(self._running_experiment)
 
     def _clean_up(self) -> None:
+        if self.persistent_worker and self._worker is not None and self._worker.is_alive():
+            # Keep the worker for the next experiment
+            self._running_experiment = None
+            return
+        self._close_worker()
+
+    def _close_worker(self) -> None:
         if self._worker is not None:
             self._worker.join()
             del self._worker
@@ -253,6 +279,7 @@ class BaseManager(QtCore.QObject):
         if self._monitor is not None:
             self._monitor.wait()
             del self._monitor
+            self._monitor = None
         self._running_experiment = None
         log.debug("Manager has cleaned up after the Worker")
 
@@ -300,6 +327,13 @@ class BaseManager(QtCore.QObject):
 
             self.aborted.emit(self._running_experiment)
 
+    def close(self) -> None:
+        """ Close a persistent worker, aborting its running experiment.
+        """
+        if self._worker is not None and self._worker.persistent:
+            self._worker.close()
+        self._close_worker()
+
 
 class Manager(BaseManager):
     """Controls the execution of :class:`.Experiment` classes by implementing
@@ -316,8 +350,11 @@ class Manager(BaseManager):
         port: int = 5888,
         log_level: int = logging.INFO,
         parent: QtCore.QObject | None = None,
+        catalog: bool = False,
+        persistent_worker: bool = False,
     ):
-        super().__init__(parent=parent, port=port, log_level=log_level)
+        super().__init__(parent=parent, port=port, log_level=log_level, catalog=catalog,
+                         persistent_worker=persistent_worker)
 
         self.widget_list = widget_list or []
         self.browser = browser
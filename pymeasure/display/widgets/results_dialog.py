@@ -43,6 +43,9 @@ class ResultsDialog(QtWidgets.QFileDialog):
     :class:`ManagedWindowBase<pymeasure.display.windows.managed_window.ManagedWindowBase>` class
     """
 
+    #: Maximum number of data points shown in the preview, sampled evenly over the file.
+    PREVIEW_POINTS = 1000
+
     def __init__(
         self,
         procedure_class: type[Procedure],
@@ -103,7 +106,7 @@ class ResultsDialog(QtWidgets.QFileDialog):
         # Add preview tabs as appropriate
         if not os.path.isdir(filename) and filename != '':
             try:
-                results = Results.load(str(filename))
+                results = Results.load(str(filename), preview_points=self.PREVIEW_POINTS)
             except ValueError:
                 return
             for widget in self.preview_widget_list:
@@ -33,6 +33,7 @@ from qtpy.QtCore import QAbstractItemModel, QPoint
 
 from ...experiment.procedure import ProcedureStatus
 from ...experiment.results import Results
+from ..curves import results_data
 from ..Qt import QtCore, QtGui, QtWidgets
 from .tab_widget import DEFAULT_COLOR, TabWidget
 
@@ -44,9 +45,16 @@ log.addHandler(logging.NullHandler())
 
 
 class ResultsTable(QtCore.QObject):
-    """ Class representing a panda dataframe """
+    """ Class representing a panda dataframe
+
+    The columns of the dataframe are kept as numpy arrays, which are taken once per
+    update, such that the table model does not access the dataframe for every cell.
+    """
     data_changed = QtCore.Signal(int, int, int, int)
 
+    #: Maximum number of formatted cells kept in the cache.
+    cache_size = 100_000
+
     def __init__(
         self,
         results: Results,
@@ -63,7 +71,8 @@ class ResultsTable(QtCore.QObject):
         self.last_row_count = 0
         self.wdg = wdg
         self.column_index = column_index
-        self.data = self.results.data
+        self._text_cache: dict[tuple[int, int], str] = {}
+        self.data = results_data(self.results)
         self._started = False
 
     @property
@@ -77,6 +86,48 @@ class ResultsTable(QtCore.QObject):
             self._data = self._data.set_index(self.column_index)
         else:
             self._data.reset_index()
+        self._arrays = [self._data.iloc[:, col].to_numpy()
+                        for col in range(self._data.shape[1])]
+        self._float_arrays: dict[int, np.ndarray] = {}
+        self._index_positions: dict | None = None
+        self._text_cache.clear()
+
+    def text(self, row: int, col: int, float_digits: int = 6) -> str:
+        """ Return the formatted value of a cell """
+        key = (row, col)
+        try:
+            return self._text_cache[key]
+        except KeyError:
+            pass
+        array = self._arrays[col]
+        value = array[row]
+        if array.dtype == np.float64:
+            # limit maximum number of decimal digits displayed
+            text = f"{value:.{float_digits:d}g}"  # noqa: E231
+        else:
+            text = str(value)
+        if len(self._text_cache) >= self.cache_size:
+            self._text_cache.clear()
+        self._text_cache[key] = text
+        return text
+
+    def float_column(self, col: int) -> np.ndarray:
+        """ Return the values of a column as float array, NaN for non-numeric values """
+        try:
+            return self._float_arrays[col]
+        except KeyError:
+            values = pd.to_numeric(self._arrays[col], errors="coerce")
+            values = np.asarray(values, dtype=np.float64)
+            self._float_arrays[col] = values
+            return values
+
+    def index_position(self, label) -> int | None:
+        """ Return the row of an index label or None, if it is not present """
+        if self._index_positions is None:
+            self._index_positions = {}
+            for row, key in enumerate(self._data.index):
+                self._index_positions.setdefault(key, row)
+        return self._index_positions.get(label)
 
     @property
     def rows(self):
@@ -100,7 +151,7 @@ class ResultsTable(QtCore.QObject):
             return
         if self.force_reload:
             self.results.reload()
-        self.data = self.results.data
+        self.data = results_data(self.results)
         current_row_count, columns = self._data.shape
         if (self.last_row_count < current_row_count):
             # Request cells content update
@@ -131,6 +182,9 @@ class PandasModelBase(QtCore.QAbstractTableModel):
     will be: (k*n) x (max(l(x) x=1..n)
     - By row: column fixed to the number of series, in this case table shape
     will be: k x (sum of l(x) x=1..n)
+
+    The model sorts itself with the permutation of :func:`numpy.argsort` of the
+    column values instead of comparing the rows one by one in a proxy model.
     """
 
     float_digits = 6
@@ -139,12 +193,16 @@ class PandasModelBase(QtCore.QAbstractTableModel):
     def __init__(self, column_index=None, results_list: list | None = None, parent=None):
         super().__init__(parent)
         self.column_index = column_index
+        self.sort_column = -1
+        self.sort_order = QtCore.Qt.SortOrder.AscendingOrder
+        self._order: np.ndarray | None = None
         self._init_data(results_list)
 
     def _init_data(self, results_list: list | None = None):
         if results_list is None:
             results_list = []
         self.results_list = results_list
+        self._vertical_header = None
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
 
@@ -153,6 +211,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         for results in self.results_list:
             results.stop()
         self._init_data()
+        self._order = None
         self.endResetModel()
 
     def add_results(self, results) -> None:
@@ -160,6 +219,8 @@ class PandasModelBase(QtCore.QAbstractTableModel):
             self.beginResetModel()
             self.results_list.append(results)
             results.data_changed.connect(partial(self._data_changed, results))
+            self._vertical_header = None
+            self._order = None
             self.endResetModel()
             results.init()
             results.start()
@@ -169,10 +230,13 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         self.beginResetModel()
         if results in self.results_list:
             self.results_list.remove(results)
+        self._vertical_header = None
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
+        self._order = None
         results.stop()
         self.endResetModel()
+        self._resort()
 
     def rowCount(self, parent=None):
         return self.row_count
@@ -182,27 +246,58 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
     def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
         if index.isValid() and role in (QtCore.Qt.ItemDataRole.DisplayRole, SORT_ROLE):
-            try:
-                results, row, col = self.translate_to_local(index.row(), index.column())
-                value = results.data.iat[row, col]
-                column_type = results.data.dtypes.iat[col]
-                # Cast to column type
-                value_render = column_type.type(value)
-            except (IndexError, ValueError, TypeError):
-                value = np.nan
-                value_render = ""
-            if isinstance(value_render, np.float64):
-                # limit maximum number of decimal digits displayed
-                value_render = f"{value_render:.{self.float_digits:d}g}"  # noqa: E231
-
+            results, row, col = self.translate_to_local(self.source_row(index.row()),
+                                                        index.column())
+            if row is None or row >= results.rows:
+                return "" if role == QtCore.Qt.ItemDataRole.DisplayRole else np.nan
             if role == QtCore.Qt.ItemDataRole.DisplayRole:
-                return str(value_render)
+                return results.text(row, col, self.float_digits)
             elif role == SORT_ROLE:
                 # For numerical sort
-                return float(value)
+                return float(results.float_column(col)[row])
 
         return None
 
+    def source_row(self, row: int) -> int:
+        """ Return the row of the data displayed in the (sorted) `row` of the table """
+        if self._order is not None and row < len(self._order):
+            return int(self._order[row])
+        return row
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        """ Sort the table by the values of `column`, or restore the original order
+        for a negative column.
+
+        Override method from QAbstractTableModel
+        """
+        self.sort_column = column
+        self.sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        # Keep selections and the current cell at their data
+        persistent = self.persistentIndexList()
+        source_rows = [self.source_row(index.row()) for index in persistent]
+        if 0 <= column < self.column_count and self.row_count > 0:
+            values = self.column_values(column)
+            if order == QtCore.Qt.SortOrder.DescendingOrder:
+                values = -values
+            # NaN values (e.g. of missing cells) are sorted last
+            self._order = np.argsort(values, kind="stable")
+            rows = np.empty_like(self._order)
+            rows[self._order] = np.arange(len(self._order))
+        else:
+            self._order = None
+            rows = np.empty(0, dtype=int)
+        self.changePersistentIndexList(persistent, [
+            self.index(int(rows[row]) if row < len(rows) else row, index.column())
+            for index, row in zip(persistent, source_rows)
+        ])
+        self.layoutChanged.emit()
+
+    def _resort(self):
+        """ Sort the table again, e.g. after new rows arrived """
+        if self.sort_column >= 0:
+            self.sort(self.sort_column, self.sort_order)
+
     def _get_new_rows_columns(self, results, r1, c1, r2, c2):
         new_rows = self.pandas_row_count() - self.row_count
         new_rows_start = self.row_count
@@ -217,6 +312,8 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
         Override method from QAbstractTableModel
         """
+        if orientation == QtCore.Qt.Orientation.Vertical:
+            section = self.source_row(section)
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
             if orientation == QtCore.Qt.Orientation.Horizontal:
                 return str(self.horizontal_header[section])
@@ -234,6 +331,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
     def _data_changed(self, results, r1, c1, r2, c2):
         """ Internal method to handle data changed signal """
+        self._vertical_header = None
         rows, rows_start, columns, columns_start = \
             self._get_new_rows_columns(results, r1, c1, r2, c2)
         if rows or columns:
@@ -257,6 +355,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
             for r1_e, c1_e, r2_e, c2_e in top_bottom:
                 self.dataChanged.emit(self.createIndex(r1_e, c1_e),
                                       self.createIndex(r2_e, c2_e))
+        self._resort()
 
     def pandas_row_count(self):
         """ Return total row count of the panda dataframes
@@ -280,6 +379,12 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         """
         raise NotImplementedError("Subclass should implement it")
 
+    def column_values(self, col):
+        """ Return the float values of a column of the full table as numpy array,
+        with NaN for missing or non-numeric values.
+        """
+        raise NotImplementedError("Subclass should implement it")
+
     def translate_to_local(self, row, col):
         """ Translate from full table coordinate to single results coordinates """
         raise NotImplementedError("Subclass should implement it")
@@ -322,9 +427,12 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         for r in self.results_list:
             r.start()
             r.update_data()
+        self._vertical_header = None
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
+        self._order = None
         self.endResetModel()
+        self._resort()
 
     def copy_model(self, model_class):
         model = model_class(self.column_index, self.results_list[:])
@@ -351,6 +459,9 @@ class PandasModelByRow(PandasModelBase):
         bottom = self.translate_to_global(results, r2, c2)
         return (top + bottom),
 
+    def column_values(self, col):
+        return np.concatenate([r.float_column(col) for r in self.results_list])
+
     def translate_to_local(self, row, col):
         """ Translate from full table coordinate to single results coordinates """
         for index, results in enumerate(self.results_list):
@@ -371,12 +482,13 @@ class PandasModelByRow(PandasModelBase):
     @property
     def vertical_header(self):
         if self.column_index is None:
-            header = range(self.row_count)
-        else:
+            return range(self.row_count)
+        if self._vertical_header is None:
             header = []
             for r in self.results_list:
                 header.extend(r.data.index)
-        return header
+            self._vertical_header = header
+        return self._vertical_header
 
     @property
     def horizontal_header(self):
@@ -417,6 +529,19 @@ class PandasModelByColumn(PandasModelBase):
 
         return top_bottoms
 
+    def column_values(self, col):
+        results, _, col = self.translate_to_local(0, col)
+        column = results.float_column(col)
+        values = np.full(self.row_count, np.nan)
+        if self.column_index is None:
+            values[:len(column)] = column
+        else:
+            rows = np.array([results.index_position(label)
+                             for label in self.vertical_header], dtype=float)
+            present = ~np.isnan(rows)
+            values[present] = column[rows[present].astype(int)]
+        return values
+
     def translate_to_local(self, row, col):
         """ Translate from full table coordinate to single results coordinates """
         columns = 0
@@ -426,11 +551,7 @@ class PandasModelByColumn(PandasModelBase):
             columns += results.columns
         if (self.column_index is not None):
             # Remap row to matching index entry when indexing is used
-            try:
-                index = self.vertical_header[row]
-                row = list(results.data.index).index(index)
-            except ValueError:
-                row = None
+            row = results.index_position(self.vertical_header[row])
         return results, row, col - columns
 
     def translate_to_global(self, results, row, col):
@@ -459,11 +580,12 @@ class PandasModelByColumn(PandasModelBase):
 
     @property
     def vertical_header(self):
-        header = set()
-        for r in self.results_list:
-            header = header.union(set(r.data.index))
-        header = sorted(header)
-        return header
+        if self._vertical_header is None:
+            header = set()
+            for r in self.results_list:
+                header = header.union(set(r.data.index))
+            self._vertical_header = sorted(header)
+        return self._vertical_header
 
 
 class Table(QtWidgets.QTableView):
@@ -499,7 +621,7 @@ class Table(QtWidgets.QTableView):
         self.setModel(model)
         self.horizontalHeader().setStyleSheet("font: bold;")
         self.sortByColumn(-1, QtCore.Qt.SortOrder.AscendingOrder)
-        self.setSortingEnabled(True)
+        self.setSortingEnabled(SORTING_ENABLED)
         self.horizontalHeader().setSectionsMovable(True)
         self.horizontalHeader().setSectionResizeMode(
             QtWidgets.QHeaderView.ResizeMode.ResizeToContents
@@ -515,21 +637,16 @@ class Table(QtWidgets.QTableView):
             self.timer.start(int(self.refresh_time * 1e3))
 
     def setModel(self, model: QAbstractItemModel | None) -> None:
-        if model is not None:
-            if isinstance(model, PandasModelBase):
-                model.float_digits = self.float_digits
-            if SORTING_ENABLED:
-                proxyModel = QtCore.QSortFilterProxyModel(self)
-                proxyModel.setSourceModel(model)
-                model = proxyModel
-
-                model.setSortRole(SORT_ROLE)
+        if isinstance(model, PandasModelBase):
+            model.float_digits = self.float_digits
         super().setModel(model)
+        if isinstance(model, PandasModelBase) and self.isSortingEnabled():
+            # Keep the sorting of the previous model
+            header = self.horizontalHeader()
+            model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
 
     def source_model(self) -> PandasModelBase:
         model = self.model()
-        if SORTING_ENABLED:
-            model = cast(QtCore.QSortFilterProxyModel, model).sourceModel()
         if model is None:
             raise AttributeError("'model' is None.")
         return cast(PandasModelBase, model)
@@ -610,7 +727,7 @@ class Table(QtWidgets.QTableView):
             # Empty table, reset sorting policy
             self.setSortingEnabled(False)
             self.sortByColumn(-1, QtCore.Qt.SortOrder.AscendingOrder)
-            self.setSortingEnabled(True)
+            self.setSortingEnabled(SORTING_ENABLED)
 
     def clear(self) -> None:
         model = self.source_model()
@@ -618,7 +735,7 @@ class Table(QtWidgets.QTableView):
         model.clear()
         self.setSortingEnabled(False)
         self.sortByColumn(-1, QtCore.Qt.SortOrder.AscendingOrder)
-        self.setSortingEnabled(True)
+        self.setSortingEnabled(SORTING_ENABLED)
 
     def set_index(self, index) -> None:
         model = self.source_model()
@@ -0,0 +1,91 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+from ..Qt import QtCore, QtWidgets
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class TracerWidget(QtWidgets.QWidget):
+    """ Widget to display the statistics of an
+    :class:`AdapterTracer<pymeasure.adapters.tracing.AdapterTracer>` per command,
+    sorted by the total bus time, such that the slowest commands are on top.
+
+    :param tracer: The tracer whose statistics are displayed.
+    :param interval: Update interval in ms.
+    """
+
+    columns = ("Instrument", "Command", "Count", "Total (s)", "p50 (ms)", "p99 (ms)",
+               "Throughput (B/s)")
+
+    def __init__(self, tracer, interval=1000, parent=None):
+        super().__init__(parent)
+        self.tracer = tracer
+        self._setup_ui()
+        self._layout()
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.update_statistics)
+        self.timer.start(interval)
+
+    def _setup_ui(self):
+        self.table = QtWidgets.QTableWidget(0, len(self.columns), self)
+        self.table.setHorizontalHeaderLabels(self.columns)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+
+        self.clear_button = QtWidgets.QPushButton("Clear", self)
+        self.clear_button.clicked.connect(self.clear)
+
+    def _layout(self):
+        vbox = QtWidgets.QVBoxLayout(self)
+        vbox.setSpacing(0)
+        vbox.addWidget(self.table)
+        vbox.addWidget(self.clear_button)
+        self.setLayout(vbox)
+
+    def update_statistics(self):
+        """ Show the current statistics of the tracer. """
+        stats = sorted(self.tracer.statistics().items(), key=lambda item: -item[1]["total"])
+        self.table.setRowCount(len(stats))
+        for row, ((instrument, command), values) in enumerate(stats):
+            texts = (
+                instrument,
+                command,
+                str(values["count"]),
+                f"{values['total']:.3f}",
+                f"{values['p50'] * 1e3:.2f}",
+                f"{values['p99'] * 1e3:.2f}",
+                f"{values['throughput']:.0f}",
+            )
+            for column, text in enumerate(texts):
+                self.table.setItem(row, column, QtWidgets.QTableWidgetItem(text))
+
+    def clear(self):
+        """ Discard the recorded transactions of the tracer. """
+        self.tracer.clear()
+        self.update_statistics()
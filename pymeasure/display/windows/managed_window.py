@@ -47,6 +47,7 @@ from ..widgets import (
     PlotWidget,
     ResultsDialog,
     SequencerWidget,
+    TracerWidget,
 )
 
 log = logging.getLogger(__name__)
@@ -120,6 +121,14 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         should be saved to the selected file, or not (i.e., to a temporary file instead).
     :param hide_groups: a boolean controlling whether parameter groups are hidden (True, default)
         or disabled/grayed-out (False) when the group conditions are not met.
+    :param catalog: a boolean controlling whether the runs are recorded in the
+        :class:`~pymeasure.experiment.catalog.ResultsCatalog` of their data directory, which
+        allows to query past runs quickly (False, default).
+    :param tracer: an :class:`~pymeasure.adapters.tracing.AdapterTracer`, whose statistics
+        are displayed in a dock to find slow commands, or :code:`None` (default).
+    :param persistent_worker: a boolean controlling whether a single
+        :class:`~pymeasure.experiment.workers.Worker` runs all queued experiments, which saves
+        its setup for each of many short experiments (False, default).
 
     """
 
@@ -137,6 +146,9 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                  inputs_in_scrollarea: bool = False,
                  enable_file_input: bool = True,
                  hide_groups: bool = True,
+                 catalog: bool = False,
+                 tracer=None,
+                 persistent_worker: bool = False,
                  ):
 
         super().__init__(parent=parent)
@@ -153,6 +165,9 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.enable_file_input = enable_file_input
         self.log = logging.getLogger(log_channel)
         self.log_level = log_level
+        self.catalog = catalog
+        self.tracer = tracer
+        self.persistent_worker = persistent_worker
         log.setLevel(log_level)
         self.log.setLevel(log_level)
         self.widget_list = widget_list or []
@@ -204,7 +219,9 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.manager = Manager(self.widget_list,
                                self.browser,
                                log_level=self.log_level,
-                               parent=self)
+                               parent=self,
+                               catalog=self.catalog,
+                               persistent_worker=self.persistent_worker)
         self.manager.abort_returned.connect(self.abort_returned)
         self.manager.queued.connect(self.queued)
         self.manager.running.connect(self.running)
@@ -223,6 +240,9 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                 parent=self
             )
 
+        if self.tracer is not None:
+            self.tracer_widget = TracerWidget(self.tracer, parent=self)
+
     def _layout(self) -> None:
         self.main = QtWidgets.QWidget(self)
 
@@ -264,6 +284,11 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
             estimator_dock.setFeatures(QtWidgets.QDockWidget.DockWidgetFeature.NoDockWidgetFeatures)
             self.addDockWidget(QtCore.Qt.DockWidgetArea.LeftDockWidgetArea, estimator_dock)
 
+        if self.tracer is not None:
+            tracer_dock = QtWidgets.QDockWidget('Adapter I/O')
+            tracer_dock.setWidget(self.tracer_widget)
+            self.addDockWidget(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, tracer_dock)
+
         self.tabs = QtWidgets.QTabWidget(self.main)
         for wdg in self.widget_list:
             self.tabs.addTab(wdg, wdg.name)
@@ -284,6 +309,7 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
     def quit(self, evt=None) -> None:
         if self.manager.is_running():
             self.abort()
+        self.manager.close()
 
         self.close()
 
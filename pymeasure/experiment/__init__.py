@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+from .catalog import CatalogEntry, ResultsCatalog
 from .config import get_config
 from .experiment import Experiment, get_array, get_array_steps, get_array_zero
 from .listeners import Listener, Recorder
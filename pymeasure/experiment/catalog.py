@@ -0,0 +1,358 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Catalog of the results files of a directory in an SQLite database.
+
+The catalog indexes the procedure class, parameters, metadata, status, number of rows and
+timestamps of each results file, such that past runs can be found without reading the
+files.
+
+.. code-block:: python
+
+    with ResultsCatalog("data") as catalog:
+        catalog.reindex()
+        entries = catalog.find(procedure="RandomProcedure",
+                               parameters={"Loop Iterations": (100, 1000)})
+
+An existing directory is indexed from the command line with
+:code:`python -m pymeasure.experiment.catalog DIRECTORY [--recursive]`.
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from typing import Any, NamedTuple
+
+from typing_extensions import Self
+
+from .procedure import ProcedureStatus
+from .results import Results
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class CatalogEntry(NamedTuple):
+    """Entry of a results file in the :class:`ResultsCatalog`."""
+    #: Absolute path of the results file.
+    path: str
+    #: Procedure class as written in the header, e.g. "module.RandomProcedure".
+    procedure: str
+    #: Last known status of the run or None, if unknown.
+    status: str | None
+    #: Number of data rows.
+    rows: int
+    #: Timestamps of the start and end of the run, None if unknown.
+    started: float | None
+    finished: float | None
+    #: Parameter and metadata values, as written in the header.
+    parameters: dict[str, str]
+    metadata: dict[str, str]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    path TEXT PRIMARY KEY,
+    procedure TEXT NOT NULL,
+    status TEXT,
+    rows INTEGER NOT NULL DEFAULT 0,
+    started REAL,
+    finished REAL,
+    modified INTEGER,
+    size INTEGER,
+    parameters TEXT NOT NULL DEFAULT '{}',
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS run_values (
+    path TEXT NOT NULL REFERENCES runs(path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    text TEXT,
+    number REAL
+);
+CREATE INDEX IF NOT EXISTS run_values_name ON run_values (name, number, text);
+CREATE INDEX IF NOT EXISTS runs_procedure ON runs (procedure);
+"""
+
+_FINAL_STATUSES = (ProcedureStatus.FINISHED, ProcedureStatus.FAILED, ProcedureStatus.ABORTED)
+
+
+def _number(text: str) -> float | None:
+    """Return the numerical value of a header value with optional units, e.g. "10 V"."""
+    try:
+        return float(text.split(" ", 1)[0])
+    except ValueError:
+        return None
+
+
+def _header_value(value: Any) -> str:
+    """Return the value as written in the header of a results file."""
+    return str(value).encode("unicode_escape").decode("utf-8")
+
+
+def parse_header_sections(header: str) -> tuple[str, dict[str, str], dict[str, str]]:
+    """Return the procedure class name, the parameters and the metadata of a header text
+    without importing the procedure.
+
+    :param header: Header text, see :meth:`~pymeasure.experiment.results.Results.read_header`.
+    """
+    procedure = ""
+    sections: dict[str, dict[str, str]] = {"Parameters": {}, "Metadata": {}}
+    section: dict[str, str] = {}
+    for line in header.split(Results.LINE_BREAK):
+        line = line.removeprefix(Results.COMMENT)
+        if line.startswith("Procedure"):
+            match = re.search(r"<(?P<name>[^>]+)>", line)
+            procedure = match.group("name") if match else ""
+        elif line.startswith("\t"):
+            name, _, value = line[1:].partition(": ")
+            section[name] = value
+        else:
+            section = sections.get(line.rstrip(":"), {})
+    return procedure, sections["Parameters"], sections["Metadata"]
+
+
+class ResultsCatalog:
+    """Catalog of the results files of a directory in an SQLite database.
+
+    The database is stored as :attr:`FILENAME` in the `directory`. Several processes may
+    update the catalog at the same time.
+
+    :param directory: Directory of the results files.
+    """
+
+    #: File name of the database in the directory.
+    FILENAME = "pymeasure_catalog.sqlite3"
+
+    def __init__(self, directory: os.PathLike | str):
+        self.directory = os.path.abspath(directory)
+        self.connection = sqlite3.connect(os.path.join(self.directory, self.FILENAME),
+                                          timeout=10)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    @classmethod
+    def for_file(cls, data_filename: os.PathLike | str) -> "ResultsCatalog":
+        """Return the catalog of the directory of `data_filename`."""
+        return cls(os.path.dirname(os.path.abspath(data_filename)))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def record(self, results: Results, status: str | None = None) -> None:
+        """Add or update the entry of `results`, for example when a run starts or finishes.
+
+        :param results: Results of the run.
+        :param status: Status of the run, by default the status of its procedure.
+        """
+        if status is None:
+            status = results.procedure.status
+        now = time.time()
+        procedure = results.procedure
+        parameters = {p.name: _header_value(p) for p in procedure.parameter_objects().values()}
+        metadata = {m.name: _header_value(m) for m in procedure.metadata_objects().values()}
+        procedure_class = f"{type(procedure).__module__}.{type(procedure).__qualname__}"
+        for filename in results.data_filenames:
+            path = os.path.abspath(filename)
+            previous = self.connection.execute(
+                "SELECT started, finished FROM runs WHERE path = ?", (path,)).fetchone()
+            started, finished = previous or (None, None)
+            if status == ProcedureStatus.RUNNING:
+                started, finished = now, None
+            elif status in _FINAL_STATUSES:
+                finished = now
+            rows = self._count_rows(path) if status in _FINAL_STATUSES else 0
+            self._store(path, procedure_class, status, rows, started, finished,
+                        parameters, metadata)
+        self.connection.commit()
+
+    def index_file(self, data_filename: os.PathLike | str, force: bool = False) -> bool:
+        """Add or update the entry of a results file from its header.
+
+        :param data_filename: Name of the results file.
+        :param force: Index the file even if it did not change since the last indexing.
+        :return: True if the file was indexed, False if it was unchanged or not a results file.
+        """
+        path = os.path.abspath(data_filename)
+        stat = os.stat(path)
+        previous = self.connection.execute(
+            "SELECT status, started, finished, modified, size FROM runs WHERE path = ?",
+            (path,)).fetchone()
+        if not force and previous and previous[3:] == (stat.st_mtime_ns, stat.st_size):
+            return False
+        try:
+            header = Results.read_header(path)
+        except (OSError, UnicodeDecodeError):
+            return False
+        procedure, parameters, metadata = parse_header_sections(header.text)
+        if not procedure:
+            return False
+        status, started, finished = previous[:3] if previous else (None, None, None)
+        self._store(path, procedure, status, self._count_rows(path), started, finished,
+                    parameters, metadata)
+        self.connection.commit()
+        return True
+
+    def reindex(self, recursive: bool = False, pattern: str = "*.csv") -> int:
+        """Index the changed results files of the directory and remove missing ones.
+
+        :param recursive: Index the subdirectories as well.
+        :param pattern: Glob pattern of the results files.
+        :return: Number of indexed files.
+        """
+        pattern = os.path.join(self.directory, "**", pattern) if recursive else \
+            os.path.join(self.directory, pattern)
+        count = sum(self.index_file(filename) for filename in glob.glob(pattern,
+                                                                        recursive=recursive))
+        for (path,) in self.connection.execute("SELECT path FROM runs").fetchall():
+            if not os.path.exists(path):
+                self.connection.execute("DELETE FROM runs WHERE path = ?", (path,))
+        self.connection.commit()
+        log.info(f"Indexed {count} results files in {self.directory}.")
+        return count
+
+    def find(
+        self,
+        procedure: str | None = None,
+        status: str | None = None,
+        parameters: dict[str, Any] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> list[CatalogEntry]:
+        """Return the entries matching all the given conditions, sorted by start time.
+
+        :param procedure: Procedure class name, with or without module.
+        :param status: Status of the run, e.g. :code:`ProcedureStatus.FINISHED`.
+        :param parameters: Dictionary of parameter or metadata names and values. A value is
+            either compared for equality (numerically, if possible) or is a tuple of a
+            minimum and a maximum (None for unlimited).
+        :param since: Minimum start timestamp.
+        :param until: Maximum start timestamp.
+        """
+        conditions = []
+        arguments: list[Any] = []
+        if procedure is not None:
+            conditions.append("(procedure = ? OR procedure LIKE ?)")
+            arguments += [procedure, f"%.{procedure}"]
+        if status is not None:
+            conditions.append("status = ?")
+            arguments.append(str(status))
+        if since is not None:
+            conditions.append("started >= ?")
+            arguments.append(since)
+        if until is not None:
+            conditions.append("started <= ?")
+            arguments.append(until)
+        for name, value in (parameters or {}).items():
+            condition, values = self._value_condition(value)
+            conditions.append("path IN (SELECT path FROM run_values WHERE name = ? AND "
+                              f"{condition})")
+            arguments += [name, *values]
+        query = "SELECT path, procedure, status, rows, started, finished, parameters, " \
+                "metadata FROM runs"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY started, path"
+        return [CatalogEntry(path, procedure_class, status_, rows, started, finished,
+                             json.loads(parameters_), json.loads(metadata))
+                for path, procedure_class, status_, rows, started, finished, parameters_, metadata
+                in self.connection.execute(query, arguments)]
+
+    @staticmethod
+    def _value_condition(value: Any) -> tuple[str, list[Any]]:
+        if isinstance(value, tuple):
+            minimum, maximum = value
+            condition, values = "number IS NOT NULL", []
+            if minimum is not None:
+                condition += " AND number >= ?"
+                values.append(minimum)
+            if maximum is not None:
+                condition += " AND number <= ?"
+                values.append(maximum)
+            return condition, values
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return "number = ?", [value]
+        return "text = ?", [str(value)]
+
+    def _store(self, path: str, procedure: str, status: str | None, rows: int,
+               started: float | None, finished: float | None, parameters: dict[str, str],
+               metadata: dict[str, str]) -> None:
+        try:
+            stat = os.stat(path)
+            modified, size = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            modified = size = None
+        self.connection.execute("DELETE FROM run_values WHERE path = ?", (path,))
+        self.connection.execute(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, procedure, None if status is None else str(status), rows, started,
+             finished, modified, size, json.dumps(parameters), json.dumps(metadata)))
+        self.connection.executemany(
+            "INSERT INTO run_values VALUES (?, ?, ?, ?)",
+            [(path, name, text, _number(text))
+             for name, text in {**parameters, **metadata}.items()])
+
+    @staticmethod
+    def _count_rows(path: str, block_size: int = 2**20) -> int:
+        """Count the data rows of a results file without parsing them."""
+        try:
+            header = Results.read_header(path)
+        except OSError:
+            return 0
+        lines = 0
+        last = b"\n"
+        with open(path, "rb") as f:
+            f.seek(header.data_offset)
+            while block := f.read(block_size):
+                lines += block.count(b"\n")
+                last = block[-1:]
+        return lines + (last != b"\n")
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """Index the results files of a directory."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("directory", help="directory of the results files")
+    parser.add_argument("--recursive", action="store_true", help="index subdirectories")
+    parser.add_argument("--pattern", default="*.csv", help="glob pattern of the files")
+    args = parser.parse_args(arguments)
+    with ResultsCatalog(args.directory) as catalog:
+        count = catalog.reindex(recursive=args.recursive, pattern=args.pattern)
+    print(f"Indexed {count} results files.")
+
+
+if __name__ == "__main__":
+    main()
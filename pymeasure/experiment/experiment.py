@@ -29,6 +29,7 @@ import time
 
 import numpy as np
 
+from pymeasure._lazy import lazy_module
 from pymeasure.log import console_log, setup_logging
 
 from .config import get_config, set_mpl_rcparams
@@ -38,6 +39,9 @@ from .workers import Worker
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Imported on first use, as it is slow to import
+pd = lazy_module("pandas")
+
 try:
     from IPython import display
 except ImportError:
@@ -61,6 +65,39 @@ def get_array_zero(maxval, step):
                            np.arange(-maxval, 0, step)))
 
 
+class _GrowingArray:
+    """Array to which values are appended, whose capacity doubles when it is full, such that
+    appending is cheap on average."""
+
+    def __init__(self, capacity=1024):
+        self._capacity = capacity
+        self._buffer = None
+        self.size = 0
+
+    def extend(self, values):
+        """Append the `values`."""
+        values = np.asarray(values)
+        if self._buffer is None:
+            self._buffer = np.empty(max(self._capacity, len(values)), dtype=values.dtype)
+        size = self.size + len(values)
+        dtype = np.promote_types(self._buffer.dtype, values.dtype)
+        if size > len(self._buffer) or dtype != self._buffer.dtype:
+            capacity = max(size, 2 * len(self._buffer)) if size > len(self._buffer) \
+                else len(self._buffer)
+            buffer = np.empty(capacity, dtype=dtype)
+            buffer[:self.size] = self._buffer[:self.size]
+            self._buffer = buffer
+        self._buffer[self.size:size] = values
+        self.size = size
+
+    @property
+    def values(self):
+        """The appended values."""
+        if self._buffer is None:
+            return np.empty(0)
+        return self._buffer[:self.size]
+
+
 def create_filename(title):
     """
     Create a new filename according to the style defined in the config file.
@@ -100,10 +137,15 @@ class Experiment:
     :param analyse: Post-analysis function, which takes a pandas dataframe as input and
         returns it with added (analysed) columns. The analysed results are accessible via
         experiment.data, as opposed to experiment.results.data for the 'raw' data.
+    :param incremental: If True, `analyse` is called as ``analyse(rows, state)`` with only the
+        rows appended since its last call and the state it returned last time (None at
+        first). It returns the analysed rows, or a tuple of the analysed rows and the new
+        state. The analysed rows are appended to experiment.data, such that the analysis and
+        live plotting of long runs do not slow down with the amount of data.
     :param _data_timeout: Time limit for how long live plotting should wait for datapoints.
     """
 
-    def __init__(self, title, procedure, analyse=(lambda x: x)):
+    def __init__(self, title, procedure, analyse=None, incremental=False):
         self.title = title
         self.procedure = procedure
         self.measlist = []
@@ -111,8 +153,14 @@ class Experiment:
         self.plots = []
         self.figs = []
         self._data = []
-        self.analyse = analyse
+        self.analyse = analyse if analyse is not None else (lambda rows, state=None: rows)
+        self.incremental = incremental
         self._data_timeout = 10
+        self._analysed_rows = 0
+        self._analysis_state = None
+        self._chunks = []
+        self._data_chunks = 0
+        self._lines = {}
 
         config = get_config()
         set_mpl_rcparams(config)
@@ -140,9 +188,43 @@ class Experiment:
     def data(self):
         """Data property which returns analysed data, if an analyse function
         is defined, otherwise returns the raw data."""
-        self._data = self.analyse(self.results.data.copy())
+        if not self.incremental:
+            self._data = self.analyse(self.results.data.copy())
+            return self._data
+        self._analyse_new_rows()
+        if self._data_chunks != len(self._chunks):
+            # Concatenate the analysed chunks only on access, as the live plot uses them
+            # directly
+            chunks = [chunk for chunk in self._chunks if len(chunk)] or self._chunks[:1]
+            self._data = pd.concat(chunks, sort=False) if len(chunks) > 1 else chunks[0]
+            self._data_chunks = len(self._chunks)
         return self._data
 
+    def _analyse_new_rows(self):
+        """Analyse the rows appended since the last call and append them to the chunks of
+        analysed rows."""
+        raw = self.results.data
+        if len(raw) < self._analysed_rows:
+            # The results were reloaded, analyse them again
+            self.reset_analysis()
+        if self._chunks and len(raw) == self._analysed_rows:
+            return
+        rows = self.analyse(raw.iloc[self._analysed_rows:].copy(), self._analysis_state)
+        if isinstance(rows, tuple):
+            rows, self._analysis_state = rows
+        self._chunks.append(rows)
+        self._analysed_rows = len(raw)
+
+    def reset_analysis(self):
+        """Discard the analysed data, such that the incremental analysis starts over with
+        the next access of :attr:`data`."""
+        self._data = []
+        self._analysed_rows = 0
+        self._analysis_state = None
+        self._chunks = []
+        self._data_chunks = 0
+        self._lines = {}
+
     def wait_for_data(self):
         """Wait for the data attribute to fill with datapoints."""
         t = time.time()
@@ -192,7 +274,10 @@ class Experiment:
         """Update the plots in the plots list with new data from the experiment.data
         pandas dataframe."""
         try:
-            _ = self.data
+            if self.incremental:
+                self._analyse_new_rows()
+            else:
+                _ = self.data
             for plot in self.plots:
                 ax = plot['ax']
                 if plot['type'] == 'plot':
@@ -212,6 +297,17 @@ class Experiment:
 
     def update_line(self, ax, hl, xname, yname):
         """Update a line in a matplotlib graph with new data."""
+        if self.incremental:
+            # Append only the new chunks of analysed rows to the data of the line
+            x, y, chunks = self._lines.get(hl, (_GrowingArray(), _GrowingArray(), 0))
+            for rows in self._chunks[chunks:]:
+                x.extend(rows[xname])
+                y.extend(rows[yname])
+            self._lines[hl] = x, y, len(self._chunks)
+            hl.set_data(x.values, y.values)
+            ax.relim()
+            ax.autoscale()
+            return
         del hl._xorig, hl._yorig
         hl.set_xdata(self._data[xname])
         hl.set_ydata(self._data[yname])
@@ -23,21 +23,27 @@
 #
 
 import logging
+import os
+import pickle
+import tempfile
+import threading
 from logging import FileHandler, StreamHandler
+from queue import Full
 
+from .._lazy import lazy_module
 from ..log import QueueListener
 from ..thread import StoppableThread
+from .transport import deserialize
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 try:
-    import cloudpickle
-    import zmq
+    # Imported on first use, as it is slow to import
+    zmq = lazy_module("zmq")
 except ImportError:
     zmq = None
-    cloudpickle = None
-    log.warning("ZMQ and cloudpickle are required for TCP communication")
+    log.warning("ZMQ is required for TCP communication")
 
 
 class Monitor(QueueListener):
@@ -53,13 +59,15 @@ class Listener(StoppableThread):
     a ZMQ TCP port and can be stopped by a thread-safe method call
     """
 
-    def __init__(self, port, topic='', timeout=0.01):
+    def __init__(self, port, topic='', timeout=0.01, hwm=None):
         """ Constructs the Listener object with a subscriber port
         over which to listen for messages
 
         :param port: TCP port to listen on
         :param topic: Topic to listen on
         :param timeout: Timeout in seconds to recheck stop flag
+        :param hwm: High-water mark, i.e. the number of received messages queued
+            before further messages are dropped, or None for the ZMQ default
         """
         super().__init__()
 
@@ -70,6 +78,8 @@ class Listener(StoppableThread):
         self.context = zmq.Context()
         log.debug(f"{self.__class__.__name__} has ZMQ Context: {self.context!r}")
         self.subscriber = self.context.socket(zmq.SUB)
+        if hwm is not None:
+            self.subscriber.setsockopt(zmq.RCVHWM, hwm)
         self.subscriber.setsockopt(zmq.SUBSCRIBE, topic.encode())
         self.subscriber.connect(f'tcp://localhost:{port}')
         log.info(
@@ -80,11 +90,8 @@ class Listener(StoppableThread):
         self.timeout = timeout
 
     def receive(self, flags=0):
-        topic, record = self.subscriber.recv_serialized(
-            deserialize=lambda msg: (msg[0].decode(), cloudpickle.loads(msg[1])),
-            flags=flags
-        )
-        return topic, record
+        frames = self.subscriber.recv_multipart(flags=flags, copy=False)
+        return deserialize(frames)
 
     def message_waiting(self):
         """Check if we have a message, wait at most until timeout."""
@@ -99,23 +106,177 @@ class Recorder(QueueListener):
     """ Recorder loads the initial Results for a filepath and
     appends data by listening for it over a queue. The queue
     ensures that no data is lost between the Recorder and Worker.
+
+    The records are formatted and written to the files in the thread of the
+    recorder, such that slow file systems do not delay the procedure. Records
+    are added with :meth:`put`, whose behaviour for a full (bounded) queue is
+    defined by the `overflow` policy:
+
+    - ``"block"`` waits until the recorder has written enough records,
+    - ``"drop"`` discards the record and counts it in :attr:`dropped`,
+    - ``"spill"`` stores the record in a temporary file, from which it is moved
+      to the queue (in order) as soon as there is space again.
+
+    The recorder writes all queued and spilled records before :meth:`stop` returns.
+    :meth:`flush` waits until the records are written, and :meth:`switch` continues
+    with the files of other results, such that one recorder (and its thread) may
+    record several procedures one after the other.
     """
 
-    def __init__(self, results, queue, **kwargs):
+    overflow_policies = ("block", "drop", "spill")
+
+    def __init__(self, results, queue, overflow="block", **kwargs):
         """ Constructs a Recorder to record the Procedure data into
         the file path, by waiting for data on the subscription port
         """
+        if overflow not in self.overflow_policies:
+            raise ValueError(f"Invalid overflow policy {overflow!r}, use one of "
+                             f"{self.overflow_policies}.")
+        self._handler_kwargs = kwargs
+        super().__init__(queue, *self._create_handlers(results))
+        self.overflow = overflow
+        self._reset_statistics()
+        self._spill_file = None
+        self._spill_count = 0  # records in the spill file, which are not yet queued
+        self._spill_position = 0  # read position in the spill file
+
+    def _create_handlers(self, results):
         handlers = []
         for filename in results.data_filenames:
-            fh = FileHandler(filename=filename, **kwargs)
+            fh = FileHandler(filename=filename, **self._handler_kwargs)
             fh.setFormatter(results.formatter)
             fh.setLevel(logging.NOTSET)
             handlers.append(fh)
+        return handlers
 
-        super().__init__(queue, *handlers)
+    def _reset_statistics(self):
+        #: Number of records put into the recorder.
+        self.received = 0
+        #: Number of records written by the recorder.
+        self.written = 0
+        #: Number of records discarded due to a full queue.
+        self.dropped = 0
+        #: Number of records stored in the spill file due to a full queue.
+        self.spilled = 0
+        #: Largest number of records waiting in the queue.
+        self.max_queue_depth = 0
 
-    def stop(self):
+    @property
+    def queue_depth(self):
+        """ Number of records waiting to be written, including spilled records. """
+        try:
+            depth = self.queue.qsize()
+        except NotImplementedError:  # multiprocessing queues on macOS
+            depth = 0
+        return depth + self._spill_count
+
+    def statistics(self):
+        """ Return a dictionary of the queue metrics of the recorder. """
+        return {
+            "received": self.received,
+            "written": self.written,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+    def put(self, record):
+        """ Put a record into the queue of the recorder, applying the overflow policy. """
+        self.received += 1
+        if self._spill_count:
+            self._unspill()
+        if self.overflow == "block":
+            self.queue.put(record)
+        elif self._spill_count:
+            # Keep the order, while older records wait in the spill file
+            self._spill(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except Full:
+                if self.overflow == "drop":
+                    if not self.dropped:
+                        log.warning("Recorder queue is full, records are dropped.")
+                    self.dropped += 1
+                else:
+                    self._spill(record)
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    def _spill(self, record):
+        if self._spill_file is None:
+            # Closed as soon as it is empty or in stop, also if writing the records fails
+            self._spill_file = tempfile.TemporaryFile()  # noqa: SIM115
+        self._spill_file.seek(0, os.SEEK_END)
+        pickle.dump(record, self._spill_file)
+        self._spill_count += 1
+        self.spilled += 1
+
+    def _unspill(self, block=False):
+        """ Move spilled records into the queue, as long as there is space. """
+        self._spill_file.seek(self._spill_position)
+        while self._spill_count:
+            position = self._spill_file.tell()
+            record = pickle.load(self._spill_file)
+            try:
+                self.queue.put(record, block=block)
+            except Full:
+                self._spill_position = position
+                return
+            self._spill_count -= 1
+        self._close_spill_file()
+
+    def _close_spill_file(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+        self._spill_file = None
+        self._spill_count = 0
+        self._spill_position = 0
+
+    def handle(self, record):
+        if isinstance(record, threading.Event):
+            # Marker of flush
+            record.set()
+            return
+        super().handle(record)
+        self.written += 1
+
+    def flush(self, timeout=None):
+        """ Wait until all records put into the recorder are written.
+
+        :param timeout: Maximum time to wait in seconds, or None to wait indefinitely.
+        :returns: True if the records are written, False for a timeout.
+        """
+        if not self.is_alive():
+            return True
+        if self._spill_count:
+            self._unspill(block=True)
+        written = threading.Event()
+        self.queue.put(written)
+        return written.wait(timeout)
+
+    def switch(self, results):
+        """ Write the remaining records and record the following ones into the files of
+        `results`. The statistics start anew.
+        """
+        self.flush()
         for handler in self.handlers:
             handler.close()
+        self.handlers = tuple(self._create_handlers(results))
+        self._reset_statistics()
 
-        super().stop()
+    def enqueue_sentinel(self):
+        # Wait for space in a bounded queue instead of failing
+        if self._spill_count:
+            self._unspill(block=True)
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        # Write the remaining records before closing the files
+        try:
+            if self.is_alive():
+                super().stop()
+        finally:
+            self._close_spill_file()
+            for handler in self.handlers:
+                handler.close()
@@ -25,9 +25,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from copy import copy, deepcopy
 from typing import Any, Generic, Literal, TypeVar, overload
 
 import numpy as np
+from typing_extensions import Self
 
 T = TypeVar('T')
 
@@ -71,6 +73,20 @@ class _InstanceValueDescriptor(Generic[T]):
             return param.value
         return None
 
+    def _clone(self) -> Self:
+        """Return a copy holding its own value, which is much cheaper than a deep copy.
+
+        The configuration (name, units, choices...) is shared with the original, whereas
+        the value and nested parameters are copied.
+        """
+        clone = copy(self)
+        for name, attribute in vars(self).items():
+            if isinstance(attribute, _InstanceValueDescriptor):
+                setattr(clone, name, attribute._clone())
+            elif name == "_value":
+                clone._value = deepcopy(attribute)  # type: ignore[attr-defined]
+        return clone
+
     def __set__(self, obj: object, value: T | None) -> None:
         """Assign the value to the backing parameter or raw instance storage.
 
@@ -22,25 +22,61 @@
 # THE SOFTWARE.
 #
 
+from __future__ import annotations
+
 import importlib.util
 import inspect
 import logging
+import os
 import re
 import sys
-from copy import deepcopy
-from typing import Any
+from functools import lru_cache
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, NamedTuple
 from warnings import warn
 
-from pint import UndefinedUnitError, facets
-
-from pymeasure.instruments._strenum import StrEnum
-from pymeasure.units import ureg
+from pymeasure import units as _units
+from pymeasure._lazy import lazy_module
+from pymeasure._strenum import StrEnum
 
 from .parameters import Measurable, Metadata, Parameter
 
+if TYPE_CHECKING:
+    import pint
+    from pint.facets.plain import PlainUnit
+else:
+    # Imported on first use, as it is slow to import
+    pint = lazy_module("pint")
+
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+#: Modules imported to restore pickled procedures, with the modification time of their file.
+_procedure_modules: dict[str, tuple[int | None, ModuleType]] = {}
+
+
+class _ProcedureMembers(NamedTuple):
+    """Parameters, metadata and measurables of a procedure class."""
+    parameters: dict[str, Parameter]
+    metadata: dict[str, Metadata]
+    measure: dict[str, str]
+
+
+@lru_cache(maxsize=1024)
+def _column_units(column: str) -> PlainUnit | None:
+    """Return the units in parentheses of the `column` header or None."""
+    match = re.search(r"\((?P<units>[\w/\(\)\*\t]+)\)", column)
+    if match is None:
+        return None
+    try:
+        return _units.ureg.Quantity(match.groupdict()['units']).units
+    except pint.UndefinedUnitError:
+        raise ValueError(
+            f"Column \"{column}\" with unit \"{match.groupdict()['units']}\""
+            " is not defined in Pint registry. Check procedure "
+            "DATA_COLUMNS contains valid Pint units.")
+
 
 class ProcedureStatus(StrEnum):
     FINISHED = "Finished"
@@ -75,6 +111,7 @@ class Procedure:
 
     status: ProcedureStatus
     _parameters: dict[str, Parameter] = {}
+    _members_cache: _ProcedureMembers
 
     def __init__(self, **kwargs):
         self.status = ProcedureStatus.QUEUED
@@ -87,7 +124,7 @@ class Procedure:
         self.gen_measurement()
 
     @staticmethod
-    def parse_columns(columns: list[str]) -> dict[str, facets.plain.PlainUnit]:
+    def parse_columns(columns: list[str]) -> dict[str, PlainUnit]:
         """Get columns with any units in parentheses.
         For each column, if there are matching parentheses containing text
         with no spaces, parse the value between the parentheses as a Pint unit. For example,
@@ -99,28 +136,18 @@ class Procedure:
         :type record: dict
         :return: Dictionary of columns with Pint units.
         """
-        units_pattern = r"\((?P<units>[\w/\(\)\*\t]+)\)"
         units = {}
         for column in columns:
-            match = re.search(units_pattern, column)
-            if match:
-                try:
-                    units[column] = ureg.Quantity(match.groupdict()['units']).units
-                except UndefinedUnitError:
-                    raise ValueError(
-                        f"Column \"{column}\" with unit \"{match.groupdict()['units']}\""
-                        " is not defined in Pint registry. Check procedure "
-                        "DATA_COLUMNS contains valid Pint units.")
+            column_units = _column_units(column)
+            if column_units is not None:
+                units[column] = column_units
         return units
 
     def gen_measurement(self) -> None:
         """Create MEASURE and DATA_COLUMNS variables for get_datapoint method."""
         # TODO: Refactor measurable-s implementation to be consistent with parameters
 
-        self.MEASURE = {}
-        for item, parameter in inspect.getmembers(self.__class__):
-            if isinstance(parameter, Measurable) and parameter.measure:
-                self.MEASURE.update({parameter.name: item})
+        self.MEASURE = dict(self._members().measure)
 
         if not self.DATA_COLUMNS:
             self.DATA_COLUMNS = Measurable.DATA_COLUMNS
@@ -144,9 +171,28 @@ class Procedure:
         """
         if not self._parameters:
             self._parameters = {}
-        for item, parameter in inspect.getmembers(self.__class__):
-            if isinstance(parameter, Parameter):
-                self._parameters[item] = deepcopy(parameter)
+        for item, parameter in self._members().parameters.items():
+            self._parameters[item] = parameter._clone()
+
+    @classmethod
+    def _members(cls) -> _ProcedureMembers:
+        """Collect the Parameter, Metadata and Measurable objects of the class once.
+
+        The result is cached on the class itself, such that instantiating a procedure
+        does not have to inspect the class again.
+        """
+        members = cls.__dict__.get("_members_cache")
+        if members is None:
+            members = _ProcedureMembers({}, {}, {})
+            for item, member in inspect.getmembers(cls):
+                if isinstance(member, Parameter):
+                    members.parameters[item] = member
+                elif isinstance(member, Metadata):
+                    members.metadata[item] = member
+                elif isinstance(member, Measurable) and member.measure:
+                    members.measure[member.name] = item
+            cls._members_cache = members
+        return members
 
     def parameters_are_set(self) -> bool:
         """ Returns True if all parameters are set """
@@ -211,11 +257,9 @@ class Procedure:
         them in a meta dictionary so that the actual values can be set and used
         in their stead
         """
-        self._metadata: dict[str, Metadata] = {}
-
-        for item, metadata in inspect.getmembers(self.__class__):
-            if isinstance(metadata, Metadata):
-                self._metadata[item] = deepcopy(metadata)
+        self._metadata: dict[str, Metadata] = {
+            item: metadata._clone() for item, metadata in self._members().metadata.items()
+        }
 
     def evaluate_metadata(self) -> None:
         """ Evaluates all Metadata objects, fixing their values to the current value
@@ -240,11 +284,9 @@ class Procedure:
     @classmethod
     def placeholder_names(cls) -> list[str]:
         """ Collect the names of all eligible placeholders (parameters & metadata)"""
-        placeholders: list[str] = []
-        for _, item in inspect.getmembers(cls):
-            if isinstance(item, (Metadata, Parameter)):
-                placeholders.append(item.name)
-
+        members = cls._members()
+        placeholders = [item.name for item in members.parameters.values()]
+        placeholders += [item.name for item in members.metadata.values()]
         return list(set(placeholders))
 
     def startup(self) -> None:
@@ -318,39 +360,69 @@ class UnknownProcedure(Procedure):
         raise NotImplementedError("UnknownProcedure can not be run")
 
 
+def _import_procedure_module(name: str, file: str | None) -> ModuleType:
+    """Return the module `name` defined in `file` to restore a pickled procedure.
+
+    An already imported module of the same file is reused and the file is executed again only
+    if it was modified since it was imported.
+    """
+    if file is None:
+        return import_module(name)
+    path = os.path.abspath(file)
+    try:
+        mtime: int | None = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _procedure_modules.get(path)
+    if cached is not None and mtime in (cached[0], None):
+        return cached[1]
+    module = sys.modules.get(name)
+    module_file = getattr(module, "__file__", None)
+    if (cached is None and module is not None and module_file is not None
+            and os.path.abspath(module_file) == path):
+        _procedure_modules[path] = (mtime, module)
+        return module
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ValueError(f"Specifications cannot be loaded for module '{name}' at '{file}'.")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    _procedure_modules[path] = (mtime, module)
+    return module
+
+
+class _ProcedureState(NamedTuple):
+    """Compact pickle state of a procedure: the location of its class and its parameters."""
+    module: str
+    file: str | None
+    name: str
+    parameters: dict[str, Any]
+
+    @classmethod
+    def from_procedure(cls, procedure: Procedure) -> _ProcedureState:
+        module = sys.modules[procedure.__module__]
+        return cls(module.__name__, getattr(module, "__file__", None),
+                   procedure.__class__.__name__, procedure.parameter_values())
+
+    def restore(self) -> Procedure:
+        """Return a new procedure with the pickled parameter values."""
+        module = _import_procedure_module(self.module, self.file)
+        procedure: Procedure = getattr(module, self.name)()
+        procedure.set_parameters(self.parameters)
+        return procedure
+
+
 class ProcedureWrapper:
 
     def __init__(self, procedure: Procedure):
         self.procedure = procedure
 
     def __getstate__(self) -> dict[str, Any]:
-        # Get all information needed to reconstruct procedure
-        self._parameters = self.procedure.parameter_values()
-        self._class = self.procedure.__class__.__name__
-        module = sys.modules[self.procedure.__module__]
-        self._package = module.__package__
-        self._module = module.__name__
-        self._file = module.__file__
-
         state = self.__dict__.copy()
-        del state['procedure']
+        state['procedure'] = _ProcedureState.from_procedure(self.procedure)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.__dict__.update(state)
-
-        # Restore the procedure
-        spec = importlib.util.spec_from_file_location(self._module, self._file)
-        module = importlib.util.module_from_spec(spec)  # type: ignore[reportArgumentType]
-        sys.modules[self._module] = module
-        spec.loader.exec_module(module)
-        cls = getattr(module, self._class)
-
-        self.procedure: Procedure = cls()
-        self.procedure.set_parameters(self._parameters)
-
-        del self._parameters
-        del self._class
-        del self._package
-        del self._module
-        del self._file
+        self.procedure = state['procedure'].restore()
@@ -22,23 +22,36 @@
 # THE SOFTWARE.
 #
 
-import importlib.util
+from __future__ import annotations
+
+import io
 import logging
 import os
 import re
-import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from importlib import import_module
 from string import Formatter
-from typing import Any, TypeVar, cast, overload
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast, overload
+
+import numpy as np
 
-import pandas as pd
-import pint
+from pymeasure import units as _units
+from pymeasure._lazy import lazy_module
 
-from pymeasure.units import ureg
+from .procedure import Procedure, ProcedureStatus, UnknownProcedure, _ProcedureState
 
-from .procedure import Procedure, ProcedureStatus, UnknownProcedure
+if TYPE_CHECKING:
+    import pandas as pd
+    import pint
+    from pint.facets.plain import PlainUnit
+else:
+    # Imported on first use, as they are slow to import
+    pd = lazy_module("pandas")
+    pint = lazy_module("pint")
 
 P = TypeVar("P", bound=Procedure)
 
@@ -130,18 +143,45 @@ def unique_filename(
     return filename
 
 
+#: A number followed by units, e.g. "-1.5e3 mV", matched to avoid parsing it with pint.
+_NUMBER_WITH_UNITS = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*")
+
+
+@lru_cache(maxsize=256)
+def _parse_units(units: str) -> PlainUnit:
+    return _units.ureg.Unit(units)
+
+
 class CSVFormatter(logging.Formatter):
     """csv Formatter of data results for a given list of columns (=header).
 
+    The units of the columns are determined with the first record. Conversion factors
+    between units are cached, such that formatting is fast for high data rates.
+    Warnings about values, which cannot be converted, are limited to one per column
+    every :attr:`WARNING_INTERVAL` seconds.
+
     :param columns: list of column names.
     :param delimiter: delimiter between columns.
     """
 
+    #: Minimum time in seconds between two warnings about the same column.
+    WARNING_INTERVAL = 10.0
+
     def __init__(self, columns: list[str], delimiter: str = ","):
         super().__init__()
         self.columns = columns
         self.units = Procedure.parse_columns(columns)
         self.delimiter = delimiter
+        self._plan: list[tuple[str, PlainUnit | None]] | None = None
+        self._factors: dict[tuple[PlainUnit, PlainUnit], float | None] = {}
+        self._warnings: dict[str, tuple[float, int]] = {}
+
+    def _get_plan(self) -> list[tuple[str, PlainUnit | None]]:
+        """Return the columns with their units, determined with the first record."""
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = [(x, self.units.get(x, None)) for x in self.columns]
+        return plan
 
     def format(self, record: dict[str, Any]) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
         """Formats a record as csv.
@@ -150,53 +190,177 @@ class CSVFormatter(logging.Formatter):
         :return: a string
         """
         line = []
-        for x in self.columns:
+        for x, units in self._get_plan():
             value = record.get(x, float("nan"))
-            if isinstance(value, (float, int, Decimal)) and type(value) is not bool:
+            if type(value) is float or type(value) is int:
                 line.append(f"{value}")
             else:
-                units = self.units.get(x, None)
-                if units is not None:
-                    if isinstance(value, str):
-                        try:
-                            value = ureg.Quantity(value)
-                        except pint.UndefinedUnitError:
-                            log.warning(
-                                f"Value {value} for column {x} cannot be parsed to"
-                                f" unit {units}.")
-                    if isinstance(value, pint.Quantity):
-                        try:
-                            line.append(f"{value.m_as(units)}")
-                        except pint.DimensionalityError:
-                            line.append("nan")
-                            log.warning(
-                                f"Value {value} for column {x} does not have the "
-                                f"right unit {units}.")
-                    elif isinstance(value, bool):
-                        line.append("nan")
-                        log.warning(
-                            f"Boolean for column {x} does not have unit {units}.")
-                    else:
-                        line.append("nan")
-                        log.warning(
-                            f"Value {value} for column {x} does not have the right"
-                            f" type for unit {units}.")
-                else:
-                    if isinstance(value, pint.Quantity):
-                        if value.units == ureg.dimensionless:
-                            line.append(f"{value.magnitude}")
-                        else:
-                            self.units[x] = value.to_base_units().units
-                            line.append(f"{value.m_as(self.units[x])}")
-                            log.info(f"Column {x} units was set to {self.units[x]}")
-                    else:
-                        line.append(f"{value}")
+                line.append(self._format_value(x, units, value))
         return self.delimiter.join(line)
 
+    def format_many(self, columns: dict[str, Any]) -> list[str]:
+        """Format many records given as columns, for example numpy arrays, as csv lines.
+
+        Numeric arrays and :code:`pint.Quantity` arrays are converted at once. Scalar values
+        are repeated for all lines.
+
+        .. code-block:: python
+
+            lines = formatter.format_many({"Voltage (V)": voltages, "Current (A)": currents})
+
+        :param columns: Dictionary of column names and their values.
+        :return: list of strings, one for each record.
+        :raises ValueError: if the columns have different lengths.
+        """
+        formatted = [self._format_column(x, units, columns.get(x, float("nan")))
+                     for x, units in self._get_plan()]
+        try:
+            formatted = np.broadcast_arrays(*formatted)
+        except ValueError:
+            raise ValueError("The columns have different lengths.") from None
+        return [self.delimiter.join(row) for row in zip(*map(np.atleast_1d, formatted))]
+
+    def _format_value(self, column: str, units: PlainUnit | None, value: Any) -> str:
+        """Format a single value of the `column` having `units`."""
+        if isinstance(value, (float, int, Decimal)) and type(value) is not bool:
+            return f"{value}"
+        if units is not None:
+            if isinstance(value, str):
+                converted = self._convert_string(column, units, value)
+                if converted is not None:
+                    return converted
+                try:
+                    value = _units.ureg.Quantity(value)
+                except pint.UndefinedUnitError:
+                    self._warn(column, f"Value {value} for column {column} cannot be parsed to"
+                                       f" unit {units}.")
+            if isinstance(value, pint.Quantity):
+                return f"{self._convert(column, units, value.magnitude, value.units)}"
+            elif isinstance(value, bool):
+                self._warn(column, f"Boolean for column {column} does not have unit {units}.")
+            else:
+                self._warn(column, f"Value {value} for column {column} does not have the right"
+                                   f" type for unit {units}.")
+            return "nan"
+        if isinstance(value, pint.Quantity):
+            if value.units == _units.ureg.dimensionless:
+                return f"{value.magnitude}"
+            units = self._set_units(column, value.units)
+            return f"{self._convert(column, units, value.magnitude, value.units)}"
+        return f"{value}"
+
+    def _format_column(self, column: str, units: PlainUnit | None, values: Any) -> np.ndarray:
+        """Format the `values` of the `column` having `units` as an array of strings."""
+        if isinstance(values, pint.Quantity):
+            magnitude = np.asarray(values.magnitude)
+            if units is None and values.units != _units.ureg.dimensionless:
+                units = self._set_units(column, values.units)
+            if units is not None:
+                magnitude = np.asarray(self._convert(column, units, magnitude, values.units))
+        else:
+            try:
+                magnitude = np.asarray(values)
+            except ValueError:  # e.g. a list of quantities and strings
+                magnitude = np.fromiter(values, dtype=object)
+            if units is not None and magnitude.dtype.kind == "b":
+                self._warn(column, f"Boolean for column {column} does not have unit {units}.")
+                return np.full(magnitude.shape, "nan")
+        if magnitude.dtype.kind in "biuf":
+            return magnitude.astype(str)
+        return np.array([self._format_value(column, units, value) for value in magnitude.flat],
+                        dtype=str).reshape(magnitude.shape)
+
+    def _convert_string(self, column: str, units: PlainUnit, value: str) -> str | None:
+        """Convert a string of a number with units without constructing a quantity.
+
+        :return: the converted value or None, if the string has to be parsed by pint.
+        """
+        match = _NUMBER_WITH_UNITS.fullmatch(value)
+        if match is None:
+            return None
+        number, unit_string = match.groups()
+        try:
+            source = _parse_units(unit_string)
+        except Exception:  # noqa: BLE001
+            return None
+        try:
+            magnitude: float = int(number)
+        except ValueError:
+            magnitude = float(number)
+        return f"{self._convert(column, units, magnitude, source)}"
+
+    def _convert(self, column: str, units: PlainUnit, magnitude: Any, source: PlainUnit) -> Any:
+        """Convert the `magnitude` from `source` to `units` with a cached factor.
+
+        :return: the converted magnitude or nan, if the units are incompatible.
+        """
+        key = (source, units)
+        try:
+            factor = self._factors[key]
+        except KeyError:
+            try:
+                factor = self._factors[key] = self._conversion_factor(source, units)
+            except pint.DimensionalityError:
+                self._warn(column, f"Value {_units.ureg.Quantity(magnitude, source)} for column "
+                                   f"{column} does not have the right unit {units}.")
+                return np.full(np.shape(magnitude), np.nan) if np.ndim(magnitude) else "nan"
+        if factor is None:
+            return _units.ureg.Quantity(magnitude, source).m_as(units)
+        return magnitude * factor
+
+    @staticmethod
+    def _conversion_factor(source: PlainUnit, units: PlainUnit) -> float | None:
+        """Return the factor converting magnitudes from `source` to `units`.
+
+        :return: 1 for equal units, the factor or None, if the conversion has an offset.
+        """
+        if source == units:
+            return 1
+        factor = _units.ureg.Quantity(1.0, source).m_as(units)
+        if _units.ureg.Quantity(0.0, source).m_as(units) != 0:
+            return None
+        return factor
+
+    def _set_units(self, column: str, units: PlainUnit) -> PlainUnit:
+        """Set the units of a column without units to the base units of `units`."""
+        self.units[column] = base_units = _units.ureg.Quantity(1, units).to_base_units().units
+        self._plan = None
+        log.info(f"Column {column} units was set to {base_units}")
+        return base_units
+
+    def _warn(self, column: str, message: str) -> None:
+        """Log a warning, at most one per column every :attr:`WARNING_INTERVAL` seconds."""
+        now = time.monotonic()
+        last, suppressed = self._warnings.get(column, (-float("inf"), 0))
+        if now - last < self.WARNING_INTERVAL:
+            self._warnings[column] = last, suppressed + 1
+            return
+        if suppressed:
+            message += f" {suppressed} similar warnings were suppressed."
+        log.warning(message)
+        self._warnings[column] = now, 0
+
     def format_header(self) -> str:
         return self.delimiter.join(self.columns)
 
 
+class ResultsHeader(NamedTuple):
+    """Header of a data file, see :meth:`Results.read_header`."""
+    #: Header text with the procedure, parameters and metadata.
+    text: str
+    #: Number of header lines.
+    count: int
+    #: Column labels.
+    labels: list[str]
+    #: Position of the first data line in bytes.
+    data_offset: int
+
+
+#: Maximum number of cached headers of data files.
+HEADER_CACHE_SIZE = 256
+_header_cache: OrderedDict[tuple[str, int, int], ResultsHeader] = OrderedDict()
+
+
 class Results:
     """The Results class provides a convenient interface to reading and
     writing data in connection with a :class:`.Procedure` object.
@@ -237,8 +401,11 @@ class Results:
         self.data_filename = data_filename
         self.data_filenames = data_filenames
 
+        self._data: pd.DataFrame | None = None
+        #: Sample of the data for a quick preview, see :meth:`load`, or None.
+        self.preview: pd.DataFrame | None = None
         if os.path.exists(data_filename):  # Assume header is already written
-            self.reload()
+            # The data is read with the first access of `data`
             self.procedure.status = ProcedureStatus.FINISHED
             # TODO: Correctly store and retrieve status
         else:
@@ -246,47 +413,25 @@ class Results:
                 with open(filename, 'w', encoding=Results.ENCODING) as f:
                     f.write(self.header())
                     f.write(self.labels())
-            self._data: pd.DataFrame | None = None
 
     def __getstate__(self) -> dict[str, Any]:
-        # Get all information needed to reconstruct procedure
-        self._parameters = self.procedure.parameter_values()
-        self._class = self.procedure.__class__.__name__
-        module = sys.modules[self.procedure.__module__]
-        self._package = module.__package__
-        self._module = module.__name__
-        self._file = module.__file__
-
+        # The procedure is restored from its class and parameter values, and the data is
+        # read again from the data file
         state = self.__dict__.copy()
-        del state['procedure']
-        del state['procedure_class']
+        for key in ('procedure', 'procedure_class', 'parameters', '_data', 'preview'):
+            del state[key]
+        state['_procedure'] = _ProcedureState.from_procedure(self.procedure)
+        state['_last_file_size'] = 0
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
+        state = state.copy()
+        self.procedure = state.pop('_procedure').restore()
         self.__dict__.update(state)
-
-        # Restore the procedure
-        spec = importlib.util.spec_from_file_location(self._module, self._file)
-        if spec is None:
-            raise ValueError(
-                f"Specifications cannot be loaded for module '{self._module}' at '{self._file}'."
-            )
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[self._module] = module
-        if spec.loader is not None:
-            spec.loader.exec_module(module)
-        cls = cast(type[Procedure], getattr(module, self._class))
-
-        self.procedure = cls()
-        self.procedure.set_parameters(self._parameters)
-
-        self.procedure_class = cls
-
-        del self._parameters
-        del self._class
-        del self._package
-        del self._module
-        del self._file
+        self.procedure_class = self.procedure.__class__
+        self.parameters = self.procedure.parameter_objects()
+        self._data = None
+        self.preview = None
 
     def header(self) -> str:
         """Return a text header to accompany a datafile so that the procedure can be reconstructed.
@@ -429,26 +574,134 @@ class Results:
         return procedure
 
     @staticmethod
-    def load(data_filename: str, procedure_class: type[Procedure] | None = None) -> "Results":
+    def read_header(data_filename: str) -> ResultsHeader:
+        """Return the header of a data file without reading the data.
+
+        The headers are cached, such that reading the header of an unchanged file again is
+        instant.
+
+        :param data_filename: Name of the data file.
+        """
+        stat = os.stat(data_filename)
+        key = (os.path.abspath(data_filename), stat.st_mtime_ns, stat.st_size)
+        header = _header_cache.get(key)
+        if header is not None:
+            _header_cache.move_to_end(key)
+            return header
+        text = ""
+        count = 0
+        offset = 0
+        labels: list[str] = []
+        comment = Results.COMMENT.encode(Results.ENCODING)
+        with open(data_filename, "rb") as f:
+            for raw_line in f:
+                offset += len(raw_line)
+                line = raw_line.decode(Results.ENCODING)
+                if raw_line.startswith(comment):
+                    text += line.strip('\t\v\n\r\f') + Results.LINE_BREAK
+                    count += 1
+                else:
+                    labels = line.rstrip("\r\n").split(Results.DELIMITER)
+                    break
+        header = ResultsHeader(text[:-1], count, labels, offset)
+        _header_cache[key] = header
+        if len(_header_cache) > HEADER_CACHE_SIZE:
+            _header_cache.popitem(last=False)
+        return header
+
+    @staticmethod
+    def load(
+        data_filename: str,
+        procedure_class: type[Procedure] | None = None,
+        preview_points: int | None = None,
+    ) -> Results:
         """ Return a Results object with the associated Procedure object and
         data.
+
+        Only the header is read, the data is read with the first access of :attr:`data`.
+
+        :param data_filename: Name of the data file.
+        :param procedure_class: Procedure class of the data, None to import it according to
+            the header.
+        :param preview_points: If given, :attr:`preview` contains about this number of rows
+            distributed evenly over the file (see :meth:`sample`), for a quick preview of
+            large files. :attr:`data` still contains all rows.
         """
-        header = ""
-        header_read = False
-        header_count = 0
-        with open(data_filename, encoding=Results.ENCODING) as f:
-            while not header_read:
-                line = f.readline()
-                if line.startswith(Results.COMMENT):
-                    header += line.strip('\t\v\n\r\f') + Results.LINE_BREAK
-                    header_count += 1
-                else:
-                    header_read = True
-        procedure = Results.parse_header(header[:-1], procedure_class)
+        header = Results.read_header(data_filename)
+        procedure = Results.parse_header(header.text, procedure_class)
         results = Results(procedure, data_filename)
-        results._header_count = header_count
+        results._header_count = header.count
+        if preview_points is not None:
+            results.preview = results.sample(preview_points)
         return results
 
+    def head(self, rows: int = 5) -> pd.DataFrame:
+        """Read the first `rows` rows of the data file.
+
+        :param rows: Number of rows.
+        """
+        return pd.read_csv(self.data_filename, comment=Results.COMMENT, nrows=rows,
+                           encoding=Results.ENCODING)
+
+    def tail(self, rows: int = 5, block_size: int = 65536) -> pd.DataFrame:
+        """Read the last `rows` rows of the data file without reading the whole file.
+
+        :param rows: Number of rows.
+        :param block_size: Number of bytes read at once from the end of the file.
+        """
+        header = Results.read_header(self.data_filename)
+        with open(self.data_filename, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            block = b""
+            start = end
+            while start > header.data_offset and block.count(b"\n") <= rows:
+                start = max(header.data_offset, start - block_size)
+                f.seek(start)
+                block = f.read(end - start)
+        lines = block.splitlines(keepends=True)
+        if start > header.data_offset:
+            lines = lines[1:]  # Incomplete first line
+        return self._parse_lines(lines[-rows:] if rows > 0 else [], header.labels)
+
+    def sample(self, points: int = 1000) -> pd.DataFrame:
+        """Read about `points` rows distributed evenly over the data file.
+
+        Only the sampled rows are read, such that a preview of large files is fast.
+        The last complete row is always included.
+
+        :param points: Number of rows.
+        """
+        header = Results.read_header(self.data_filename)
+        lines: list[bytes] = []
+        with open(self.data_filename, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            end = header.data_offset
+            for position in np.linspace(header.data_offset, size, points, endpoint=False):
+                position = int(position)
+                if position < end:
+                    continue
+                f.seek(position)
+                if position > header.data_offset:
+                    f.readline()  # Skip the rest of the line
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break  # Line is not complete yet
+                lines.append(line)
+                end = f.tell()
+            last = self.tail(1, block_size=4096)
+        data = self._parse_lines(lines, header.labels)
+        if len(last) and (len(data) == 0 or not last.iloc[-1].equals(data.iloc[-1])):
+            data = pd.concat([data, last], ignore_index=True, sort=False)
+        return data
+
+    @staticmethod
+    def _parse_lines(lines: list[bytes], labels: list[str]) -> pd.DataFrame:
+        """Return a data frame of the data `lines` of a file."""
+        if not lines:
+            return pd.DataFrame(columns=labels)  # pyright: ignore[reportArgumentType]
+        return pd.read_csv(io.BytesIO(b"".join(lines)), comment=Results.COMMENT, header=None,
+                           names=labels, encoding=Results.ENCODING)
+
     @property
     def data(self):
         # Need to update header count for correct referencing
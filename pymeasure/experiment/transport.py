@@ -0,0 +1,115 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Wire format of the messages, which a :class:`~pymeasure.experiment.workers.Worker`
+publishes over ZMQ.
+
+A message consists of several frames: the topic, a JSON header and, depending on the
+header, further frames. Records which JSON represents exactly (numbers, strings and
+dictionaries of those) are contained in the header. Dictionaries of numpy arrays, e.g.
+'batch results', carry the dtype and shape of each array in the header, followed by the
+raw data of each array as a separate frame, which is sent without copying and received
+with :func:`numpy.frombuffer`. Any other object is pickled with cloudpickle.
+"""
+
+import json
+from typing import Any
+
+import numpy as np
+
+from pymeasure._lazy import lazy_module
+
+try:
+    # Imported on first use, as it is slow to import
+    cloudpickle = lazy_module("cloudpickle")
+except ImportError:
+    cloudpickle = None
+
+JSON_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_json(value: Any) -> bool:
+    # Exact types only, e.g. an IntEnum or a numpy scalar would lose its type
+    return type(value) in JSON_TYPES
+
+
+def serialize(topic: str, record: Any) -> list:
+    """Return the frames of a message of `topic` with `record`.
+
+    The frames of numpy arrays refer to the memory of the arrays, which must not be
+    modified until the message is sent.
+    """
+    if _is_json(record):
+        return [topic.encode(), json.dumps({"type": "json", "value": record}).encode()]
+    if isinstance(record, dict) and all(isinstance(key, str) for key in record):
+        if all(_is_json(value) for value in record.values()):
+            return [topic.encode(), json.dumps({"type": "json", "value": record}).encode()]
+        values = {}
+        arrays = []
+        buffers = []
+        for key, value in record.items():
+            if _is_json(value):
+                values[key] = value
+            elif isinstance(value, np.ndarray | np.generic) and not value.dtype.hasobject:
+                # The shape before the conversion, which returns scalars with shape (1,)
+                shape = np.shape(value)
+                array = np.ascontiguousarray(value)
+                arrays.append({"key": key, "dtype": array.dtype.str, "shape": shape,
+                               "scalar": isinstance(value, np.generic)})
+                buffers.append(array.data if array.size else b"")
+            else:
+                break
+        else:
+            header = {"type": "arrays", "values": values, "arrays": arrays,
+                      "keys": list(record)}
+            return [topic.encode(), json.dumps(header).encode(), *buffers]
+    if cloudpickle is None:
+        raise ModuleNotFoundError("cloudpickle is required to send arbitrary objects.")
+    return [topic.encode(), json.dumps({"type": "pickle"}).encode(), cloudpickle.dumps(record)]
+
+
+def deserialize(frames: list) -> tuple[str, Any]:
+    """Return the topic and the record of a message from its `frames`.
+
+    The frames may be bytes or :class:`zmq.Frame` objects. Arrays refer to the memory of
+    the frames and are read-only.
+    """
+    frames = [getattr(frame, "buffer", frame) for frame in frames]
+    topic = bytes(frames[0]).decode()
+    header = json.loads(bytes(frames[1]))
+    kind = header["type"]
+    if kind == "json":
+        return topic, header["value"]
+    elif kind == "arrays":
+        values = header["values"]
+        for description, buffer in zip(header["arrays"], frames[2:]):
+            array = np.frombuffer(buffer, dtype=description["dtype"])
+            array = array.reshape(description["shape"])
+            values[description["key"]] = array[()] if description["scalar"] else array
+        return topic, {key: values[key] for key in header["keys"]}
+    elif kind == "pickle":
+        if cloudpickle is None:
+            raise ModuleNotFoundError("cloudpickle is required to receive arbitrary objects.")
+        return topic, cloudpickle.loads(frames[2])
+    raise ValueError(f"Unknown message type {kind!r}.")
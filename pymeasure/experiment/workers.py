@@ -28,31 +28,60 @@ import time
 import traceback
 from collections.abc import Sequence
 from multiprocessing import Queue
+from queue import Queue as ThreadQueue
+from threading import Thread
 from typing import Any
 
 import numpy as np
 
+from .._lazy import lazy_module
 from ..thread import StoppableThread
+from .catalog import ResultsCatalog
 from .listeners import Recorder
 from .procedure import ProcedureStatus
 from .results import Results
+from .transport import serialize
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 try:
-    import cloudpickle
-    import zmq
+    # Imported on first use, as it is slow to import
+    zmq = lazy_module("zmq")
 except ImportError:
     zmq = None
-    cloudpickle = None
-    log.warning("ZMQ and cloudpickle are required for TCP communication")
+    log.warning("ZMQ is required for TCP communication")
 
 
 class Worker(StoppableThread):
     """ Worker runs the procedure and emits information about
     the procedure and its status over a ZMQ TCP port. In a child
     thread, a Recorder is run to write the results to
+
+    If `catalog` is True, the run is recorded in the
+    :class:`~pymeasure.experiment.catalog.ResultsCatalog` of the data directory.
+
+    The :class:`~pymeasure.experiment.listeners.Recorder` writes the results in its own
+    thread. At most `recorder_queue_size` records wait to be written (0 for no limit),
+    further records are handled according to the `recorder_overflow` policy ("block",
+    "drop" or "spill", see :class:`~pymeasure.experiment.listeners.Recorder`).
+
+    The messages are published in the format of :mod:`pymeasure.experiment.transport`.
+    `hwm` sets the high-water mark of the publisher, i.e. the number of messages queued
+    for each subscriber before further messages are dropped. If `conflate` is True, at
+    most one 'progress' message is published per `conflate_interval` in seconds (besides
+    0 and 100 %), as only the latest progress matters. 'status' messages are always
+    published, as every status change is relevant.
+
+    By default, the worker waits 0.3 s after opening the ZMQ port, such that listeners
+    may connect. If the number of `subscribers` is given, the worker waits instead until
+    that many listeners subscribed, at most `subscribe_timeout` seconds, before it starts
+    the procedure. With 0 subscribers, it starts at once.
+
+    A `persistent` worker keeps running after the procedure, with its ZMQ publisher,
+    recorder thread and monitor queue, and runs the procedures of further results
+    passed to :meth:`submit` one after the other, until :meth:`close` is called. This
+    avoids the setup of a worker for each of many short procedures.
     """
 
     def __init__(
@@ -61,17 +90,38 @@ class Worker(StoppableThread):
         log_queue: Queue | None = None,
         log_level: int = logging.INFO,
         port: int | None = None,
+        catalog: bool = False,
+        recorder_queue_size: int = 10000,
+        recorder_overflow: str = "block",
+        hwm: int | None = None,
+        conflate: bool = False,
+        conflate_interval: float = 0.1,
+        subscribers: int | None = None,
+        subscribe_timeout: float = 5,
+        persistent: bool = False,
     ):
         super().__init__()
 
         self.port = port
+        self.catalog = catalog
         if not isinstance(results, Results):
             raise TypeError("Invalid Results object during Worker construction")
+        if recorder_overflow not in Recorder.overflow_policies:
+            raise ValueError(f"Invalid recorder overflow policy {recorder_overflow!r}.")
         self.results = results
         self.results.procedure.check_parameters()
         self.results.procedure.status = ProcedureStatus.QUEUED
 
-        self.recorder_queue = Queue()
+        self.recorder_queue = ThreadQueue(maxsize=recorder_queue_size)
+        self.recorder_overflow = recorder_overflow
+        self.conflate = conflate
+        self.conflate_interval = conflate_interval
+        self._last_progress = -float("inf")
+        self.subscribers = subscribers
+        self.subscribe_timeout = subscribe_timeout
+        self._subscriptions = 0
+        self.persistent = persistent
+        self._results_queue: ThreadQueue[Results | None] = ThreadQueue()
 
         self.monitor_queue = Queue()
         if log_queue is None:
@@ -92,11 +142,19 @@ class Worker(StoppableThread):
             try:
                 self.context = zmq.Context()
                 log.debug(f"Worker ZMQ Context: {self.context!r}")
-                self.publisher = self.context.socket(zmq.PUB)
+                if subscribers is None:
+                    self.publisher = self.context.socket(zmq.PUB)
+                else:
+                    # XPUB receives the subscriptions of the listeners
+                    self.publisher = self.context.socket(zmq.XPUB)
+                    self.publisher.setsockopt(zmq.XPUB_VERBOSE, 1)
+                if hwm is not None:
+                    self.publisher.setsockopt(zmq.SNDHWM, hwm)
                 self.publisher.bind(f'tcp://*:{self.port}')
                 log.info(f"Worker connected to tcp://*:{self.port}")
-                # wait so that the socket will be ready before starting to emit messages
-                time.sleep(0.3)
+                if subscribers is None:
+                    # wait so that the socket will be ready before starting to emit messages
+                    time.sleep(0.3)
             except Exception:
                 log.exception("Couldn't establish ZMQ publisher!")
                 self.context = None
@@ -115,12 +173,9 @@ class Worker(StoppableThread):
         log.debug("Emitting message: %s %s", topic, record)
 
         try:
-            if self.publisher is not None:
-                self.publisher.send_serialized(
-                    record,
-                    serialize=lambda rec: (topic.encode(), cloudpickle.dumps(rec)),
-                )
-        except (NameError, AttributeError):
+            if self.publisher is not None and not self._conflated(topic, record):
+                self.publisher.send_multipart(serialize(topic, record), copy=False)
+        except (NameError, AttributeError, ModuleNotFoundError):
             pass  # No dumps defined
         if topic == 'results':
             self.handle_record(record)
@@ -129,8 +184,18 @@ class Worker(StoppableThread):
         elif topic == 'status' or topic == 'progress':
             self.monitor_queue.put((topic, record))
 
+    def _conflated(self, topic: str, record: Any) -> bool:
+        """ Return True, if a progress message is skipped due to conflation """
+        if not self.conflate or topic != 'progress' or record in (0, 100):
+            return False
+        now = time.monotonic()
+        if now - self._last_progress < self.conflate_interval:
+            return True
+        self._last_progress = now
+        return False
+
     def handle_record(self, record: dict[str, Any]) -> None:
-        self.recorder.handle(record)  # type: ignore
+        self.recorder.put(record)
 
     def handle_batch_record(self, record: Any) -> None:
         if self._is_dictionary_of_sequences(record):
@@ -182,15 +247,78 @@ class Worker(StoppableThread):
         self.procedure.status = status
         self.emit('status', status)
 
+    def update_catalog(self) -> None:
+        """Record the results and the status of the procedure in the results catalog."""
+        if not self.catalog:
+            return
+        try:
+            with ResultsCatalog.for_file(self.results.data_filename) as catalog:
+                catalog.record(self.results, self.procedure.status)
+        except Exception:
+            log.exception("Could not record the results in the catalog")
+
+    def wait_for_subscribers(self) -> bool:
+        """ Wait until the expected number of listeners subscribed to the publisher.
+
+        :returns: True if all listeners subscribed, False after the timeout.
+        """
+        if self.publisher is None or not self.subscribers:
+            return True
+        deadline = time.monotonic() + self.subscribe_timeout
+        while self._subscriptions < self.subscribers:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.publisher.poll(round(remaining * 1000)):
+                log.warning("Only %d of %d listeners subscribed to the worker.",
+                            self._subscriptions, self.subscribers)
+                return False
+            # A subscription message starts with 1, an unsubscription with 0
+            if self.publisher.recv()[:1] == b"\x01":
+                self._subscriptions += 1
+            else:
+                self._subscriptions -= 1
+        return True
+
+    def submit(self, results: Results) -> None:
+        """ Run the procedure of `results` after the current one in a persistent worker.
+
+        A previous :meth:`stop`, which aborted the current procedure, is reset.
+        """
+        if not self.persistent:
+            raise RuntimeError("Only a persistent Worker runs further results.")
+        if not isinstance(results, Results):
+            raise TypeError("Invalid Results object submitted to the Worker")
+        results.procedure.check_parameters()
+        results.procedure.status = ProcedureStatus.QUEUED
+        self._should_stop.clear()
+        self._results_queue.put(results)
+
+    def close(self, timeout: float | None = None) -> None:
+        """ Abort the running procedure, end the worker and wait for it to finish. """
+        self._results_queue.put(None)
+        self.stop()
+        Thread.join(self, timeout)
+
     def shutdown(self) -> None:
         self.procedure.shutdown()
 
+        # Write the remaining records before the run is reported as complete
+        self.recorder.flush()
+        statistics = self.recorder.statistics()
+        log.debug("Recorder statistics: %s", statistics)
+        if statistics["dropped"]:
+            log.warning("Recorder dropped %d of %d records due to a full queue.",
+                        statistics["dropped"], statistics["received"])
+
         if self.should_stop() and self.procedure.status == ProcedureStatus.RUNNING:
             self.update_status(ProcedureStatus.ABORTED)
         elif self.procedure.status == ProcedureStatus.RUNNING:
             self.update_status(ProcedureStatus.FINISHED)
             self.emit('progress', 100.)
 
+        self.update_catalog()
+
+    def _close(self) -> None:
+        """ Stop the recorder and the communication at the end of the worker """
         self.recorder.stop()
         self.monitor_queue.put(None)
         if self.context is not None:
@@ -204,11 +332,29 @@ class Worker(StoppableThread):
     def run(self) -> None:
         log.info("Worker thread started")
 
-        self.procedure = self.results.procedure
-
-        self.recorder = Recorder(self.results, self.recorder_queue)
+        self.recorder = Recorder(self.results, self.recorder_queue,
+                                 overflow=self.recorder_overflow)
         self.recorder.start()
 
+        self.wait_for_subscribers()
+        try:
+            while True:
+                self.run_procedure()
+                if not self.persistent:
+                    break
+                results = self._results_queue.get()
+                if results is None:
+                    break
+                self.results = results
+                self.recorder.switch(results)
+        finally:
+            self._close()
+            self.stop()
+
+    def run_procedure(self) -> None:
+        """ Run the procedure of the current results. """
+        self.procedure = self.results.procedure
+
         # locals()[self.procedures_file] = __import__(self.procedures_file)
 
         # route Procedure methods & log
@@ -218,6 +364,7 @@ class Worker(StoppableThread):
 
         log.info("Worker started running an instance of %r", self.procedure.__class__.__name__)
         self.update_status(ProcedureStatus.RUNNING)
+        self.update_catalog()
         self.emit('progress', 0.)
 
         try:
@@ -235,7 +382,6 @@ class Worker(StoppableThread):
             self.handle_error()
         finally:
             self.shutdown()
-            self.stop()
 
     def __repr__(self) -> str:
         return (f"<{self.__class__.__name__}(port={self.port},"
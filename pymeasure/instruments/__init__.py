@@ -24,6 +24,7 @@
 
 from .channel import Channel
 from .common_base import IdType, InstrumentProperty, cast_or_str, identity
+from .concurrency import call_each, gather, run_concurrently, scatter
 from .generic_types import IEEE4882Mixin, SCPIMixin, SCPIUnknownMixin
 from .instrument import AdapterType, Instrument
 from .resources import find_serial_port, list_resources
@@ -30,6 +30,8 @@ documentation available on https://www.activetechnologies.it"""
 import pprint
 from collections import abc, namedtuple
 
+import numpy as np
+
 from pymeasure.instruments import Channel, Instrument, SCPIUnknownMixin
 from pymeasure.instruments.common_base import CommonBase, IdType
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
@@ -692,10 +694,10 @@ class AWG401x_AWG(AWG401x_base):
             else:
                 raise ValueError("File already exist and override is disabled")
 
-        self.adapter.write_binary_values(
+        self.write_ieee_block(
             'MMEM:DATA "' + file_name + '", 0, ',
-            data.encode("ASCII"),
-            datatype='s')
+            np.frombuffer(data.encode("ASCII"), dtype=np.uint8),
+            dtype=np.uint8)
         # HACK: Send an unuseful command to ensure the last command was
         # executed because if it is more than 1024 bytes it doesn't work
         self.wait_last()
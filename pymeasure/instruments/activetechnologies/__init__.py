@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .AWG401x import AWG401x_AFG, AWG401x_AWG
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .AWG401x import AWG401x_AFG, AWG401x_AWG
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".AWG401x": ["AWG401x_AFG", "AWG401x_AWG"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .argos import Argos
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .argos import Argos
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".argos": ["Argos"],
+})
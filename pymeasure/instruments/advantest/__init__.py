@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .advantestR624X import AdvantestR6245, AdvantestR6246
-from .advantestR3767CG import AdvantestR3767CG
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .advantestR624X import AdvantestR6245, AdvantestR6246
+    from .advantestR3767CG import AdvantestR3767CG
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".advantestR624X": ["AdvantestR6245", "AdvantestR6246"],
+    ".advantestR3767CG": ["AdvantestR3767CG"],
+})
@@ -22,20 +22,45 @@
 # THE SOFTWARE.
 #
 
-from .agilent4156 import Agilent4156
-from .agilent4284A import Agilent4284A
-from .agilent4294A import Agilent4294A
-from .agilent8257D import Agilent8257D
-from .agilent8722ES import Agilent8722ES
-from .agilent33220A import Agilent33220A
-from .agilent33500 import Agilent33500
-from .agilent33521A import Agilent33521A
-from .agilent34410A import Agilent34410A
-from .agilent34450A import Agilent34450A
-from .agilentB298x import AgilentB2981, AgilentB2983, AgilentB2985, AgilentB2987
-from .agilentB1500 import AgilentB1500
-from .agilentE4408B import AgilentE4408B
-from .agilentE4980 import AgilentE4980
-from .agilentE5062A import AgilentE5062A
-from .agilentE5270B import AgilentE5270B
-from .agilentN8975A import AgilentN8975A
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .agilent4156 import Agilent4156
+    from .agilent4284A import Agilent4284A
+    from .agilent4294A import Agilent4294A
+    from .agilent8257D import Agilent8257D
+    from .agilent8722ES import Agilent8722ES
+    from .agilent33220A import Agilent33220A
+    from .agilent33500 import Agilent33500
+    from .agilent33521A import Agilent33521A
+    from .agilent34410A import Agilent34410A
+    from .agilent34450A import Agilent34450A
+    from .agilentB298x import AgilentB2981, AgilentB2983, AgilentB2985, AgilentB2987
+    from .agilentB1500 import AgilentB1500
+    from .agilentE4408B import AgilentE4408B
+    from .agilentE4980 import AgilentE4980
+    from .agilentE5062A import AgilentE5062A
+    from .agilentE5270B import AgilentE5270B
+    from .agilentN8975A import AgilentN8975A
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".agilent4156": ["Agilent4156"],
+    ".agilent4284A": ["Agilent4284A"],
+    ".agilent4294A": ["Agilent4294A"],
+    ".agilent8257D": ["Agilent8257D"],
+    ".agilent8722ES": ["Agilent8722ES"],
+    ".agilent33220A": ["Agilent33220A"],
+    ".agilent33500": ["Agilent33500"],
+    ".agilent33521A": ["Agilent33521A"],
+    ".agilent34410A": ["Agilent34410A"],
+    ".agilent34450A": ["Agilent34450A"],
+    ".agilentB298x": ["AgilentB2981", "AgilentB2983", "AgilentB2985", "AgilentB2987"],
+    ".agilentB1500": ["AgilentB1500"],
+    ".agilentE4408B": ["AgilentE4408B"],
+    ".agilentE4980": ["AgilentE4980"],
+    ".agilentE5062A": ["AgilentE5062A"],
+    ".agilentE5270B": ["AgilentE5270B"],
+    ".agilentN8975A": ["AgilentN8975A"],
+})
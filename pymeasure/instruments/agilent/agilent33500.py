@@ -296,7 +296,8 @@ class Agilent33500Channel(Channel):
         """
         self.write("SOUR{ch}:DATA:VOL:CLE")
 
-    def data_arb(self, arb_name, data_points, data_format="DAC"):
+    def data_arb(self, arb_name, data_points, data_format="DAC", progress=None,
+                 should_stop=None):
         """
         Uploads an arbitrary trace into the volatile memory of the device for a given channel.
 
@@ -319,9 +320,13 @@ class Agilent33500Channel(Channel):
                             format = 'float': Accepts list of floating point values ranging from
                             -1.0 to +1.0. Minimum of 8 a maximum of 65536 points.
 
-                            format = 'binary': Accepts a binary stream of 8 bit data.
+                            format = 'binary': Accepts integer values like 'DAC', which are
+                            transferred as a binary block in chunks, suitable for up to 16 MSa.
         :param data_format: Defines the format of data_points. Can be 'DAC' (default), 'float' or
                             'binary'. See documentation on parameter data_points above.
+        :param progress: Function called with the numbers of written and of all bytes of a
+                         binary transfer.
+        :param should_stop: Function returning True to cancel a binary transfer.
         """
         if data_format == "DAC":
             separator = ", "
@@ -335,10 +340,11 @@ class Agilent33500Channel(Channel):
             data_string = separator.join(data_points_str)  # Join strings with separator
             self.write(f"SOUR{{ch}}:DATA:ARB {arb_name}, {data_string}")
             return
-        elif data_format == "binary":  # TODO: *Binary is not yet implemented*
-            raise NotImplementedError(
-                'The binary format has not yet been implemented. Use "DAC" or "float" instead.'
-            )
+        elif data_format == "binary":
+            # 16 bit integers in the default byte order (FORM:BORD NORM)
+            self.write_ieee_block(f"SOUR{{ch}}:DATA:ARB:DAC {arb_name}, ", data_points,
+                                  dtype=">i2", progress=progress, should_stop=should_stop)
+            return
         else:
             raise ValueError(
                 'Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"'
@@ -673,7 +679,8 @@ class Agilent33500(SCPIMixin, Instrument):
         """ Synchronize the phase of all channels."""
         self.write("PHAS:SYNC")
 
-    def data_arb(self, arb_name, data_points, data_format="DAC"):
+    def data_arb(self, arb_name, data_points, data_format="DAC", progress=None,
+                 should_stop=None):
         """
         Uploads an arbitrary trace into the volatile memory of the device.
 
@@ -693,9 +700,13 @@ class Agilent33500(SCPIMixin, Instrument):
                             -32767 to +32767. Minimum of 8 a maximum of 65536 points.
                             format = 'float': Accepts list of floating point values ranging from
                             -1.0 to +1.0. Minimum of 8 a maximum of 65536 points.
-                            format = 'binary': Accepts a binary stream of 8 bit data.
+                            format = 'binary': Accepts integer values like 'DAC', which are
+                            transferred as a binary block in chunks, suitable for up to 16 MSa.
         :param data_format: Defines the format of data_points. Can be 'DAC' (default), 'float' or
                             'binary'. See documentation on parameter data_points above.
+        :param progress: Function called with the numbers of written and of all bytes of a
+                         binary transfer.
+        :param should_stop: Function returning True to cancel a binary transfer.
         """
         if data_format == "DAC":
             separator = ", "
@@ -709,10 +720,11 @@ class Agilent33500(SCPIMixin, Instrument):
             data_string = separator.join(data_points_str)  # Join strings with separator
             self.write(f"DATA:ARB {arb_name}, {data_string}")
             return
-        elif data_format == "binary":  # TODO: *Binary is not yet implemented*
-            raise NotImplementedError(
-                'The binary format has not yet been implemented. Use "DAC" or "float" instead.'
-            )
+        elif data_format == "binary":
+            # 16 bit integers in the default byte order (FORM:BORD NORM)
+            self.write_ieee_block(f"DATA:ARB:DAC {arb_name}, ", data_points,
+                                  dtype=">i2", progress=progress, should_stop=should_stop)
+            return
         else:
             raise ValueError(
                 'Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"'
@@ -369,6 +369,7 @@ class AgilentB1500(SCPIMixin, Instrument):
             128: "End of data",
         }
         data_names_int = {"Sampling index"}  # convert to int instead of float
+        status_width = 1  # number of characters of the status
 
         def __init__(self, unit_names: dict[int, str], output_format_str: str = ""):
             """Store parameters of the chosen output format for later usage in data processing.
@@ -494,6 +495,63 @@ class AgilentB1500(SCPIMixin, Instrument):
                 self.check_status(status_string)
                 return channel
 
+        def format_many(
+            self, data: str, number_of_points: int
+        ) -> tuple[list[str], list[np.ndarray]] | None:
+            """Format all measurement values of several measurement points at once.
+
+            The elements of the fixed-width output formats are decoded as one array
+            instead of element by element. The status is checked once for each
+            distinct status of a channel.
+
+            :param data: Measurement values read from the instrument
+            :param number_of_points: Number of measurement points
+            :return: Column names (channel and data name) and value arrays, or None
+                if the data does not consist of elements of the expected width.
+            """
+            head_width = self.status_width + 2  # status, channel, data name
+            raw = np.frombuffer((data.rstrip("\r\n,") + ",").encode("ASCII"), dtype=np.uint8)
+            if number_of_points <= 0 or raw.size % (number_of_points * self.size) != 0:
+                return None
+            elements = raw.reshape(number_of_points, -1, self.size)
+            if not np.all(elements[..., -1] == ord(",")):
+                return None
+            heads = elements[..., :head_width].copy().view(f"S{head_width}")[..., 0]
+            values = elements[..., head_width:-1].copy().view(f"S{self.size - head_width - 1}")
+            try:
+                values = values[..., 0].astype(np.float64)
+            except ValueError:
+                return None
+
+            names = []
+            columns = []
+            for index in range(heads.shape[1]):
+                head = heads[0, index].decode("ASCII")
+                if np.any(heads[:, index] != heads[0, index]):
+                    # status differs between the points, channel and data name must not
+                    if np.any(
+                        elements[:, index, self.status_width:head_width]
+                        != elements[0, index, self.status_width:head_width]
+                    ):
+                        return None
+                    statuses = np.unique(heads[:, index])
+                else:
+                    statuses = heads[:1, index]
+                try:
+                    data_name = self.data_names[head[-1]]
+                    for status in statuses:
+                        channel = self.format_channel_check_status(
+                            status.decode("ASCII")[: self.status_width], head[-2]
+                        )
+                except KeyError:
+                    return None
+                names.append(f"{channel} {data_name}")
+                if data_name in self.data_names_int:
+                    columns.append(values[:, index].astype(np.int64))
+                else:
+                    columns.append(values[:, index])
+            return names, columns
+
         def format_single(self, element: str) -> tuple[str, str | int, str, float]:
             """Format a single measurement value.
 
@@ -537,6 +595,8 @@ class AgilentB1500(SCPIMixin, Instrument):
     class _data_formatting_FMT21(_data_formatting_generic):
         """Data formatting for FMT21 format."""
 
+        status_width = 3
+
         def __init__(self, unit_names: dict[int, str]):
             super().__init__(unit_names, "FMT21")
 
@@ -905,12 +965,20 @@ class AgilentB1500(SCPIMixin, Instrument):
         """
         if self._data_format is None:
             raise ValueError("No data format set. Call data_format() before reading data.")
-        data_list = self.read().split(",")
+        data = self.read()
+        formatted = self._data_format.format_many(data, number_of_points)
+        if formatted is not None:
+            names, columns = formatted
+            data_frame = pd.DataFrame(dict(enumerate(columns)))
+            data_frame.columns = names
+            return data_frame
+        # elements of varying width are formatted one by one
+        data_list = data.split(",")
         data_array = np.array(data_list)
         data_array_list = np.split(data_array, number_of_points)
         data = pd.DataFrame(data=data_array_list)
         data_mapped = data.map(self._data_format.format_single)
-        heads = data_mapped.iloc[[0]].map(lambda x: " ".join(x[1:3]))
+        heads = data_mapped.iloc[[0]].map(lambda x: f"{x[1]} {x[2]}")
         # channel & data_type
         heads_list = heads.to_numpy().tolist()  # 2D List
         first_row = heads_list[0]
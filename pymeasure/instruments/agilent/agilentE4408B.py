@@ -22,8 +22,6 @@
 # THE SOFTWARE.
 #
 
-from io import StringIO
-
 import numpy as np
 import pandas as pd
 
@@ -89,12 +87,7 @@ class AgilentE4408B(SCPIMixin, Instrument):
         :param number: Trace number (1, 2, or 3).
         """
         self.write(":FORMat:TRACe:DATA ASCII;")
-        data = np.loadtxt(
-            StringIO(self.ask(f":TRACE:DATA? TRACE{number};")),
-            delimiter=',',
-            dtype=np.float64
-        )
-        return data
+        return self.values(f":TRACE:DATA? TRACE{number};", as_array=True)
 
     def trace_df(self, number=1):
         """Get a pandas DataFrame containing the frequency and peak data for a particular trace."""
@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .aimttiPL import PL068P, PL155P, PL303P, PL303QMDP, PL303QMTP, PL601P
-from .ld400p import LD400P
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .aimttiPL import PL068P, PL155P, PL303P, PL303QMDP, PL303QMTP, PL601P
+    from .ld400p import LD400P
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".aimttiPL": ["PL068P", "PL155P", "PL303P", "PL303QMDP", "PL303QMTP", "PL601P"],
+    ".ld400p": ["LD400P"],
+})
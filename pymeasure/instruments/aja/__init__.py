@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .dcxs import DCXS
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .dcxs import DCXS
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".dcxs": ["DCXS"],
+})
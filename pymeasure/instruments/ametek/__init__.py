@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .ametek7270 import Ametek7270
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ametek7270 import Ametek7270
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ametek7270": ["Ametek7270"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .ami430 import AMI430
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ami430 import AMI430
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ami430": ["AMI430"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .dpseriesmotorcontroller import DPSeriesMotorController
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .dpseriesmotorcontroller import DPSeriesMotorController
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".dpseriesmotorcontroller": ["DPSeriesMotorController"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .apsin12G import APSIN12G
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .apsin12G import APSIN12G
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".apsin12G": ["APSIN12G"],
+})
@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .ah2500a import AH2500A
-from .ah2700a import AH2700A
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ah2500a import AH2500A
+    from .ah2700a import AH2700A
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ah2500a": ["AH2500A"],
+    ".ah2700a": ["AH2700A"],
+})
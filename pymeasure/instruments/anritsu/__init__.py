@@ -22,14 +22,33 @@
 # THE SOFTWARE.
 #
 
-from .anritsuMG3692C import AnritsuMG3692C
-from .anritsuMS464xB import (
-    AnritsuMS464xB,
-    AnritsuMS4642B,
-    AnritsuMS4644B,
-    AnritsuMS4645B,
-    AnritsuMS4647B,
-)
-from .anritsuMS2090A import AnritsuMS2090A
-from .anritsuMS9710C import AnritsuMS9710C
-from .anritsuMS9740A import AnritsuMS9740A
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .anritsuMG3692C import AnritsuMG3692C
+    from .anritsuMS464xB import (
+        AnritsuMS464xB,
+        AnritsuMS4642B,
+        AnritsuMS4644B,
+        AnritsuMS4645B,
+        AnritsuMS4647B,
+    )
+    from .anritsuMS2090A import AnritsuMS2090A
+    from .anritsuMS9710C import AnritsuMS9710C
+    from .anritsuMS9740A import AnritsuMS9740A
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".anritsuMG3692C": ["AnritsuMG3692C"],
+    ".anritsuMS464xB": [
+        "AnritsuMS464xB",
+        "AnritsuMS4642B",
+        "AnritsuMS4644B",
+        "AnritsuMS4645B",
+        "AnritsuMS4647B",
+    ],
+    ".anritsuMS2090A": ["AnritsuMS2090A"],
+    ".anritsuMS9710C": ["AnritsuMS9710C"],
+    ".anritsuMS9740A": ["AnritsuMS9740A"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .anc300 import ANC300Controller
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .anc300 import ANC300Controller
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".anc300": ["ANC300Controller"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .bkprecision9130b import BKPrecision9130B
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .bkprecision9130b import BKPrecision9130B
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".bkprecision9130b": ["BKPrecision9130B"],
+})
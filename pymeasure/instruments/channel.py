@@ -110,10 +110,32 @@ class Channel(CommonBase):
         self.parent.write_binary_values(self.insert_id(command),
                                         values, *args, **kwargs)
 
+    def write_ieee_block(self, command: str, values, **kwargs) -> int:
+        """Write a command followed by an IEEE 488.2 binary block to the instrument."""
+        return self.parent.write_ieee_block(self.insert_id(command), values, **kwargs)
+
     def read_binary_values(self, **kwargs):
         """Read binary values from the instrument."""
         return self.parent.read_binary_values(**kwargs)
 
+    def read_ieee_block(self, **kwargs):
+        """Read an IEEE 488.2 binary block from the instrument."""
+        return self.parent.read_ieee_block(**kwargs)
+
+    @property
+    def async_adapter(self):
+        """Get the asyncio adapter of the parent."""
+        return self.parent.async_adapter
+
+    async def _awrite(self, command: str, **kwargs) -> None:
+        """Write a string command to the instrument without acquiring the lock.
+
+        :param command: command string to be sent to the instrument.
+            '{ch}' is replaced by the channel id.
+        :param kwargs: Keyword arguments for the adapter.
+        """
+        await self.parent._awrite(self.insert_id(command), **kwargs)
+
     def check_errors(self) -> list:
         """Read all errors from the instrument and log them.
 
@@ -150,3 +172,10 @@ class Channel(CommonBase):
         :param query_delay: Delay between writing and reading in seconds. None is default delay.
         """
         self.parent.wait_for(query_delay)
+
+    async def await_for(self, query_delay: float | None = None) -> None:
+        """Wait for some time asynchronously. Used by 'aask' to wait before reading.
+
+        :param query_delay: Delay between writing and reading in seconds. None is default delay.
+        """
+        await self.parent.await_for(query_delay)
@@ -22,12 +22,18 @@
 # THE SOFTWARE.
 #
 
+import asyncio
 import logging
 from collections.abc import Callable, Sequence
 from inspect import getmembers
-from typing import Any, Generic, Literal, Protocol, TypeVar, cast, overload
+from typing import TYPE_CHECKING, Any, Generic, Literal, Protocol, TypeVar, cast, overload
 from warnings import warn
 
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..adapters.async_adapter import AsyncAdapter
+
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
@@ -73,6 +79,30 @@ def cast_or_str(cast_func: Callable[[str], T]) -> Callable[[str], T | str]:
     return _cast_or_str
 
 
+_NUMERIC_DTYPES: dict[Any, Any] = {float: np.float64, int: np.int64}
+
+
+def _parse_numeric(response: str, separator: str, cast: Any) -> np.ndarray | None:
+    """Parse a separated string of numbers at once, return None if that is not possible.
+
+    The result has to contain exactly one value per element of :code:`str.split`, otherwise
+    the caller falls back to casting each element separately.
+    """
+    dtype = _NUMERIC_DTYPES[cast]
+    try:
+        result = np.fromstring(response, dtype=dtype, sep=separator)
+    except (ValueError, TypeError):
+        return None
+    if len(result) != response.count(separator) + 1:
+        return None
+    if dtype is np.int64 and len(result) and (
+        result.max() == np.iinfo(np.int64).max or result.min() == np.iinfo(np.int64).min
+    ):
+        # Out of range values are clipped instead of raising an error.
+        return None
+    return result
+
+
 def identity(input: T) -> T:
     """Return the input value unchanged.
 
@@ -107,6 +137,28 @@ class InstrumentProperty(property, Generic[T]):
             raise AttributeError("unsettable")
         self.fset(obj, value)
 
+    #: Coroutine functions to get and set the value asynchronously, if available.
+    afget: Callable[..., Any] | None = None
+    afset: Callable[..., Any] | None = None
+
+    def _fget_kwargs(self, obj: object) -> dict[str, Any]:
+        return {}
+
+    def _fset_kwargs(self, obj: object) -> dict[str, Any]:
+        return {}
+
+    async def aget(self, obj: object) -> T:
+        """Get the value of `obj` asynchronously."""
+        if self.afget is None:
+            raise AttributeError("unreadable asynchronously")
+        return await self.afget(obj, **self._fget_kwargs(obj))
+
+    async def aset(self, obj: object, value: T) -> None:
+        """Set the value of `obj` asynchronously."""
+        if self.afset is None:
+            raise AttributeError("unsettable asynchronously")
+        await self.afset(obj, value, **self._fset_kwargs(obj))
+
 
 class StaticProperty(InstrumentProperty[T]):
     """A typed property for static (non-dynamic) instrument properties."""
@@ -158,23 +210,26 @@ class DynamicProperty(InstrumentProperty[T]):
             return self
         if self.fget is None:
             raise AttributeError(f"Unreadable attribute {self.name}")
-
-        kwargs = {}
-        for attr in self.fget_params_list:
-            attr_instance_name = self.prefix + f"{self.name}_{attr}"
-            if hasattr(obj, attr_instance_name):
-                kwargs[attr] = getattr(obj, attr_instance_name)
-        return self.fget(obj, **kwargs)
+        return self.fget(obj, **self._fget_kwargs(obj))
 
     def __set__(self, obj: object, value: T) -> None:
         if self.fset is None:
             raise AttributeError(f"Can't set attribute {self.name}")
+        self.fset(obj, value, **self._fset_kwargs(obj))
+
+    def _fget_kwargs(self, obj: object) -> dict[str, Any]:
+        return self._params_kwargs(obj, self.fget_params_list)
+
+    def _fset_kwargs(self, obj: object) -> dict[str, Any]:
+        return self._params_kwargs(obj, self.fset_params_list)
+
+    def _params_kwargs(self, obj: object, params_list) -> dict[str, Any]:
         kwargs = {}
-        for attr in self.fset_params_list:
+        for attr in params_list:
             attr_instance_name = self.prefix + f"{self.name}_{attr}"
             if hasattr(obj, attr_instance_name):
                 kwargs[attr] = getattr(obj, attr_instance_name)
-        self.fset(obj, value, **kwargs)
+        return kwargs
 
     def __set_name__(self, owner, name):
         self.name = name
@@ -224,6 +279,9 @@ class CommonBase:
     ) -> None:
         raise NotImplementedError("Subclasses must implement write_binary_values.")
 
+    def write_ieee_block(self, command: str, values, **kwargs) -> int:
+        raise NotImplementedError("Subclasses must implement write_ieee_block.")
+
     def read(self, **kwargs) -> str:
         raise NotImplementedError("Subclasses must implement read.")
 
@@ -233,6 +291,9 @@ class CommonBase:
     def read_binary_values(self, **kwargs):
         raise NotImplementedError("Subclasses must implement read_binary_values.")
 
+    def read_ieee_block(self, **kwargs):
+        raise NotImplementedError("Subclasses must implement read_ieee_block.")
+
     class BaseChannelCreator(Generic[C]):
         """Base class for ChannelCreator and MultiChannelCreator.
 
@@ -527,6 +588,32 @@ class CommonBase:
         self.wait_for(query_delay)
         return self.read()
 
+    @overload
+    def values(
+        self,
+        command: str,
+        separator: str | None = ...,
+        cast: type[T] | Callable[[str], T] = ...,
+        preprocess_reply: Callable[[str], str] | None = ...,
+        maxsplit: int = ...,
+        *,
+        as_array: Literal[False] = ...,
+        **kwargs,
+    ) -> list[T]: ...
+
+    @overload
+    def values(
+        self,
+        command: str,
+        separator: str | None = ...,
+        cast: type[T] | Callable[[str], T] = ...,
+        preprocess_reply: Callable[[str], str] | None = ...,
+        maxsplit: int = ...,
+        *,
+        as_array: Literal[True],
+        **kwargs,
+    ) -> np.ndarray: ...
+
     def values(
         self,
         command: str,
@@ -534,8 +621,10 @@ class CommonBase:
         cast: type[T] | Callable[[str], T] = float,
         preprocess_reply: Callable[[str], str] | None = None,
         maxsplit: int = -1,
+        *,
+        as_array: bool = False,
         **kwargs,
-    ) -> list[T]:
+    ) -> list[T] | np.ndarray:
         """Write a command to the instrument and return a list of formatted values from the result.
 
         :param command: SCPI command to be sent to the instrument.
@@ -547,22 +636,43 @@ class CommonBase:
         :param maxsplit: The string returned by the device is split at most `maxsplit` times.
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the split string.
+            For :code:`float` and :code:`int`, the whole string is parsed at once, which is
+            much faster for long responses, e.g. traces.
 
             .. deprecated:: 0.17.0
                 If casting fails, the element is kept as a string. In a future version this
                 will raise an error instead. To explicitly allow mixed types, use a dedicated
                 function, e.g. with :func:`cast_or_str` as cast function.
 
+        :param as_array: Return a numpy array instead of a list.
         :param \\**kwargs: Keyword arguments to be passed to the :meth:`ask` method.
         :returns: A list of the desired type, or (deprecated) of str where the casting fails.
         """
         response = self.ask(command, **kwargs).strip()
+        return self._parse_values(response, command, separator, cast, preprocess_reply,
+                                  maxsplit, as_array)
+
+    @staticmethod
+    def _parse_values(
+        response: str,
+        command: str,
+        separator: str | None,
+        cast: type | Callable[[str], Any],
+        preprocess_reply: Callable[[str], str] | None,
+        maxsplit: int,
+        as_array: bool,
+    ) -> Any:
+        """Return a list of formatted values from the `response`, see :meth:`values`."""
         if callable(preprocess_reply):
             response = preprocess_reply(response)
+        if cast in _NUMERIC_DTYPES and separator and maxsplit == -1:
+            parsed = _parse_numeric(response, separator, cast)
+            if parsed is not None:
+                return parsed if as_array else parsed.tolist()
         if cast is str:
             result = response.split(separator, maxsplit=maxsplit)
-            return result  # type: ignore[return-type]
-        results: list[T] = []
+            return np.array(result) if as_array else result  # type: ignore[return-type]
+        results: list[Any] = []
         for result in response.split(separator, maxsplit=maxsplit):
             try:
                 if cast is bool:
@@ -579,10 +689,10 @@ class CommonBase:
                     f"Use `cast=str` to return strings, or `cast=cast_or_str({cast})` "
                     f"to allow mixed types.",
                     FutureWarning,
-                    stacklevel=2,
+                    stacklevel=3,
                 )
                 results.append(result)  # type: ignore[arg-type]
-        return results
+        return np.array(results) if as_array else results
 
     def binary_values(self, command: str, query_delay: float | None = None, **kwargs):
         """ Write a command to the instrument and return a numpy array of the binary data.
@@ -596,6 +706,164 @@ class CommonBase:
         self.wait_for(query_delay)
         return self.read_binary_values(**kwargs)
 
+    # Asynchronous communication functions
+    @property
+    def async_adapter(self) -> "AsyncAdapter":
+        """Get the asyncio adapter used by the asynchronous communication methods."""
+        raise NotImplementedError("Subclasses must implement async_adapter.")
+
+    async def awrite(self, command: str, **kwargs) -> None:
+        """Write a string command to the instrument asynchronously, see :meth:`write`.
+
+        The command is not written in the middle of a query, see :meth:`aask`.
+        """
+        async with self.async_adapter.lock:
+            await self._awrite(command, **kwargs)
+
+    async def _awrite(self, command: str, **kwargs) -> None:
+        """Write a string command to the instrument without acquiring the lock."""
+        await self.async_adapter.write(command, **kwargs)
+
+    async def awrite_bytes(self, content: bytes, **kwargs) -> None:
+        """Write the bytes `content` to the instrument asynchronously."""
+        async with self.async_adapter.lock:
+            await self.async_adapter.write_bytes(content, **kwargs)
+
+    async def aread(self, **kwargs) -> str:
+        """Read a string from the instrument asynchronously, see :meth:`read`."""
+        return await self.async_adapter.read(**kwargs)
+
+    async def aread_bytes(self, count: int, **kwargs) -> bytes:
+        """Read a certain number of bytes from the instrument asynchronously."""
+        return await self.async_adapter.read_bytes(count, **kwargs)
+
+    async def aread_binary_values(self, **kwargs):
+        """Read binary values from the instrument asynchronously."""
+        return await self.async_adapter.read_binary_values(**kwargs)
+
+    async def arun(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking `function` without blocking the event loop.
+
+        With a :class:`~pymeasure.adapters.ThreadedAsyncAdapter`, the function runs in the
+        communication thread of the adapter.
+        """
+        return await self.async_adapter.run(function, *args, **kwargs)
+
+    async def await_for(self, query_delay: float | None = None) -> None:
+        """Wait for some time asynchronously. Used by 'aask' to wait before reading.
+
+        :param query_delay: Delay between writing and reading in seconds. None is default delay.
+        """
+        if query_delay:
+            await asyncio.sleep(query_delay)
+
+    async def aask(self, command: str, query_delay: float | None = None) -> str:
+        """Write a command to the instrument and return the read response asynchronously.
+
+        Other queries of the same adapter wait until the response is read.
+
+        :param command: Command string to be sent to the instrument.
+        :param query_delay: Delay between writing and reading in seconds.
+        :returns: String returned by the device without read_termination.
+        """
+        async with self.async_adapter.lock:
+            await self._awrite(command)
+            await self.await_for(query_delay)
+            return await self.aread()
+
+    @overload
+    async def avalues(
+        self,
+        command: str,
+        separator: str | None = ...,
+        cast: type[T] | Callable[[str], T] = ...,
+        preprocess_reply: Callable[[str], str] | None = ...,
+        maxsplit: int = ...,
+        *,
+        as_array: Literal[False] = ...,
+        **kwargs,
+    ) -> list[T]: ...
+
+    @overload
+    async def avalues(
+        self,
+        command: str,
+        separator: str | None = ...,
+        cast: type[T] | Callable[[str], T] = ...,
+        preprocess_reply: Callable[[str], str] | None = ...,
+        maxsplit: int = ...,
+        *,
+        as_array: Literal[True],
+        **kwargs,
+    ) -> np.ndarray: ...
+
+    async def avalues(
+        self,
+        command: str,
+        separator: str | None = ",",
+        cast: type[T] | Callable[[str], T] = float,
+        preprocess_reply: Callable[[str], str] | None = None,
+        maxsplit: int = -1,
+        *,
+        as_array: bool = False,
+        **kwargs,
+    ) -> list[T] | np.ndarray:
+        """Write a command to the instrument and return a list of formatted values from the
+        result asynchronously.
+
+        The arguments are the same as for :meth:`values`, the keyword arguments are
+        passed to :meth:`aask`.
+        """
+        response = (await self.aask(command, **kwargs)).strip()
+        return self._parse_values(response, command, separator, cast, preprocess_reply,
+                                  maxsplit, as_array)
+
+    async def abinary_values(self, command: str, query_delay: float | None = None, **kwargs):
+        """Write a command to the instrument and return a numpy array of the binary data
+        asynchronously.
+
+        :param command: Command to be sent to the instrument.
+        :param query_delay: Delay between writing and reading in seconds.
+        :param kwargs: Arguments for :meth:`~pymeasure.adapters.AsyncAdapter.read_binary_values`.
+        :returns: NumPy array of values.
+        """
+        async with self.async_adapter.lock:
+            await self._awrite(command)
+            await self.await_for(query_delay)
+            return await self.aread_binary_values(**kwargs)
+
+    async def aget(self, name: str) -> Any:
+        """Get the value of the property `name` asynchronously.
+
+        .. code-block:: python
+
+            voltages = await asyncio.gather(*(dmm.aget("voltage") for dmm in dmms))
+
+        Properties created with :meth:`control` or :meth:`measurement` communicate with
+        the awaitable methods, other attributes are read with :meth:`arun`.
+
+        :param name: Name of the property.
+        """
+        prop = getattr(type(self), name, None)
+        if isinstance(prop, InstrumentProperty) and prop.afget is not None:
+            return await prop.aget(self)
+        return await self.arun(getattr, self, name)
+
+    async def aset(self, name: str, value: Any) -> None:
+        """Set the value of the property `name` asynchronously.
+
+        Properties created with :meth:`control` or :meth:`setting` communicate with
+        the awaitable methods, other attributes are set with :meth:`arun`.
+
+        :param name: Name of the property.
+        :param value: Value to set.
+        """
+        prop = getattr(type(self), name, None)
+        if isinstance(prop, InstrumentProperty) and prop.afset is not None:
+            await prop.aset(self, value)
+        else:
+            await self.arun(setattr, self, name, value)
+
     # Property creators
     @staticmethod
     @overload  # cast: type[TCast] + both get_process and get_process_list
@@ -1021,25 +1289,16 @@ class CommonBase:
         if get_process_list is None:
             get_process_list = identity
 
-        def fget(
+        def process_get(
             self: "CommonBase",
-            get_command: str | None = get_command,
-            values: Any = values,
-            map_values: bool = map_values,
-            get_process: Callable[[Any], Any] = get_process,
-            get_process_list: Callable[[list[Any]], Any] = get_process_list,
-            check_get_errors: bool = check_get_errors,
+            vals: list[Any],
+            get_command: str,
+            values: Any,
+            map_values: bool,
+            get_process: Callable[[Any], Any],
+            get_process_list: Callable[[list[Any]], Any],
+            check_get_errors: bool,
         ) -> Any:
-            if get_command is None:
-                raise LookupError("Property can not be read.")
-            vals: list[Any] = self.values(
-                get_command,
-                separator=separator,
-                cast=cast,
-                preprocess_reply=preprocess_reply,
-                maxsplit=maxsplit,
-                **values_kwargs,
-            )
             if check_get_errors:
                 try:
                     error_list = self.check_get_errors()
@@ -1071,19 +1330,61 @@ class CommonBase:
                 vals = get_process_list(vals)
                 return vals
 
-        def fset(
+        def fget(
             self: "CommonBase",
-            value: Any,
-            set_command: str | None = set_command,
-            validator: Callable[[Any, Any], Any] = validator,
+            get_command: str | None = get_command,
             values: Any = values,
             map_values: bool = map_values,
-            set_process: Callable[[Any], Any] = set_process,
-            check_set_errors: bool = check_set_errors,
-        ) -> None:
-            if set_command is None:
-                raise LookupError("Property can not be set.")
+            get_process: Callable[[Any], Any] = get_process,
+            get_process_list: Callable[[list[Any]], Any] = get_process_list,
+            check_get_errors: bool = check_get_errors,
+        ) -> Any:
+            if get_command is None:
+                raise LookupError("Property can not be read.")
+            vals: list[Any] = self.values(
+                get_command,
+                separator=separator,
+                cast=cast,
+                preprocess_reply=preprocess_reply,
+                maxsplit=maxsplit,
+                **values_kwargs,
+            )
+            return process_get(self, vals, get_command, values, map_values, get_process,
+                               get_process_list, check_get_errors)
 
+        async def afget(
+            self: "CommonBase",
+            get_command: str | None = get_command,
+            values: Any = values,
+            map_values: bool = map_values,
+            get_process: Callable[[Any], Any] = get_process,
+            get_process_list: Callable[[list[Any]], Any] = get_process_list,
+            check_get_errors: bool = check_get_errors,
+        ) -> Any:
+            if get_command is None:
+                raise LookupError("Property can not be read.")
+            vals: list[Any] = await self.avalues(
+                get_command,
+                separator=separator,
+                cast=cast,
+                preprocess_reply=preprocess_reply,
+                maxsplit=maxsplit,
+                **values_kwargs,
+            )
+            if check_get_errors:
+                # Error checking communicates with the blocking methods
+                return await self.arun(process_get, self, vals, get_command, values,
+                                       map_values, get_process, get_process_list, True)
+            return process_get(self, vals, get_command, values, map_values, get_process,
+                               get_process_list, False)
+
+        def prepare_set(
+            value: Any,
+            validator: Callable[[Any, Any], Any],
+            values: Any,
+            map_values: bool,
+            set_process: Callable[[Any], Any],
+        ) -> Any:
             val = set_process(validator(value, values))
             if not map_values:
                 pass
@@ -1096,32 +1397,71 @@ class CommonBase:
                     f'Values of type `{type(values)}` are not allowed '
                     'for CommonBase.control'
                 )
+            return val
+
+        def check_set(self: "CommonBase", command: str) -> None:
+            try:
+                error_list = self.check_set_errors()
+            except Exception as exc:
+                log.error("Exception raised while setting a property with the command "
+                          f"""'{command}': '{exc!s}'.""")
+                raise
+            errors = [str(error) for error in error_list]
+            if errors:
+                log.error(
+                    "Error received after trying to set a property with the command "
+                    f"""'{command}': '{"', '".join(errors)}'."""
+                )
+
+        def fset(
+            self: "CommonBase",
+            value: Any,
+            set_command: str | None = set_command,
+            validator: Callable[[Any, Any], Any] = validator,
+            values: Any = values,
+            map_values: bool = map_values,
+            set_process: Callable[[Any], Any] = set_process,
+            check_set_errors: bool = check_set_errors,
+        ) -> None:
+            if set_command is None:
+                raise LookupError("Property can not be set.")
+            val = prepare_set(value, validator, values, map_values, set_process)
             self.write(set_command % val)
             if check_set_errors:
-                try:
-                    error_list = self.check_set_errors()
-                except Exception as exc:
-                    log.error("Exception raised while setting a property with the command "
-                              f"""'{set_command % val}': '{exc!s}'.""")
-                    raise
-                errors = [str(error) for error in error_list]
-                if errors:
-                    log.error(
-                        "Error received after trying to set a property with the command "
-                        f"""'{set_command % val}': '{"', '".join(errors)}'."""
-                    )
+                check_set(self, set_command % val)
+
+        async def afset(
+            self: "CommonBase",
+            value: Any,
+            set_command: str | None = set_command,
+            validator: Callable[[Any, Any], Any] = validator,
+            values: Any = values,
+            map_values: bool = map_values,
+            set_process: Callable[[Any], Any] = set_process,
+            check_set_errors: bool = check_set_errors,
+        ) -> None:
+            if set_command is None:
+                raise LookupError("Property can not be set.")
+            val = prepare_set(value, validator, values, map_values, set_process)
+            await self.awrite(set_command % val)
+            if check_set_errors:
+                await self.arun(check_set, self, set_command % val)
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
 
         if dynamic:
             fget.__doc__ += "(dynamic)"
-            return DynamicProperty(fget=fget, fset=fset,
-                                   fget_params_list=CommonBase._fget_params_list,
-                                   fset_params_list=CommonBase._fset_params_list,
-                                   prefix=CommonBase.__reserved_prefix)
+            prop: InstrumentProperty[Any] = DynamicProperty(
+                fget=fget, fset=fset,
+                fget_params_list=CommonBase._fget_params_list,
+                fset_params_list=CommonBase._fset_params_list,
+                prefix=CommonBase.__reserved_prefix)
         else:
-            return StaticProperty(fget, fset)
+            prop = StaticProperty(fget, fset)
+        prop.afget = afget
+        prop.afset = afset
+        return prop
 
     @staticmethod
     @overload  # cast: type[TCast] + both get_process and get_process_list
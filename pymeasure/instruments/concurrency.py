@@ -0,0 +1,258 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Communicate with many instruments concurrently.
+
+The communication with each instrument runs in a thread of a bounded pool, such that the
+time per measurement point approaches the latency of the slowest instrument instead of the
+sum of all latencies. Instruments sharing one physical bus, for example several instruments
+behind one Prologix controller or on one GPIB board, are addressed one after the other.
+
+.. code-block:: python
+
+    from pymeasure.instruments import gather, scatter
+
+    scatter(sources, "source_voltage", [0.1 * i for i in range(len(sources))])
+    voltages = gather(dmms, "voltage", timeout=5)
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any
+
+from .common_base import CommonBase
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+def bus_key(instrument: CommonBase) -> Hashable:
+    """Return a key identifying the physical bus of the `instrument`.
+
+    Channels share the bus of their parent. Adapters sharing a connection, like the
+    :class:`~pymeasure.adapters.PrologixAdapter` instances returned by
+    :meth:`~pymeasure.adapters.PrologixAdapter.gpib`, share a bus, as do all VISA GPIB
+    resources of one board.
+
+    :param instrument: Instrument or channel.
+    """
+    while (parent := getattr(instrument, "parent", None)) is not None:
+        instrument = parent
+    adapter = getattr(instrument, "adapter", instrument)
+    connection = getattr(adapter, "connection", None)
+    if connection is None:
+        return id(adapter)
+    resource_name = getattr(connection, "resource_name", None)
+    if isinstance(resource_name, str) and resource_name.upper().startswith("GPIB"):
+        return resource_name.upper().split("::", 1)[0]
+    return id(connection)
+
+
+def run_concurrently(
+    tasks: Iterable[tuple[CommonBase, Callable[[], Any]]],
+    timeout: float | None = None,
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Call functions communicating with instruments concurrently and return their results.
+
+    The functions of instruments on the same bus (see :func:`bus_key`) are called one after
+    the other in the given order, the functions of different buses at the same time.
+
+    .. code-block:: python
+
+        run_concurrently((smu, smu.enable_source) for smu in smus)
+
+    :param tasks: Pairs of an instrument and a function without arguments to call.
+    :param timeout: Time in seconds to wait for each call after it started, None waits
+        forever. A call exceeding it raises a :code:`TimeoutError` and the remaining calls
+        on its bus are not started, as the bus is likely blocked.
+    :param max_workers: Maximum number of buses addressed at the same time.
+    :param return_exceptions: If True, exceptions are returned in the list of results,
+        otherwise the first exception (in order of the tasks) is raised after all calls
+        have finished.
+    :returns: List of the return values in the order of the tasks.
+    """
+    functions: list[Callable[[], Any]] = []
+    queues: dict[Hashable, deque[int]] = {}
+    for index, (instrument, function) in enumerate(tasks):
+        functions.append(function)
+        queues.setdefault(bus_key(instrument), deque()).append(index)
+    results: list[Any] = [None] * len(functions)
+    exceptions: dict[int, BaseException] = {}
+    pending = deque(queues.values())
+    # Futures in progress with their index, bus queue and deadline.
+    running: dict[Future, tuple[int, deque[int], float]] = {}
+    stuck: set[Future] = set()
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Concurrent")
+
+    def start(queue: deque[int]) -> None:
+        index = queue.popleft()
+        deadline = float("inf") if timeout is None else time.monotonic() + timeout
+        running[executor.submit(functions[index])] = index, queue, deadline
+
+    def fill() -> None:
+        # Only submit to idle workers, such that each call starts immediately.
+        while pending and len(running) + len(stuck) < max_workers:
+            start(pending.popleft())
+
+    try:
+        fill()
+        while running or pending:
+            # Pending buses wait for calls still blocking after their timeout.
+            next_deadline = min((deadline for _, _, deadline in running.values()),
+                                default=float("inf"))
+            done, _ = wait(
+                list(running) + list(stuck),
+                timeout=None if next_deadline == float("inf")
+                else max(next_deadline - time.monotonic(), 0),
+                return_when=FIRST_COMPLETED,
+            )
+            stuck -= done
+            now = time.monotonic()
+            for future, (index, queue, deadline) in list(running.items()):
+                if future in done:
+                    del running[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        exceptions[index] = exc
+                    if queue:
+                        pending.append(queue)
+                elif deadline <= now:
+                    del running[future]
+                    stuck.add(future)
+                    exceptions[index] = TimeoutError(f"Call {index} timed out after {timeout} s.")
+                    log.warning("Call %s timed out, skipping %s further calls on its bus.",
+                                index, len(queue))
+                    for skipped in queue:
+                        exceptions[skipped] = TimeoutError(
+                            f"Call {skipped} skipped, as call {index} on its bus timed out.")
+                    queue.clear()
+            fill()
+    finally:
+        # Do not wait for calls, which are still blocking after their timeout.
+        executor.shutdown(wait=not stuck, cancel_futures=True)
+
+    if return_exceptions:
+        for index, exc in exceptions.items():
+            results[index] = exc
+    elif exceptions:
+        raise exceptions[min(exceptions)]
+    return results
+
+
+def gather(
+    instruments: Iterable[CommonBase],
+    name: str,
+    timeout: float | None = None,
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Get the attribute `name` of all `instruments` concurrently.
+
+    .. code-block:: python
+
+        voltages = gather(dmms, "voltage")
+
+    :param instruments: Instruments or channels.
+    :param name: Name of the property to get.
+    :param timeout: Time in seconds for each instrument, see :func:`run_concurrently`.
+    :param max_workers: Maximum number of buses addressed at the same time.
+    :param return_exceptions: Return exceptions instead of raising them.
+    :returns: List of the values in the order of the instruments.
+    """
+    return run_concurrently(
+        ((instrument, partial(getattr, instrument, name)) for instrument in instruments),
+        timeout=timeout, max_workers=max_workers, return_exceptions=return_exceptions,
+    )
+
+
+def scatter(
+    instruments: Sequence[CommonBase],
+    name: str,
+    values: Sequence[Any],
+    timeout: float | None = None,
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Set the attribute `name` of each instrument to its value concurrently.
+
+    .. code-block:: python
+
+        scatter(sources, "source_voltage", [1, 2, 3])
+
+    :param instruments: Instruments or channels.
+    :param name: Name of the property to set.
+    :param values: One value for each instrument.
+    :param timeout: Time in seconds for each instrument, see :func:`run_concurrently`.
+    :param max_workers: Maximum number of buses addressed at the same time.
+    :param return_exceptions: Return exceptions instead of raising them.
+    :returns: List of None or of the exceptions, if `return_exceptions` is True.
+    :raises ValueError: If the number of values differs from the number of instruments.
+    """
+    if len(instruments) != len(values):
+        raise ValueError(f"Got {len(values)} values for {len(instruments)} instruments.")
+    return run_concurrently(
+        ((instrument, partial(setattr, instrument, name, value))
+         for instrument, value in zip(instruments, values)),
+        timeout=timeout, max_workers=max_workers, return_exceptions=return_exceptions,
+    )
+
+
+def call_each(
+    instruments: Iterable[CommonBase],
+    method: str,
+    *args,
+    timeout: float | None = None,
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+    **kwargs,
+) -> list[Any]:
+    """Call the `method` of all `instruments` with the same arguments concurrently.
+
+    .. code-block:: python
+
+        call_each(smus, "ramp_to_voltage", 5, steps=10)
+
+    :param instruments: Instruments or channels.
+    :param method: Name of the method to call.
+    :param \\*args, \\**kwargs: Arguments of the method.
+    :param timeout: Time in seconds for each instrument, see :func:`run_concurrently`.
+    :param max_workers: Maximum number of buses addressed at the same time.
+    :param return_exceptions: Return exceptions instead of raising them.
+    :returns: List of the return values in the order of the instruments.
+    """
+    return run_concurrently(
+        ((instrument, partial(getattr(instrument, method), *args, **kwargs))
+         for instrument in instruments),
+        timeout=timeout, max_workers=max_workers, return_exceptions=return_exceptions,
+    )
+
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .danfysik8500 import Danfysik8500
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .danfysik8500 import Danfysik8500
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".danfysik8500": ["Danfysik8500"],
+})
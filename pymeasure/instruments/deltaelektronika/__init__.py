@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .sm7045d import SM7045D
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .sm7045d import SM7045D
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".sm7045d": ["SM7045D"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .nxds import Nxds
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .nxds import Nxds
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".nxds": ["Nxds"],
+})
@@ -21,4 +21,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
-from .eurotestHPP120256 import EurotestHPP120256
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .eurotestHPP120256 import EurotestHPP120256
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".eurotestHPP120256": ["EurotestHPP120256"],
+})
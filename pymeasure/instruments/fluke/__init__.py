@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .fluke7341 import Fluke7341
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .fluke7341 import Fluke7341
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".fluke7341": ["Fluke7341"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .velox import Velox
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .velox import Velox
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".velox": ["Velox"],
+})
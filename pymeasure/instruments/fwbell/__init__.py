@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .fwbell5080 import FWBell5080
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .fwbell5080 import FWBell5080
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".fwbell5080": ["FWBell5080"],
+})
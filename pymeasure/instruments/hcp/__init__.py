@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .tc038 import TC038
-from .tc038d import TC038D
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .tc038 import TC038
+    from .tc038d import TC038D
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".tc038": ["TC038"],
+    ".tc038d": ["TC038D"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .nd287 import ND287
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .nd287 import ND287
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".nd287": ["ND287"],
+})
@@ -22,15 +22,35 @@
 # THE SOFTWARE.
 #
 
-from .hp437b import HP437B
-from .hp856Xx import HP8560A, HP8561B
-from .hp3437A import HP3437A
-from .hp3478A import HP3478A
-from .hp8116a import HP8116A
-from .hp8657b import HP8657B
-from .hp8753e import HP8753E
-from .hp11713a import HP11713A
-from .hp33120A import HP33120A
-from .hp34401A import HP34401A
-from .hplegacyinstrument import HPLegacyInstrument
-from .hpsystempsu import HP6632A, HP6633A, HP6634A
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .hp437b import HP437B
+    from .hp856Xx import HP8560A, HP8561B
+    from .hp3437A import HP3437A
+    from .hp3478A import HP3478A
+    from .hp8116a import HP8116A
+    from .hp8657b import HP8657B
+    from .hp8753e import HP8753E
+    from .hp11713a import HP11713A
+    from .hp33120A import HP33120A
+    from .hp34401A import HP34401A
+    from .hplegacyinstrument import HPLegacyInstrument
+    from .hpsystempsu import HP6632A, HP6633A, HP6634A
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".hp437b": ["HP437B"],
+    ".hp856Xx": ["HP8560A", "HP8561B"],
+    ".hp3437A": ["HP3437A"],
+    ".hp3478A": ["HP3478A"],
+    ".hp8116a": ["HP8116A"],
+    ".hp8657b": ["HP8657B"],
+    ".hp8753e": ["HP8753E"],
+    ".hp11713a": ["HP11713A"],
+    ".hp33120A": ["HP33120A"],
+    ".hp34401A": ["HP34401A"],
+    ".hplegacyinstrument": ["HPLegacyInstrument"],
+    ".hpsystempsu": ["HP6632A", "HP6633A", "HP6634A"],
+})
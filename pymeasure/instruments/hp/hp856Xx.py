@@ -29,8 +29,8 @@ from math import log10
 
 import numpy as np
 
+from pymeasure._strenum import StrEnum
 from pymeasure.instruments import Instrument
-from pymeasure.instruments._strenum import StrEnum
 from pymeasure.instruments.common_base import cast_or_str
 from pymeasure.instruments.validators import (
     joined_validators,
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .ldp3811 import LDP3811
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ldp3811 import LDP3811
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ldp3811": ["LDP3811"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .sqm160 import SQM160
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .sqm160 import SQM160
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".sqm160": ["SQM160"],
+})
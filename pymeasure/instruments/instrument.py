@@ -30,6 +30,7 @@ from warnings import warn
 from typing_extensions import Self
 
 from ..adapters.adapter import Adapter
+from ..adapters.async_adapter import AsyncAdapter, ThreadedAsyncAdapter
 from ..adapters.visa import VISAAdapter
 from .common_base import CommonBase
 
@@ -69,6 +70,7 @@ class Instrument(CommonBase):
         Discarded otherwise.
     """
     adapter: Adapter
+    _async_adapter: AsyncAdapter | None = None
 
     # noinspection PyPep8Naming
     def __init__(
@@ -141,10 +143,27 @@ class Instrument(CommonBase):
         """
         self.adapter.write_binary_values(command, values, *args, **kwargs)
 
+    def write_ieee_block(self, command: str, values, **kwargs) -> int:
+        """Write a command followed by an IEEE 488.2 binary block in chunks.
+
+        :param command: Command to send.
+        :param values: The values to transmit.
+        :param \\**kwargs: Arguments for :meth:`~pymeasure.adapters.Adapter.write_ieee_block`.
+        :returns: number of data bytes written
+        """
+        return self.adapter.write_ieee_block(command, values, **kwargs)
+
     def read_binary_values(self, **kwargs):
         """Read binary values from the device."""
         return self.adapter.read_binary_values(**kwargs)
 
+    def read_ieee_block(self, **kwargs):
+        """Read an IEEE 488.2 binary block from the device.
+
+        :param \\**kwargs: Arguments for :meth:`~pymeasure.adapters.Adapter.read_ieee_block`.
+        """
+        return self.adapter.read_ieee_block(**kwargs)
+
     # Communication functions
     def wait_for(self, query_delay: float | None = None) -> None:
         """Wait for some time. Used by 'ask' to wait before reading.
@@ -154,8 +173,29 @@ class Instrument(CommonBase):
         if query_delay:
             time.sleep(query_delay)
 
+    @property
+    def async_adapter(self) -> AsyncAdapter:
+        """Control the asyncio adapter of the awaitable communication methods, e.g. :meth:`aask`.
+
+        By default, a :class:`~pymeasure.adapters.ThreadedAsyncAdapter` runs the
+        communication of :attr:`adapter` in a dedicated thread. Set a native asyncio adapter,
+        for example a :class:`~pymeasure.adapters.SocketAsyncAdapter`, instead.
+        """
+        if self._async_adapter is None:
+            self._async_adapter = ThreadedAsyncAdapter(self.adapter, log=log)
+        return self._async_adapter
+
+    @async_adapter.setter
+    def async_adapter(self, async_adapter: AsyncAdapter) -> None:
+        self._async_adapter = async_adapter
+
     def shutdown(self) -> None:
         """Brings the instrument to a safe and stable state"""
+        if self._async_adapter is not None:
+            self._async_adapter.close()
+            if isinstance(self._async_adapter, ThreadedAsyncAdapter):
+                # Its thread is stopped, a new one is created on demand
+                self._async_adapter = None
         self.isShutdown = True
         log.info(f"Finished shutting down {self.name}")
 
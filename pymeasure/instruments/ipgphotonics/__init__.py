@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .yar import YAR
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .yar import YAR
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".yar": ["YAR"],
+})
@@ -39,6 +39,10 @@ class KeithleyBuffer:
     """ Implements the basic buffering capability found in
     many Keithley instruments. """
 
+    #: Whether :attr:`buffer_data` is transferred in binary format, which is
+    #: faster for large buffers. Set it to False to fall back to ASCII.
+    buffer_binary = False
+
     buffer_points = Instrument.control(
         ":TRAC:POIN?", ":TRAC:POIN %d",
         """ Control the number of buffer points. This does not represent actual points
@@ -92,9 +96,64 @@ class KeithleyBuffer:
 
     @property
     def buffer_data(self):
-        """ Get a numpy array of values from the buffer. """
+        """ Get a numpy array of values from the buffer.
+
+        The values are transferred in binary format if :attr:`buffer_binary`
+        is True, otherwise in ASCII format. """
+        if self.buffer_binary:
+            return self._read_buffer_binary()
         self.write(":FORM:DATA ASCII")
-        return np.array(self.values(":TRAC:DATA?"), dtype=np.float64)
+        return np.asarray(self.values(":TRAC:DATA?", as_array=True), dtype=np.float64)
+
+    def _read_buffer_binary(self):
+        # The instrument sends an indefinite length block, therefore the
+        # number of values (readings times elements) is queried beforehand.
+        points = int(self.ask(":TRAC:POIN:ACT?"))
+        elements = len(self.ask(":FORM:ELEM?").split(","))
+        self.write(":FORM:DATA SREAL;:FORM:BORD SWAP")
+        try:
+            self.write(":TRAC:DATA?")
+            data = self.read_ieee_block(dtype="<f4", count=points * elements)
+        finally:
+            # Other queries expect ASCII responses
+            self.write(":FORM:DATA ASCII")
+        return data.astype(np.float64)
+
+    def stream_buffer(self, chunks=None, should_stop=lambda: False,
+                      timeout=60, interval=0.1):
+        """ Yield numpy arrays of values, one for each fill of the buffer.
+
+        The buffer is started, read as soon as it is full, cleared and
+        restarted, such that long acquisitions are recorded continuously
+        while only one buffer of data is held in memory. Configure the buffer
+        with :meth:`config_buffer` beforehand, its number of points is the
+        chunk size.
+
+        .. code-block:: python
+
+            instrument.config_buffer(points=100)
+            for data in instrument.stream_buffer(should_stop=self.should_stop):
+                self.emit('batch results', {'Voltage': data})
+
+        :param chunks: The number of buffer fills to read, or None to stream
+            until :code:`should_stop` returns True.
+        :param should_stop: A function that returns True when streaming should stop
+        :param timeout: A time in seconds after which waiting for one fill of
+            the buffer raises a TimeoutError
+        :param interval: A time in seconds for how often to check if the buffer is full
+        """
+        count = 0
+        while chunks is None or count < chunks:
+            self.start_buffer()
+            self.wait_for_buffer(should_stop, timeout, interval)
+            if should_stop():
+                self.stop_buffer()
+                return
+            data = self.buffer_data
+            # Clear the buffer and the status, but keep the enabled status bits
+            self.write(":TRAC:CLEAR;*CLS;:TRAC:FEED:CONT NEXT;")
+            count += 1
+            yield data
 
     def start_buffer(self):
         """ Starts the buffer. """
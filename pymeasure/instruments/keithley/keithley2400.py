@@ -38,6 +38,7 @@ from pymeasure.instruments.validators import (
 )
 
 from .buffer import KeithleyBuffer
+from .sweep import KeithleySweep
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -47,7 +48,7 @@ def _deprecate_process(msg):
     return lambda v: (warn(msg, FutureWarning), v)[1]
 
 
-class Keithley2400(KeithleyBuffer, SCPIMixin, Instrument):
+class Keithley2400(KeithleyBuffer, KeithleySweep, SCPIMixin, Instrument):
     """Represent the Keithley 2400 SourceMeter and provide a
     high-level interface for interacting with the instrument.
 
@@ -65,6 +66,8 @@ class Keithley2400(KeithleyBuffer, SCPIMixin, Instrument):
         smu.reset()                        # Resets the instrument
     """
 
+    buffer_binary = True
+
     def __init__(self, adapter, name="Keithley 2400 SourceMeter", **kwargs):
         super().__init__(adapter, name, **kwargs)
         self.reset_data_format()
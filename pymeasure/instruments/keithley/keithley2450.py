@@ -33,13 +33,14 @@ from pymeasure.instruments.common_base import identity
 from pymeasure.instruments.validators import strict_discrete_set, truncated_range
 
 from .buffer import KeithleyBuffer
+from .sweep import KeithleySweep
 
 # Setup logging
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
-class Keithley2450(KeithleyBuffer, SCPIMixin, Instrument):
+class Keithley2450(KeithleyBuffer, KeithleySweep, SCPIMixin, Instrument):
     """ Represents the Keithley 2450 SourceMeter and provides a
     high-level interface for interacting with the instrument.
 
@@ -66,6 +67,8 @@ class Keithley2450(KeithleyBuffer, SCPIMixin, Instrument):
 
     """
 
+    buffer_binary = True
+
     def __init__(self, adapter, name="Keithley 2450 SourceMeter", **kwargs):
         super().__init__(
             adapter,
@@ -35,6 +35,55 @@ from pymeasure.instruments.validators import strict_discrete_set, truncated_rang
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+#: Name of the TSP script with the sweep functions.
+SWEEP_SCRIPT_NAME = "pymeasure_sweeps"
+
+#: TSP script defining the sweep functions, which source the values with the trigger model
+#: and store the currents and voltages in nvbuffer1 and nvbuffer2 of the channel.
+SWEEP_SCRIPT = """
+function pymeasure_sweep(smu, source, points, delay, nplc)
+    if source == "v" then
+        smu.source.func = smu.OUTPUT_DCVOLTS
+    else
+        smu.source.func = smu.OUTPUT_DCAMPS
+    end
+    smu.measure.nplc = nplc
+    smu.measure.delay = delay
+    smu.nvbuffer1.clear()
+    smu.nvbuffer2.clear()
+    smu.trigger.measure.iv(smu.nvbuffer1, smu.nvbuffer2)
+    smu.trigger.measure.action = smu.ENABLE
+    smu.trigger.source.action = smu.ENABLE
+    smu.trigger.endpulse.action = smu.SOURCE_HOLD
+    smu.trigger.arm.count = 1
+    smu.trigger.count = points
+    smu.source.output = smu.OUTPUT_ON
+    smu.trigger.initiate()
+    waitcomplete()
+end
+
+function pymeasure_linear_sweep(smu, source, start, stop, points, delay, nplc)
+    smu.trigger.source["linear" .. source](start, stop, points)
+    pymeasure_sweep(smu, source, points, delay, nplc)
+end
+
+function pymeasure_log_sweep(smu, source, start, stop, points, delay, nplc)
+    smu.trigger.source["log" .. source](start, stop, points, 0)
+    pymeasure_sweep(smu, source, points, delay, nplc)
+end
+
+function pymeasure_list_sweep(smu, source, values, delay, nplc)
+    smu.trigger.source["list" .. source](values)
+    pymeasure_sweep(smu, source, table.getn(values), delay, nplc)
+end
+
+function pymeasure_append(values, new)
+    for i = 1, table.getn(new) do
+        table.insert(values, new[i])
+    end
+end
+"""
+
 
 class Keithley2600(SCPIUnknownMixin, Instrument):
     """Represents the Keithley 2600 series (channel A and B) SourceMeter"""
@@ -47,6 +96,44 @@ class Keithley2600(SCPIUnknownMixin, Instrument):
         )
         self.ChA = Channel(self, 'a')
         self.ChB = Channel(self, 'b')
+        self._scripts = {}
+
+    @property
+    def scripts(self):
+        """ Get a dictionary of the names and sources of the TSP scripts loaded by
+        :meth:`load_script`. """
+        return dict(self._scripts)
+
+    def load_script(self, name, source, run=True, force=False):
+        """ Load a TSP script into the instrument.
+
+        A script loaded with the same source before is not transferred again, unless
+        `force` is True, for example after the instrument has been restarted.
+
+        :param name: Name of the script, a valid Lua identifier.
+        :param source: TSP (Lua) source code of the script.
+        :param run: Whether to run the script after loading, e.g. to define its functions.
+        :param force: Whether to load the script even if it is cached.
+        """
+        if not force and self._scripts.get(name) == source:
+            return
+        self.write(f"loadscript {name}")
+        for line in source.splitlines():
+            if line.strip():
+                self.write(line)
+        self.write("endscript")
+        self._scripts[name] = source
+        if run:
+            self.run_script(name)
+
+    def run_script(self, name):
+        """ Run the loaded TSP script `name`. """
+        self.write(f"{name}.run()")
+
+    def delete_script(self, name):
+        """ Delete the TSP script `name` from the instrument. """
+        self.write(f'script.delete("{name}")')
+        self._scripts.pop(name, None)
 
     @property
     def next_error(self):
@@ -98,6 +185,33 @@ class Channel:
     def binary_values(self, cmd, header_bytes=0, dtype=np.float32):
         return self.instrument.binary_values(f'print(smu{self.channel}.{cmd})', header_bytes, dtype)
 
+    def stream_buffers(self, points=None, chunk_size=1000):
+        """ Yield tuples of numpy arrays of currents and voltages from nvbuffer1 and
+        nvbuffer2 in chunks of `chunk_size` readings.
+
+        The readings are transferred in binary format.
+
+        :param points: Number of readings, or None to read all readings of nvbuffer1.
+        :param chunk_size: Maximum number of readings of each chunk.
+        """
+        if points is None:
+            points = int(self.ask('nvbuffer1.n'))
+        smu = f'smu{self.channel}'
+        for first in range(1, points + 1, chunk_size):
+            last = min(first + chunk_size - 1, points)
+            try:
+                self.instrument.write(
+                    'format.data = format.REAL32 format.byteorder = format.LITTLEENDIAN '
+                    f'printbuffer({first}, {last}, {smu}.nvbuffer1.readings, '
+                    f'{smu}.nvbuffer2.readings)')
+                data = self.instrument.read_ieee_block(dtype="<f4",
+                                                       count=2 * (last - first + 1))
+            finally:
+                # Other queries expect ASCII responses
+                self.instrument.write('format.data = format.ASCII')
+            data = data.astype(np.float64).reshape(-1, 2)
+            yield data[:, 0], data[:, 1]
+
     def check_errors(self):
         return self.instrument.check_errors()
 
@@ -292,6 +406,90 @@ class Channel:
         self.compliance_current = compliance_current
         self.check_errors()
 
+    ##########
+    # Sweeps #
+    ##########
+
+    def _sweep(self, function, arguments, points, chunk_size):
+        """ Run a sweep function of :data:`SWEEP_SCRIPT` and read its readings. """
+        self.instrument.load_script(SWEEP_SCRIPT_NAME, SWEEP_SCRIPT)
+        self.instrument.write(f'{function}(smu{self.channel}, {arguments})')
+        currents, voltages = [], []
+        for current, voltage in self.stream_buffers(points, chunk_size):
+            currents.append(current)
+            voltages.append(voltage)
+        return np.concatenate(currents), np.concatenate(voltages)
+
+    @staticmethod
+    def _sweep_source(source):
+        try:
+            return {'voltage': 'v', 'current': 'i'}[source]
+        except KeyError:
+            raise ValueError(f"Invalid sweep source {source!r}, "
+                             "use 'voltage' or 'current'.") from None
+
+    @staticmethod
+    def _sweep_points(points):
+        # A trigger count of 0 makes the instrument sweep infinitely
+        if int(points) < 1:
+            raise ValueError(f"A sweep requires at least one point, not {points!r}.")
+        return int(points)
+
+    def linear_sweep(self, start, stop, points, source='voltage', delay=0, nplc=1,
+                     chunk_size=1000):
+        """ Sweep the source linearly on the instrument and measure current and voltage
+        at each point.
+
+        The sweep runs in a TSP script on the instrument, which stores the readings in
+        nvbuffer1 and nvbuffer2, and is therefore limited by the instrument and not by the
+        round trips of the communication. The adapter timeout has to exceed the duration
+        of the sweep. The output stays on at the last source value.
+
+        :param start: Source value of the first point.
+        :param stop: Source value of the last point.
+        :param points: Number of points, at least 1.
+        :param source: 'voltage' or 'current'.
+        :param delay: Delay before each measurement in seconds.
+        :param nplc: Number of power line cycles (NPLC) of each measurement.
+        :param chunk_size: Number of readings transferred at once.
+        :returns: Tuple of numpy arrays of the currents and voltages.
+        """
+        points = self._sweep_points(points)
+        arguments = (f'"{self._sweep_source(source)}", {float(start)!r}, {float(stop)!r}, '
+                     f'{points}, {float(delay)!r}, {float(nplc)!r}')
+        return self._sweep('pymeasure_linear_sweep', arguments, points, chunk_size)
+
+    def log_sweep(self, start, stop, points, source='voltage', delay=0, nplc=1,
+                  chunk_size=1000):
+        """ Sweep the source logarithmically on the instrument and measure current and
+        voltage at each point, see :meth:`linear_sweep`.
+
+        :param start: Source value of the first point, not 0.
+        :param stop: Source value of the last point, with the sign of `start`.
+        """
+        points = self._sweep_points(points)
+        arguments = (f'"{self._sweep_source(source)}", {float(start)!r}, {float(stop)!r}, '
+                     f'{points}, {float(delay)!r}, {float(nplc)!r}')
+        return self._sweep('pymeasure_log_sweep', arguments, points, chunk_size)
+
+    def list_sweep(self, values, source='voltage', delay=0, nplc=1, chunk_size=1000):
+        """ Source a list of values on the instrument and measure current and voltage
+        at each point, see :meth:`linear_sweep`.
+
+        :param values: Sequence of source values.
+        """
+        source = self._sweep_source(source)
+        values = [float(value) for value in values]
+        points = self._sweep_points(len(values))
+        self.instrument.load_script(SWEEP_SCRIPT_NAME, SWEEP_SCRIPT)
+        # Transfer long lists in parts to keep the commands short
+        self.instrument.write('pymeasure_values = {}')
+        for first in range(0, len(values), 100):
+            part = ", ".join(map(repr, values[first:first + 100]))
+            self.instrument.write(f'pymeasure_append(pymeasure_values, {{{part}}})')
+        arguments = f'"{source}", pymeasure_values, {float(delay)!r}, {float(nplc)!r}'
+        return self._sweep('pymeasure_list_sweep', arguments, points, chunk_size)
+
     def ramp_to_voltage(self, target_voltage, steps=30, pause=0.1):
         """ Ramps to a target voltage from the set voltage value over
         a certain number of linear steps, each separated by a pause duration.
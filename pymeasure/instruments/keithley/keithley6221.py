@@ -78,6 +78,8 @@ class Keithley6221(KeithleyBuffer, SCPIMixin, Instrument):
 
     """
 
+    buffer_binary = True
+
     def __init__(self, adapter, name="Keithley 6221 SourceMeter", **kwargs):
         super().__init__(
             adapter,
@@ -24,6 +24,8 @@
 
 import logging
 
+import numpy as np
+
 from pymeasure.instruments import Channel, Instrument, SCPIMixin, cast_or_str
 from pymeasure.instruments.common_base import InstrumentProperty
 from pymeasure.instruments.validators import (
@@ -32,6 +34,8 @@ from pymeasure.instruments.validators import (
     truncated_range,
 )
 
+from .sweep import KeithleySweep
+
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
@@ -157,7 +161,7 @@ class ScannerCard2000Channel(Channel):
             super().write(command, **kwargs)
 
 
-class KeithleyDMM6500(SCPIMixin, Instrument):
+class KeithleyDMM6500(KeithleySweep, SCPIMixin, Instrument):
     """Represent the Keithely DMM6500 6½-Digit Multimeter and provide a
     high-level interface for interacting with the instrument.
     This class only uses "SCPI" command set (see also :attr:`command_set`) to
@@ -1123,6 +1127,35 @@ class KeithleyDMM6500(SCPIMixin, Instrument):
         cast=int,
     )
 
+    def configure_sweep(self, points, delay=0):
+        """Configure the trigger model to take a number of measurements into the buffer,
+        see :class:`~pymeasure.instruments.keithley.sweep.KeithleySweep`.
+
+        :param points: Number of measurements.
+        :param delay: Delay between the measurements in seconds.
+        :return: The number of measurements.
+        """
+        self.write(":TRAC:CLE")
+        self.write(f':TRIG:LOAD "SimpleLoop", {points:d}, {delay:g}')
+        self.check_errors()
+        return points
+
+    @property
+    def sweep_data(self):
+        """Get a dictionary with a numpy array of the buffered readings as 'reading',
+        transferred in binary format."""
+        points = self.points_in_buffer
+        if points == 0:
+            return {"reading": np.empty(0)}
+        self.write(":FORM:DATA SRE;:FORM:BORD SWAP")
+        try:
+            self.write(f':TRAC:DATA? 1, {points:d}, "defbuffer1", READ')
+            data = self.read_ieee_block(dtype="<f4", count=points)
+        finally:
+            # Other queries expect ASCII responses
+            self.write(":FORM:DATA ASC")
+        return {"reading": data.astype(np.float64)}
+
     ###########
     # Formats #
     ###########
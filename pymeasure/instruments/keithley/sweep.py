@@ -0,0 +1,159 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+from time import sleep, time
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+#: Names of the elements of :code:`:FORM:ELEM` in :attr:`KeithleySweep.sweep_data`.
+ELEMENT_NAMES = {
+    "VOLT": "voltage",
+    "CURR": "current",
+    "RES": "resistance",
+    "TIME": "time",
+    "STAT": "status",
+}
+
+
+class KeithleySweep:
+    """ Implements sweeps, which run on the instrument and store their readings in the
+    buffer, such that a whole sweep costs a few round trips instead of some per point.
+
+    The sweep is configured with :meth:`configure_sweep`, started with
+    :meth:`start_sweep`, and its end is detected with the operation complete event of the
+    status register. :attr:`sweep_data` fetches the buffer in one binary transfer.
+
+    .. code-block:: python
+
+        smu.apply_voltage(compliance_current=10e-3)
+        smu.measure_current()
+        smu.enable_source()
+        data = smu.sweep(start=0, stop=1, points=101, should_stop=self.should_stop)
+        if data is not None:
+            self.emit('batch results', {'Voltage': data['voltage'],
+                                        'Current': data['current']})
+
+    The default implementation sources a list or staircase sweep with the SCPI commands
+    of the Keithley 2400 and requires the
+    :class:`~pymeasure.instruments.keithley.buffer.KeithleyBuffer`.
+    """
+
+    #: Maximum number of values of a list sweep.
+    sweep_list_points = 100
+
+    def configure_sweep(self, values=None, start=None, stop=None, points=None,
+                        spacing="linear", source="voltage", delay=0):
+        """ Configure a sweep of the source, either of a list of `values` or a staircase
+        from `start` to `stop` with a number of `points`, and the buffer for its readings.
+
+        :param values: Sequence of source values of a list sweep.
+        :param start: First source value of a staircase sweep.
+        :param stop: Last source value of a staircase sweep.
+        :param points: Number of points of a staircase sweep.
+        :param spacing: 'linear' or 'log' spacing of a staircase sweep.
+        :param source: 'voltage' or 'current'.
+        :param delay: Source delay before each measurement in seconds.
+        :returns: The number of points of the sweep.
+        """
+        try:
+            function = {"voltage": "VOLT", "current": "CURR"}[source]
+        except KeyError:
+            raise ValueError(f"Invalid sweep source {source!r}, "
+                             "use 'voltage' or 'current'.") from None
+        if values is not None:
+            values = [float(value) for value in values]
+            points = len(values)
+            if not 0 < points <= self.sweep_list_points:
+                raise ValueError(f"A list sweep has 1 to {self.sweep_list_points} values.")
+            self.write(f":SOUR:FUNC {function};:SOUR:{function}:MODE LIST")
+            self.write(f":SOUR:LIST:{function} " + ",".join(f"{v:.9g}" for v in values))
+        elif None in (start, stop, points):
+            raise ValueError("A sweep requires either values or start, stop and points.")
+        else:
+            try:
+                spacing = {"linear": "LIN", "log": "LOG"}[spacing]
+            except KeyError:
+                raise ValueError(f"Invalid sweep spacing {spacing!r}, "
+                                 "use 'linear' or 'log'.") from None
+            points = int(points)
+            self.write(f":SOUR:FUNC {function};:SOUR:{function}:MODE SWE;"
+                       f":SOUR:SWE:SPAC {spacing};:SOUR:{function}:STAR {start:.9g};"
+                       f":SOUR:{function}:STOP {stop:.9g};:SOUR:SWE:POIN {points:d}")
+        self.write(f":SOUR:DEL {delay:g};:ARM:COUN 1;:TRIG:COUN {points:d}")
+        self.write(f":TRAC:CLEAR;:TRAC:POIN {points:d};:TRAC:FEED SENS;:TRAC:FEED:CONT NEXT")
+        self.check_errors()
+        return points
+
+    def start_sweep(self):
+        """ Start the configured sweep, which sets the operation complete event at its end. """
+        self.write("*CLS;:INIT;*OPC")
+
+    def is_sweep_complete(self):
+        """ Return True if the sweep is complete. """
+        return bool(int(self.ask("*ESR?")) & 1)
+
+    def wait_for_sweep(self, should_stop=lambda: False, timeout=60, interval=0.1):
+        """ Block the program, waiting for the end of the sweep. The sweep is aborted,
+        if the :code:`should_stop` function returns True.
+
+        :param should_stop: A function that returns True when the sweep should stop
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param interval: A time in seconds for how often to check if the sweep is complete
+        :returns: True if the sweep is complete, False if it was aborted.
+        """
+        t = time()
+        while not self.is_sweep_complete():
+            if should_stop():
+                self.write(":ABOR")
+                return False
+            if (time() - t) > timeout:
+                raise TimeoutError("Timed out waiting for the Keithley sweep.")
+            sleep(interval)
+        return True
+
+    @property
+    def sweep_data(self):
+        """ Get a dictionary of numpy arrays of the buffered readings per element,
+        e.g. 'voltage' and 'current'. """
+        elements = [ELEMENT_NAMES.get(element.strip(), element.strip().lower())
+                    for element in self.ask(":FORM:ELEM?").split(",")]
+        data = self.buffer_data.reshape(-1, len(elements))
+        return {element: data[:, i] for i, element in enumerate(elements)}
+
+    def sweep(self, should_stop=lambda: False, timeout=60, interval=0.1, **kwargs):
+        """ Configure, run and read a sweep.
+
+        :param should_stop: A function that returns True when the sweep should stop
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param interval: A time in seconds for how often to check if the sweep is complete
+        :param \\**kwargs: Keyword arguments for :meth:`configure_sweep`.
+        :returns: :attr:`sweep_data`, or None if the sweep was aborted.
+        """
+        self.configure_sweep(**kwargs)
+        self.start_sweep()
+        if not self.wait_for_sweep(should_stop, timeout, interval):
+            return None
+        return self.sweep_data
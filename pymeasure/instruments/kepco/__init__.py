@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .kepcobop import KepcoBOP3612
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .kepcobop import KepcoBOP3612
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".kepcobop": ["KepcoBOP3612"],
+})
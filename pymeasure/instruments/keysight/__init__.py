@@ -22,23 +22,51 @@
 # THE SOFTWARE.
 #
 
-from .keysight33250A import Keysight33250A
-from .keysight81160A import Keysight81160A
-from .keysightDSOX1102G import KeysightDSOX1102G
-from .keysightE364xA import (
-    KeysightE3640A,
-    KeysightE3641A,
-    KeysightE3642A,
-    KeysightE3643A,
-    KeysightE3644A,
-    KeysightE3645A,
-    KeysightE3646A,
-    KeysightE3647A,
-    KeysightE3648A,
-    KeysightE3649A,
-)
-from .keysightE3631A import KeysightE3631A
-from .keysightE36312A import KeysightE36312A
-from .keysightN5767A import KeysightN5767A
-from .keysightN7776C import KeysightN7776C
-from .keysightPNA import KeysightPNA
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .keysight33250A import Keysight33250A
+    from .keysight81160A import Keysight81160A
+    from .keysightDSOX1102G import KeysightDSOX1102G
+    from .keysightE364xA import (
+        KeysightE3640A,
+        KeysightE3641A,
+        KeysightE3642A,
+        KeysightE3643A,
+        KeysightE3644A,
+        KeysightE3645A,
+        KeysightE3646A,
+        KeysightE3647A,
+        KeysightE3648A,
+        KeysightE3649A,
+    )
+    from .keysightE3631A import KeysightE3631A
+    from .keysightE36312A import KeysightE36312A
+    from .keysightN5767A import KeysightN5767A
+    from .keysightN7776C import KeysightN7776C
+    from .keysightPNA import KeysightPNA
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".keysight33250A": ["Keysight33250A"],
+    ".keysight81160A": ["Keysight81160A"],
+    ".keysightDSOX1102G": ["KeysightDSOX1102G"],
+    ".keysightE364xA": [
+        "KeysightE3640A",
+        "KeysightE3641A",
+        "KeysightE3642A",
+        "KeysightE3643A",
+        "KeysightE3644A",
+        "KeysightE3645A",
+        "KeysightE3646A",
+        "KeysightE3647A",
+        "KeysightE3648A",
+        "KeysightE3649A",
+    ],
+    ".keysightE3631A": ["KeysightE3631A"],
+    ".keysightE36312A": ["KeysightE36312A"],
+    ".keysightN5767A": ["KeysightN5767A"],
+    ".keysightN7776C": ["KeysightN7776C"],
+    ".keysightPNA": ["KeysightPNA"],
+})
@@ -239,13 +239,24 @@ class Keysight81160AChannel(Agilent33500Channel):
 
         :param waveform: The waveform data to be set (array-like).
         """
+        self.upload_waveform_volatile(waveform)
+
+    def upload_waveform_volatile(self, waveform, progress=None, should_stop=None):
+        """
+        Upload waveform data to the volatile memory in chunks, see :attr:`waveform_volatile`.
+
+        :param waveform: The waveform data to be set (array-like).
+        :param progress: Function called with the numbers of written and of all bytes.
+        :param should_stop: Function returning True to cancel the upload.
+        """
         self._waveform_volatile = np.array(waveform, dtype=np.float64)
         waveform_int = self._preprocess_waveform(self._waveform_volatile)
-        self.write_binary_values(
-            command=f":DATA{self.id}:DAC VOLATILE,",
-            values=waveform_int,
-            datatype="h",
-            is_big_endian=True,
+        self.write_ieee_block(
+            f":DATA{self.id}:DAC VOLATILE,",
+            waveform_int,
+            dtype=">i2",
+            progress=progress,
+            should_stop=should_stop,
         )
 
     def save_waveform(self, waveform, name):
@@ -24,12 +24,14 @@
 
 import logging
 from collections.abc import Mapping
+from functools import partial
 from typing import Literal
 
 import numpy as np
 
 from pymeasure.instruments import Channel, Instrument, SCPIUnknownMixin
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
+from pymeasure.instruments.waveforms import pipelined, waveform_record
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -512,7 +514,6 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         :return data_ndarray, waveform_preamble_dict: see waveform_preamble property for dict
             format.
         """
-        # TODO: Consider downloading from multiple sources at the same time.
         self.waveform_source = source
         self.waveform_points_mode = "normal"
         self.waveform_points = points
@@ -521,6 +522,55 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         data_bytes = self.waveform_data
         return np.array(data_bytes), preamble
 
+    def download_waveforms(self, sources, points=62500):
+        """ Get data from several sources of the oscilloscope in one pass. Returned objects are
+        a structured np.ndarray with a "time" field and one field of data values for each source,
+        and a dict of the waveform preamble for each source.
+
+        The data is transferred in binary format, the next request is sent while the previous
+        response is being decoded.
+
+        .. code-block:: python
+
+            record, preambles = scope.download_waveforms(["channel1", "channel2"], points=2000)
+            plt.plot(record["time"], record["channel1"], record["time"], record["channel2"])
+
+        :param sources: list of measurement sources, see :meth:`download_data`.
+        :param points: integer number of points to acquire, see :meth:`download_data`.
+
+        :return record_ndarray, waveform_preambles_dict: see waveform_preamble property for the
+            format of each preamble.
+        """
+        self.waveform_points_mode = "normal"
+        self.waveform_points = points
+        self.waveform_format = "word"
+        self.write(":waveform:byteorder LSBF;:waveform:unsigned 1")
+
+        steps = []
+        for source in sources:
+            steps.append((partial(self._request_preamble, source), self._read_preamble))
+            steps.append((partial(self.write, ":waveform:data?"),
+                          partial(self.read_ieee_block, dtype="<u2")))
+        responses = pipelined(steps)
+        waveforms = {}
+        preambles = {}
+        for source in sources:
+            preamble = preambles[source] = next(responses)
+            data = next(responses)
+            waveforms[source] = ((data.astype(np.float64) - preamble["yreference"])
+                                 * preamble["yincrement"] + preamble["yorigin"])
+        preamble = preambles[sources[0]]
+        time_values = ((np.arange(len(waveforms[sources[0]])) - preamble["xreference"])
+                       * preamble["xincrement"] + preamble["xorigin"])
+        return waveform_record(time_values, waveforms), preambles
+
+    def _request_preamble(self, source):
+        self.waveform_source = source
+        self.write(":waveform:preamble?")
+
+    def _read_preamble(self):
+        return self._format_preamble([float(v) for v in self.read().split(",")])
+
     def _timebase(self):
         """
         Reads setup data from timebase and converts it to a more convenient dict of values.
@@ -553,7 +603,13 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         """
         Reads waveform preamble and converts it to a more convenient dict of values.
         """
-        vals = self.values(":waveform:preamble?")
+        return self._format_preamble(self.values(":waveform:preamble?"))
+
+    @staticmethod
+    def _format_preamble(vals):
+        """
+        Converts the waveform preamble values to a more convenient dict of values.
+        """
         # Get values to dict
         vals_dict: Mapping[str, str | float] = dict(
             zip(
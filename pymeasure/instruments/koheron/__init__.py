@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .koheron_ctl200 import CTL200, KoheronError
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .koheron_ctl200 import CTL200, KoheronError
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".koheron_ctl200": ["CTL200", "KoheronError"],
+})
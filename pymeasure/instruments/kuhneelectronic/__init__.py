@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .kusg245_250a import Kusg245_250A
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .kusg245_250a import Kusg245_250A
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".kusg245_250a": ["Kusg245_250A"],
+})
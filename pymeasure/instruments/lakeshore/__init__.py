@@ -21,9 +21,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
-from .lakeshore3xx import LakeShore3xx
-from .lakeshore211 import LakeShore211
-from .lakeshore224 import LakeShore224
-from .lakeshore331 import LakeShore331
-from .lakeshore421 import LakeShore421
-from .lakeshore425 import LakeShore425
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .lakeshore3xx import LakeShore3xx
+    from .lakeshore211 import LakeShore211
+    from .lakeshore224 import LakeShore224
+    from .lakeshore331 import LakeShore331
+    from .lakeshore421 import LakeShore421
+    from .lakeshore425 import LakeShore425
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".lakeshore3xx": ["LakeShore3xx"],
+    ".lakeshore211": ["LakeShore211"],
+    ".lakeshore224": ["LakeShore224"],
+    ".lakeshore331": ["LakeShore331"],
+    ".lakeshore421": ["LakeShore421"],
+    ".lakeshore425": ["LakeShore425"],
+})
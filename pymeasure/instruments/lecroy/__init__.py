@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .lecroyT3DSO1204 import LeCroyT3DSO1204
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .lecroyT3DSO1204 import LeCroyT3DSO1204
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".lecroyT3DSO1204": ["LeCroyT3DSO1204"],
+})
@@ -22,6 +22,17 @@
 # THE SOFTWARE.
 #
 
-from .mks937b import MKS937B
-from .mks974b import MKS974B
-from .mksinst import MKSInstrument
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .mks937b import MKS937B
+    from .mks974b import MKS974B
+    from .mksinst import MKSInstrument
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".mks937b": ["MKS937B"],
+    ".mks974b": ["MKS974B"],
+    ".mksinst": ["MKSInstrument"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .esp300 import ESP300
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .esp300 import ESP300
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".esp300": ["ESP300"],
+})
@@ -22,16 +22,15 @@
 # THE SOFTWARE.
 #
 
-try:
-    from .daqmx import DAQmx
-except OSError:
-    # Error Logging is handled within package
-    pass
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
 
-try:
+if TYPE_CHECKING:
+    from .daqmx import DAQmx
     from .virtualbench import VirtualBench
-    # direct access to armstrap/pyvirtualbench wrapper:
-    # from .virtualbench import VirtualBench_Direct
-except ModuleNotFoundError:
-    # Error Logging is handled within package
-    pass
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".daqmx": ["DAQmx"],
+    ".virtualbench": ["VirtualBench"],
+}, optional=[".daqmx", ".virtualbench"])
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .fpu60 import Fpu60
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .fpu60 import Fpu60
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".fpu60": ["Fpu60"],
+})
@@ -22,7 +22,19 @@
 # THE SOFTWARE.
 #
 
-from .nova import Nova
-from .novaII import NovaII
-from .ophir_base import OphirBase
-from .vega import Vega
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .nova import Nova
+    from .novaII import NovaII
+    from .ophir_base import OphirBase
+    from .vega import Vega
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".nova": ["Nova"],
+    ".novaII": ["NovaII"],
+    ".ophir_base": ["OphirBase"],
+    ".vega": ["Vega"],
+})
@@ -22,8 +22,19 @@
 # THE SOFTWARE.
 #
 
+from typing import TYPE_CHECKING
 
-from .ips120_10 import IPS120_10
-from .itc503 import ITC503
-from .mercuryitc import MercuryiTC
-from .ps120_10 import PS120_10
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ips120_10 import IPS120_10
+    from .itc503 import ITC503
+    from .mercuryitc import MercuryiTC
+    from .ps120_10 import PS120_10
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ips120_10": ["IPS120_10"],
+    ".itc503": ["ITC503"],
+    ".mercuryitc": ["MercuryiTC"],
+    ".ps120_10": ["PS120_10"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .parkerGV6 import ParkerGV6
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .parkerGV6 import ParkerGV6
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".parkerGV6": ["ParkerGV6"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .cnt91 import CNT91
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .cnt91 import CNT91
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".cnt91": ["CNT91"],
+})
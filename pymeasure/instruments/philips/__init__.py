@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .PM6669 import PM6669
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .PM6669 import PM6669
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".PM6669": ["PM6669"],
+})
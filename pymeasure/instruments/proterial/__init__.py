@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .rod4 import ROD4
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .rod4 import ROD4
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".rod4": ["ROD4"],
+})
@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .ptwDIAMENTOR import ptwDIAMENTOR
-from .ptwUNIDOS import ptwUNIDOS
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ptwDIAMENTOR import ptwDIAMENTOR
+    from .ptwUNIDOS import ptwUNIDOS
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ptwDIAMENTOR": ["ptwDIAMENTOR"],
+    ".ptwUNIDOS": ["ptwUNIDOS"],
+})
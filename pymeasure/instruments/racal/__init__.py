@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .racal1992 import Racal1992
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .racal1992 import Racal1992
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".racal1992": ["Racal1992"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .razorbillRP100 import razorbillRP100
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .razorbillRP100 import razorbillRP100
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".razorbillRP100": ["razorbillRP100"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .redpitaya_scpi import RedPitayaScpi
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .redpitaya_scpi import RedPitayaScpi
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".redpitaya_scpi": ["RedPitayaScpi"],
+})
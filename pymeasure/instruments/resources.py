@@ -22,15 +22,22 @@
 # THE SOFTWARE.
 #
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import pyvisa
 from serial.serialutil import SerialException
 from serial.tools import list_ports
 
+from pymeasure.adapters.visa import _acquire_manager, _release_manager
+
 
-def list_resources():
+def list_resources(timeout=2000, max_workers=8, visa_library=""):
     """
     Prints the available resources, and returns a list of VISA resource names
 
+    The resources are identified in parallel, each with a timeout.
+
     .. code-block:: python
 
         resources = list_resources()
@@ -39,32 +46,41 @@ def list_resources():
             #1 : GPIB0::26::INSTR : Keithley Instruments Inc., Model 2612, *****
         dmm = Agilent34410(resources[0])
 
+    :param timeout: Timeout in ms for opening and identifying each resource.
+    :param max_workers: Maximum number of resources identified at the same time.
+    :param visa_library: VISA library, see :class:`~pymeasure.adapters.VISAAdapter`.
     """
-    rm = pyvisa.ResourceManager()
-    instrs = rm.list_resources()
-    for n, instr in enumerate(instrs):
-        # trying to catch errors in communication
-        try:
-            res = rm.open_resource(instr)
-            # try to avoid errors from *idn?
-            try:
-                # noinspection PyUnresolvedReferences
-                idn = res.query('*idn?')[:-1]
-            except pyvisa.Error:
-                idn = "Not known"
-            finally:
-                res.close()
-                print(n, ":", instr, ":", idn)
-        except pyvisa.VisaIOError as e:
-            print(n, ":", instr, ":", "Visa IO Error: check connections")
-            print(e)
-        except SerialException as e:
-            print(n, ":", instr, ":", "Serial port Error")
-            print(e)
-    rm.close()
+    rm = _acquire_manager(visa_library)
+    try:
+        instrs = rm.list_resources()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            idns = list(executor.map(partial(_identify, rm, timeout=timeout), instrs))
+    finally:
+        _release_manager(visa_library, rm)
+    for n, (instr, idn) in enumerate(zip(instrs, idns)):
+        print(n, ":", instr, ":", idn)
     return instrs
 
 
+def _identify(rm, resource_name, timeout):
+    """Return the identification of the resource or the error message."""
+    # trying to catch errors in communication
+    try:
+        res = rm.open_resource(resource_name, open_timeout=timeout, timeout=timeout)
+        # try to avoid errors from *idn?
+        try:
+            # noinspection PyUnresolvedReferences
+            return res.query('*idn?')[:-1]
+        except pyvisa.Error:
+            return "Not known"
+        finally:
+            res.close()
+    except pyvisa.VisaIOError as e:
+        return f"Visa IO Error: check connections\n{e}"
+    except SerialException as e:
+        return f"Serial port Error\n{e}"
+
+
 def find_serial_port(vendor_id=None, product_id=None, serial_number=None):
     """Find the VISA port name of the first serial device with the given USB information.
 
@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .rigol_dg800 import DG800
-from .rigol_dho_base import DHOBase
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .rigol_dg800 import DG800
+    from .rigol_dho_base import DHOBase
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".rigol_dg800": ["DG800"],
+    ".rigol_dho_base": ["DHOBase"],
+})
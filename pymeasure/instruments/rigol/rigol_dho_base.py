@@ -25,6 +25,7 @@
 import logging
 import time
 from enum import IntFlag
+from functools import partial
 
 import numpy as np
 
@@ -34,6 +35,7 @@ from pymeasure.instruments.validators import (
     strict_discrete_set,
     strict_range,
 )
+from pymeasure.instruments.waveforms import pipelined, transport_chunk_size, waveform_record
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -540,15 +542,51 @@ class DHOBase(SCPIMixin, Instrument):
             are :class:`numpy.ndarray` with the time axis in seconds and
             the voltage axis in Volts.
         """
+        voltages, preambles = self._download_waveforms([channel], mode, fmt)
+        return self._waveform_time(preambles[channel], len(voltages[channel])), voltages[channel]
 
+    def get_waveforms(self, channels=(1, 2), mode="NORM", fmt="BYTE"):
+        """Download the waveforms of several channels of the same acquisition.
+
+        The waveforms are downloaded as with :meth:`get_waveform`, but the
+        scope is stopped only once for all channels.
+
+        .. code-block:: python
+
+            record, preambles = scope.get_waveforms([1, 2], mode="MAX")
+            plt.plot(record["time"], record["CHAN1"], record["time"], record["CHAN2"])
+
+        :param channels: Channel numbers 1-4.
+        :param mode: Waveform mode ``"NORM"``, ``"MAX"``, or ``"RAW"``, see
+            :meth:`get_waveform`.
+        :param fmt: Data format: ``"BYTE"`` or ``"WORD"``.
+        :returns: Tuple ``(record, preambles)`` of a structured
+            :class:`numpy.ndarray` with the fields ``"time"`` (in seconds) and
+            ``"CHAN<n>"`` (in Volts) and a dict of the waveform preambles of
+            the channel numbers, see :meth:`get_waveform_preamble`.
+        """
+        voltages, preambles = self._download_waveforms(channels, mode, fmt)
+        first = channels[0]
+        time_array = self._waveform_time(preambles[first], len(voltages[first]))
+        record = waveform_record(
+            time_array, {f"CHAN{channel}": voltage for channel, voltage in voltages.items()}
+        )
+        return record, preambles
+
+    def _download_waveforms(self, channels, mode, fmt):
+        """Download the waveforms of the channels in Volts and their preambles."""
         if fmt not in ("BYTE", "WORD"):
             raise ValueError(f"fmt must be 'BYTE' or 'WORD', got '{fmt}'")
         if mode not in ("NORM", "MAX", "RAW"):
             raise ValueError(
                 f"mode must be 'NORM', 'MAX', or 'RAW', got '{mode}'")
 
-        chunk_size = 1000
-        dtype = "H" if fmt == "WORD" else "B"
+        dtype = np.dtype("<u2" if fmt == "WORD" else "<u1")
+        # Size the chunks such that a block (with header and terminator) fits
+        # into one read of the transport, 1000 points if unknown.
+        overhead = 12
+        chunk_bytes = transport_chunk_size(self.adapter, 1000 * dtype.itemsize + overhead)
+        chunk_size = max((chunk_bytes - overhead) // dtype.itemsize, 1)
 
         # Stop scope if needed, remember state to restore later
         was_running = self.trigger_status != "STOP"
@@ -556,59 +594,56 @@ class DHOBase(SCPIMixin, Instrument):
             self.stop()
             time.sleep(0.1)  # wait for scope to be stopped
 
+        voltages = {}
+        preambles = {}
         try:
-            self._set_waveform_source(channel)
+            self._set_waveform_source(channels[0])
             self.write(f":WAV:MODE {mode}")
             self.write(f":WAV:FORM {fmt}")
 
-            pre = self.get_waveform_preamble(channel)
+            for channel in channels:
+                pre = self.get_waveform_preamble(channel)
 
-            if mode in ("MAX", "RAW"):
-                try:
-                    n_total = int(float(self.ask(":ACQ:MDEP?")))
-                except (ValueError, TypeError):
-                    # safe fallback for AUTO or unexpected response
+                if mode in ("MAX", "RAW"):
+                    try:
+                        n_total = int(float(self.ask(":ACQ:MDEP?")))
+                    except (ValueError, TypeError):
+                        # safe fallback for AUTO or unexpected response
+                        n_total = pre["points"]
+                else:
                     n_total = pre["points"]
-            else:
-                n_total = pre["points"]
-
-            all_samples = []
-
-            if mode in ("MAX", "RAW"):
-                for start in range(1, n_total + 1, chunk_size):
-                    stop = min(start + chunk_size - 1, n_total)
-                    self.write(f":WAV:STAR {start}")
-                    self.write(f":WAV:STOP {stop}")
-                    self.write(":WAV:DATA?")
-                    header = self.read_bytes(2)
-                    n_digits = int(chr(header[1]))
-                    n_data_bytes = int(self.read_bytes(n_digits))
-                    raw = self.read_bytes(n_data_bytes)
-                    self.read_bytes(1)  # trailing terminator
-                    all_samples.append(
-                        np.frombuffer(raw, dtype=np.dtype(f"<{dtype}")))
-            else:
-                self.write(":WAV:STAR 1")
-                self.write(f":WAV:STOP {min(n_total, chunk_size)}")
-                self.write(":WAV:DATA?")
-                header = self.read_bytes(2)
-                n_digits = int(chr(header[1]))
-                n_data_bytes = int(self.read_bytes(n_digits))
-                raw = self.read_bytes(n_data_bytes)
-                self.read_bytes(1)  # trailing terminator
-                all_samples.append(
-                    np.frombuffer(raw, dtype=np.dtype(f"<{dtype}")))
+
+                steps = [
+                    (
+                        partial(self._request_waveform_chunk, start,
+                                min(start + chunk_size - 1, n_total)),
+                        partial(self.read_ieee_block, dtype=dtype),
+                    )
+                    for start in range(1, n_total + 1, chunk_size)
+                ]
+                # The next chunk is requested before the previous one is scaled
+                chunks = [(samples.astype(np.float64) - pre["yorigin"] - pre["yreference"])
+                          * pre["yincrement"] for samples in pipelined(steps)]
+                voltages[channel] = np.concatenate(chunks) if chunks else np.empty(0)
+                preambles[channel] = pre
 
         # Restore previous state
         finally:
             if mode in ("MAX", "RAW") and was_running:
                 self.run()
 
-        samples = np.concatenate(all_samples)
-        voltage = ((samples - pre["yorigin"] - pre["yreference"])
-                   * pre["yincrement"])
-        t = np.arange(len(samples)) * pre["xincrement"] + pre["xorigin"]
-        return t, voltage
+        return voltages, preambles
+
+    def _request_waveform_chunk(self, start, stop):
+        """Request the waveform samples from *start* to *stop* (1-based, inclusive)."""
+        self.write(f":WAV:STAR {start}")
+        self.write(f":WAV:STOP {stop}")
+        self.write(":WAV:DATA?")
+
+    @staticmethod
+    def _waveform_time(preamble, points):
+        """Return the time axis in seconds for *points* samples."""
+        return np.arange(points) * preamble["xincrement"] + preamble["xorigin"]
 
     def get_waveform_ascii(self, channel=1):
         """Download a waveform in ASCII format.
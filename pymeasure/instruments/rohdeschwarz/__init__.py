@@ -22,6 +22,17 @@
 # THE SOFTWARE.
 #
 
-from .fsseries import FSL, FSW
-from .hmp import HMP4040
-from .sfm import SFM
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .fsseries import FSL, FSW
+    from .hmp import HMP4040
+    from .sfm import SFM
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".fsseries": ["FSL", "FSW"],
+    ".hmp": ["HMP4040"],
+    ".sfm": ["SFM"],
+})
@@ -22,6 +22,17 @@
 # THE SOFTWARE.
 #
 
-from .tsl500series import TSL500Series
-from .tsl550 import TSL550
-from .tsl570 import TSL570
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .tsl500series import TSL500Series
+    from .tsl550 import TSL550
+    from .tsl570 import TSL570
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".tsl500series": ["TSL500Series"],
+    ".tsl550": ["TSL550"],
+    ".tsl570": ["TSL570"],
+})
@@ -22,7 +22,19 @@
 # THE SOFTWARE.
 #
 
-from .siglent_sds1000xhd import SDS1000XHD
-from .siglent_sds1072cml import SDS1072CML
-from .siglent_spd1168x import SPD1168X
-from .siglent_spd1305x import SPD1305X
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .siglent_sds1000xhd import SDS1000XHD
+    from .siglent_sds1072cml import SDS1072CML
+    from .siglent_spd1168x import SPD1168X
+    from .siglent_spd1305x import SPD1305X
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".siglent_sds1000xhd": ["SDS1000XHD"],
+    ".siglent_sds1072cml": ["SDS1072CML"],
+    ".siglent_spd1168x": ["SPD1168X"],
+    ".siglent_spd1305x": ["SPD1305X"],
+})
@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .dsp7225 import DSP7225
-from .dsp7265 import DSP7265
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .dsp7225 import DSP7225
+    from .dsp7265 import DSP7265
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".dsp7225": ["DSP7225"],
+    ".dsp7265": ["DSP7265"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .scu_ascii import SmarActSCU_ASCII
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .scu_ascii import SmarActSCU_ASCII
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".scu_ascii": ["SmarActSCU_ASCII"],
+})
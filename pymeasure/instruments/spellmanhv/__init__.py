@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .spellmanXRV import SpellmanXRV
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .spellmanXRV import SpellmanXRV
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".spellmanXRV": ["SpellmanXRV"],
+})
@@ -22,9 +22,23 @@
 # THE SOFTWARE.
 #
 
-from .ldc500series import LDC500Series
-from .sg380 import SG380
-from .sr510 import SR510
-from .sr570 import SR570
-from .sr830 import SR830
-from .sr860 import SR860
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ldc500series import LDC500Series
+    from .sg380 import SG380
+    from .sr510 import SR510
+    from .sr570 import SR570
+    from .sr830 import SR830
+    from .sr860 import SR860
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ldc500series": ["LDC500Series"],
+    ".sg380": ["SG380"],
+    ".sr510": ["SR510"],
+    ".sr570": ["SR570"],
+    ".sr830": ["SR830"],
+    ".sr860": ["SR860"],
+})
@@ -24,7 +24,7 @@
 
 import re
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from enum import IntFlag
 from threading import Event
 from typing import Literal
@@ -85,6 +85,8 @@ class SR830(Instrument):
     ]
     FILTER_SLOPES = [6, 12, 18, 24]
     EXPANSION_VALUES = [1, 10, 100]
+    #: Number of points the buffer holds.
+    BUFFER_SIZE = 16383
     RESERVE_VALUES = ['High Reserve', 'Normal', 'Low Noise']
     CHANNELS = ['X', 'Y', 'R']
     INPUT_CONFIGS = ['A', 'A - B', 'I (1 MOhm)', 'I (100 MOhm)']
@@ -591,6 +593,64 @@ class SR830(Instrument):
         ch2[index:count] = self.get_buffer(2, index, count)
         return (ch1.mean(), ch1.std(), ch2.mean(), ch2.std())
 
+    def stream_buffer(
+        self,
+        chunk: int = 1,
+        count: int | None = None,
+        has_aborted: Callable[..., bool] = lambda: False,
+        delay: float = 1e-3,
+    ) -> Generator[tuple[np.ndarray, np.ndarray], None, None]:
+        """Yield the content of the instrument buffer while it is being filled.
+
+        Whenever at least `chunk` new points are stored in the buffer, they are
+        transferred in binary format (see :meth:`get_buffer`) and yielded as a tuple of
+        two numpy arrays, one for each channel. Only the new points are kept in memory,
+        such that long acquisitions can be recorded continuously:
+
+        .. code-block:: python
+
+            lockin.reset_buffer()
+            lockin.start_buffer()
+            for ch1, ch2 in lockin.stream_buffer(chunk=64, has_aborted=self.should_stop):
+                self.emit('batch results', {'X': ch1, 'Y': ch2})
+
+        The buffer is paused once `count` points are read or `has_aborted` returns True.
+
+        The buffer holds at most :attr:`BUFFER_SIZE` points and has to be in shot mode
+        (the default), as it would overwrite unread points in loop mode. Once it is full,
+        the remaining points are read and the buffer is reset and started again, such that
+        streaming continues beyond the buffer size. Points are not stored while the buffer
+        is reset, which leaves a short gap in the data.
+
+        :param chunk: Minimum number of new points to transfer at once.
+        :param count: Total number of points to read, or None to stream until aborted.
+        :param has_aborted: A function that returns True when streaming should stop.
+        :param delay: Time in seconds between checks of the buffer count.
+        """
+        index = total = 0  # position in the buffer and number of points read in total
+        try:
+            while count is None or total < count:
+                stored = self.buffer_count
+                full = stored >= self.BUFFER_SIZE
+                current = stored if count is None else min(stored, index + count - total)
+                new = current - index
+                last = count is not None and total + new == count
+                if new >= chunk or (new > 0 and (last or full)):
+                    yield self.get_buffer(1, index, current), self.get_buffer(2, index, current)
+                    index = current
+                    total += new
+                elif not full:
+                    time.sleep(delay)
+                if full and (count is None or total < count):
+                    # Continue in the emptied buffer
+                    self.reset_buffer()
+                    self.write("STRT")
+                    index = 0
+                if has_aborted():
+                    break
+        finally:
+            self.pause_buffer()
+
     def pause_buffer(self) -> None:
         self.write("PAUS")
 
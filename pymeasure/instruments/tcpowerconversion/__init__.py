@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .tccxn import CXN
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .tccxn import CXN
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".tccxn": ["CXN"],
+})
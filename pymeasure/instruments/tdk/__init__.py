@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .tdk_gen40_38 import TDK_Gen40_38
-from .tdk_gen80_65 import TDK_Gen80_65
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .tdk_gen40_38 import TDK_Gen40_38
+    from .tdk_gen80_65 import TDK_Gen80_65
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".tdk_gen40_38": ["TDK_Gen40_38"],
+    ".tdk_gen80_65": ["TDK_Gen80_65"],
+})
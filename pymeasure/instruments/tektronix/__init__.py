@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .afg3152c import AFG3152C
-from .tds2000 import TDS2000
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .afg3152c import AFG3152C
+    from .tds2000 import TDS2000
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".afg3152c": ["AFG3152C"],
+    ".tds2000": ["TDS2000"],
+})
@@ -22,6 +22,17 @@
 # THE SOFTWARE.
 #
 
-from .teledyne_oscilloscope import TeledyneOscilloscope
-from .teledyneMAUI import TeledyneMAUI
-from .teledyneT3AFG import TeledyneT3AFG
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .teledyne_oscilloscope import TeledyneOscilloscope
+    from .teledyneMAUI import TeledyneMAUI
+    from .teledyneT3AFG import TeledyneT3AFG
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".teledyne_oscilloscope": ["TeledyneOscilloscope"],
+    ".teledyneMAUI": ["TeledyneMAUI"],
+    ".teledyneT3AFG": ["TeledyneT3AFG"],
+})
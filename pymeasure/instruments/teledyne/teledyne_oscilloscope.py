@@ -28,6 +28,8 @@ import time
 from abc import ABCMeta
 from collections.abc import Callable, Sequence
 from decimal import Decimal
+from functools import partial
+from itertools import chain
 from typing import Any, Literal, cast
 
 import numpy as np
@@ -46,6 +48,7 @@ from pymeasure.instruments.validators import (
     strict_discrete_set,
     strict_range,
 )
+from pymeasure.instruments.waveforms import pipelined, transport_chunk_size, waveform_record
 
 
 def sanitize_source(source: str) -> str:
@@ -789,12 +792,22 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         but in such a case it cannot be quaranteed that the message is received in its entirety.
 
         :param src: source of data: "C1", "C2", "C3", "C4", "MATH".
+        :param: num_bytes: number of bytes expected from the scope (including the header and
+        footer).
+        :return: bytearray with raw data.
+        """
+        self.write(f"{src}:WF? DAT2")
+        return self._read_digitized(num_bytes)
+
+    def _read_digitized(self, num_bytes: int | None = None):
+        """Read the waveform data requested by :meth:`_digitize`.
+
         :param: num_bytes: number of bytes expected from the scope (including the header and
         footer).
         :return: bytearray with raw data.
         """
         with _ChunkResizer(self.adapter, num_bytes):
-            binary_values = self.binary_values(f"{src}:WF? DAT2", dtype=np.uint8)
+            binary_values = self.read_binary_values(dtype=np.uint8)
         if num_bytes is not None and len(binary_values) != num_bytes:
             raise BufferError(f"read bytes ({len(binary_values)}) != requested bytes ({num_bytes})")
         return binary_values
@@ -828,17 +841,26 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         sanity-checked, but they are not processed otherwise. For a description of the input
         arguments refer to the download_waveform method.
         If the number of expected points is big enough, the transmission is split in smaller
-        chunks of 20k points and read one chunk at a time. I do not know the reason why,
-        but if the chunk size is big enough the transmission does not complete successfully.
+        chunks, which fit into one read of the transport (20k points if unknown), because the
+        transmission of bigger chunks does not complete successfully.
+        The next chunk is requested while the previous one is being checked.
         :return: raw data points as numpy array and waveform preamble
         """
         # Setup waveform acquisition parameters
         self.waveform_sparsing = sparsing
         self.waveform_points = requested_points
         self.waveform_first_point = 0
+        steps = self._chunk_steps(self.waveform_source, requested_points, sparsing)
+        data = np.concatenate(list(self._read_chunks(steps)))
+        preamble = self.waveform_preamble
+        return data, preamble
 
+    def _chunk_steps(self, source: str, requested_points: int, sparsing: int) -> list[tuple]:
+        """Return the steps of :func:`pipelined`, which request and read the raw data points of
+        `source` in chunks. The acquisition parameters have to be set up already.
+        """
         # Calculate how many points are to be expected
-        sample_points = self.acquisition_sample_size(self.waveform_source)
+        sample_points = self.acquisition_sample_size(source)
         if requested_points > 0:
             expected_points = min(requested_points, int(sample_points / sparsing))
         else:
@@ -846,35 +868,35 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
 
         # If the number of points is big enough, split the data in small chunks and read it one
         # chunk at a time. For less than a certain amount of points we do not bother splitting them.
-        chunk_bytes = 20000
+        chunk_bytes = transport_chunk_size(self.adapter, 20000)
         chunk_points = chunk_bytes - self._header_size - self._footer_size
-        iterations = -(expected_points // -chunk_points)
-        i = 0
-        data = []
-        while i < iterations:
-            # number of points already read
-            read_points = i * chunk_points
-            # number of points still to read
-            remaining_points = expected_points - read_points
+        steps = []
+        for read_points in range(0, expected_points, chunk_points):
             # number of points requested in a single chunk
-            requested_points = min(remaining_points, chunk_points)
-            self.waveform_points = requested_points
+            requested_points = min(expected_points - read_points, chunk_points)
             # number of bytes requested in a single chunk
             requested_bytes = requested_points + self._header_size + self._footer_size
-            # read the next chunk starting from this points
-            first_point = read_points * sparsing
-            self.waveform_first_point = first_point
-            # read chunk of points
-            values = self._digitize(src=self.waveform_source, num_bytes=requested_bytes)
+            steps.append((
+                # read the chunk of points starting from this point
+                partial(self._request_chunk, source, requested_points, read_points * sparsing),
+                partial(self._read_digitized, requested_bytes),
+            ))
+        return steps
+
+    def _read_chunks(self, steps):
+        """Yield the data points of each chunk of the pipelined `steps`, which are checked and
+        stripped of header and footer."""
+        for values in pipelined(steps):
             # perform many sanity checks on the received data
             self._header_footer_sanity_checks(values)
             self._npoints_sanity_checks(values)
-            # append the points without the header and footer
-            data.append(values[self._header_size:-self._footer_size])
-            i += 1
-        data = np.concatenate(data)
-        preamble = self.waveform_preamble
-        return data, preamble
+            yield values[self._header_size:-self._footer_size]
+
+    def _request_chunk(self, source: str, points: int, first_point: int) -> None:
+        """Request a chunk of `points` data points of `source` starting at `first_point`."""
+        self.waveform_points = points
+        self.waveform_first_point = first_point
+        self.write(f"{source}:WF? DAT2")
 
     #################
     # Download data #
@@ -898,21 +920,19 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
 
         :return: tuple of (numpy array of Y points, numpy array of X points, waveform preamble) """
 
-        def _scale_data(y):
-            if preamble["source"] == "MATH":
-                value = int.from_bytes([y], byteorder='big', signed=False) * preamble["ydiv"] / 25.
-                value -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
-            else:
-                value = int.from_bytes([y], byteorder='big', signed=True) * preamble["ydiv"] / 25.
-                value -= preamble["yoffset"]
-            return value
+        ydata = np.asarray(ydata, dtype=np.uint8)
+        if preamble["source"] == "MATH":
+            data_points = ydata.astype(np.float64) * preamble["ydiv"] / 25.
+            data_points -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
+        else:
+            data_points = ydata.view(np.int8).astype(np.float64) * preamble["ydiv"] / 25.
+            data_points -= preamble["yoffset"]
 
         def _scale_time(x):
             return float(Decimal(-preamble["xdiv"] * self._grid_number / 2.) +
                          Decimal(float(x * preamble["sparsing"])) /
                          Decimal(preamble["sampling_rate"]))
 
-        data_points = np.vectorize(_scale_data)(ydata)
         time_points = np.vectorize(_scale_time)(np.arange(len(data_points)))
         return data_points, time_points, preamble
 
@@ -943,14 +963,70 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         self.waveform_source = sanitize_source(source)
         # Acquire the Y data and the preamble
         ydata, preamble = self._acquire_data(requested_points, sparsing)
-        # Update the preamble with info about actually acquired data
+        return self._process_waveform(ydata, preamble, requested_points, sparsing)
+
+    def _process_waveform(self, ydata, preamble: dict[str, Any], requested_points: int,
+                          sparsing: int) -> tuple[Any, Any, dict[str, Any]]:
+        """Update the preamble with info about the actually acquired data, scale the Y-data
+        and create the X-data."""
         preamble["transmitted_points"] = len(ydata)
         preamble["requested_points"] = requested_points
         preamble["sparsing"] = sparsing
         preamble["first_point"] = 0
-        # Scale the Y-data and create the X-data
         return self._process_data(ydata, preamble)
 
+    def download_waveforms(
+        self, sources: Sequence[str], requested_points: int | None = None,
+        sparsing: int | None = None
+    ) -> tuple[np.ndarray, dict[str, dict[str, Any]]]:
+        """Get data points from several sources of the oscilloscope.
+
+        The returned objects are a structured np.ndarray with a "time" field and a field of data
+        points for each source, e.g. "C1", and a dict with the waveform preamble of each source.
+
+        The acquisition parameters are set up once and the chunks of all sources are
+        transferred in one pipeline, i.e. the first chunk of a source is requested while the
+        last chunk of the previous source is being checked. The preambles are read afterwards.
+        The sources have to share the time axis, otherwise a ValueError is raised.
+
+        :param sources: measurement sources. They can be "C1", "C2", "C3", "C4", "MATH".
+        :param requested_points: number of points to acquire, see :meth:`download_waveform`.
+        :param sparsing: interval between data points, see :meth:`download_waveform`.
+        :return: record_ndarray, waveform_preambles_dict: see waveform_preamble
+                 property for the dict format of each preamble.
+        """
+        # Sanitize the input arguments
+        if not sparsing:
+            sparsing = self.waveform_sparsing
+        if requested_points is None:
+            requested_points = self.waveform_points
+        sources = [sanitize_source(source) for source in sources]
+        # Setup waveform acquisition parameters once for all sources
+        self.waveform_sparsing = sparsing
+        self.waveform_points = requested_points
+        self.waveform_first_point = 0
+        steps = {source: self._chunk_steps(source, requested_points, sparsing)
+                 for source in sources}
+        chunks = iter(list(self._read_chunks(chain.from_iterable(steps.values()))))
+        waveforms = {}
+        preambles = {}
+        time_points = None
+        for source, source_steps in steps.items():
+            ydata = np.concatenate([next(chunks) for _ in source_steps])
+            self.waveform_source = source
+            data_points, source_time, preamble = self._process_waveform(
+                ydata, self.waveform_preamble, requested_points, sparsing)
+            if time_points is None:
+                time_points = source_time
+            elif not np.array_equal(time_points, source_time):
+                raise ValueError(f"The time axis of {source} differs from the one of "
+                                 f"{sources[0]}.")
+            waveforms[preamble["source"]] = data_points
+            preambles[preamble["source"]] = preamble
+        if time_points is None:
+            time_points = np.empty(0)
+        return waveform_record(time_points, waveforms), preambles
+
     ###############
     #   Trigger   #
     ###############
@@ -22,7 +22,19 @@
 # THE SOFTWARE.
 #
 
-from .temptronic_ats525 import ATS525
-from .temptronic_ats545 import ATS545
-from .temptronic_base import ATSBase
-from .temptronic_eco560 import ECO560
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .temptronic_ats525 import ATS525
+    from .temptronic_ats545 import ATS545
+    from .temptronic_base import ATSBase
+    from .temptronic_eco560 import ECO560
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".temptronic_ats525": ["ATS525"],
+    ".temptronic_ats545": ["ATS545"],
+    ".temptronic_base": ["ATSBase"],
+    ".temptronic_eco560": ["ECO560"],
+})
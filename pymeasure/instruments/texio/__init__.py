@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .texioPSW360L30 import TexioPSW360L30
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .texioPSW360L30 import TexioPSW360L30
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".texioPSW360L30": ["TexioPSW360L30"],
+})
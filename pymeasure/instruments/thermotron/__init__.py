@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .thermotron3800 import Thermotron3800
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .thermotron3800 import Thermotron3800
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".thermotron3800": ["Thermotron3800"],
+})
@@ -22,6 +22,17 @@
 # THE SOFTWARE.
 #
 
-from .thorlabsmbxseries import ThorlabsMBXSeries
-from .thorlabspm100usb import ThorlabsPM100USB
-from .thorlabspro8000 import ThorlabsPro8000
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .thorlabsmbxseries import ThorlabsMBXSeries
+    from .thorlabspm100usb import ThorlabsPM100USB
+    from .thorlabspro8000 import ThorlabsPro8000
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".thorlabsmbxseries": ["ThorlabsMBXSeries"],
+    ".thorlabspm100usb": ["ThorlabsPM100USB"],
+    ".thorlabspro8000": ["ThorlabsPro8000"],
+})
@@ -22,5 +22,15 @@
 # THE SOFTWARE.
 #
 
-from .smartline_v1 import SmartlineV1
-from .smartline_v2 import VSH, VSM, VSP, VSR, SmartlineV2
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .smartline_v1 import SmartlineV1
+    from .smartline_v2 import VSH, VSM, VSP, VSR, SmartlineV2
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".smartline_v1": ["SmartlineV1"],
+    ".smartline_v2": ["VSH", "VSM", "VSP", "VSR", "SmartlineV2"],
+})
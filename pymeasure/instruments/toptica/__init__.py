@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .ibeamsmart import IBeamSmart
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .ibeamsmart import IBeamSmart
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".ibeamsmart": ["IBeamSmart"],
+})
@@ -22,4 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .velleman_k8090 import VellemanK8090, VellemanK8090Switches
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .velleman_k8090 import VellemanK8090, VellemanK8090Switches
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".velleman_k8090": ["VellemanK8090", "VellemanK8090Switches"],
+})
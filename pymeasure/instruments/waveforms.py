@@ -0,0 +1,96 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Helpers to download waveforms from oscilloscopes."""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+def transport_chunk_size(adapter, default: int) -> int:
+    """Return the number of bytes the connection of the `adapter` reads at once.
+
+    :param adapter: Adapter of the instrument.
+    :param default: Value returned, if the connection does not provide a chunk size.
+    """
+    chunk_size = getattr(getattr(adapter, "connection", None), "chunk_size", None)
+    if isinstance(chunk_size, int) and chunk_size > 0:
+        return chunk_size
+    return default
+
+
+def pipelined(steps: Iterable[tuple[Callable[[], None], Callable[[], T]]]) -> Iterator[T]:
+    """Yield the responses of several requests, sending each request before the previous
+    response is processed.
+
+    Every step consists of a function writing the request and a function reading its
+    response. After a response is read, the request of the next step is written, such that
+    the instrument prepares the next response while the previous one is being decoded.
+
+    .. code-block:: python
+
+        steps = [(partial(instrument.write, f"DATA? {i}"), instrument.read_ieee_block)
+                 for i in range(chunks)]
+        data = np.concatenate(list(pipelined(steps)))
+
+    :param steps: Iterable of tuples of request and read function.
+    """
+    steps = iter(steps)
+    step = next(steps, None)
+    if step is None:
+        return
+    request, read = step
+    request()
+    for next_request, next_read in steps:
+        response = read()
+        next_request()
+        yield response
+        read = next_read
+    yield read()
+
+
+def waveform_record(time: np.ndarray, waveforms: Mapping[str, np.ndarray]) -> np.ndarray:
+    """Combine the time axis and the waveforms of several sources in a structured array.
+
+    The array has a field "time" and one field for each source, for example
+    ``record["time"]`` and ``record["C1"]``.
+
+    :param time: Time values in seconds.
+    :param waveforms: Dictionary of source names and their values.
+    :raises ValueError: if the waveforms differ in length.
+    """
+    dtype = [("time", np.float64)] + [(str(source), np.float64) for source in waveforms]
+    record = np.empty(len(time), dtype=dtype)
+    record["time"] = time
+    for source, values in waveforms.items():
+        if len(values) != len(time):
+            raise ValueError(
+                f"Waveform of {source} has {len(values)} points instead of {len(time)}."
+            )
+        record[str(source)] = values
+    return record
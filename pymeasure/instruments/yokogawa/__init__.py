@@ -22,6 +22,35 @@
 # THE SOFTWARE.
 #
 
-from .aq6370series import AQ6370C, AQ6370D, AQ6370E, AQ6373, AQ6373B, AQ6375, AQ6375B, AQ6370Series
-from .yokogawa7651 import Yokogawa7651
-from .yokogawags200 import YokogawaGS200
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_import
+
+if TYPE_CHECKING:
+    from .aq6370series import (
+        AQ6370C,
+        AQ6370D,
+        AQ6370E,
+        AQ6373,
+        AQ6373B,
+        AQ6375,
+        AQ6375B,
+        AQ6370Series,
+    )
+    from .yokogawa7651 import Yokogawa7651
+    from .yokogawags200 import YokogawaGS200
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".aq6370series": [
+        "AQ6370C",
+        "AQ6370D",
+        "AQ6370E",
+        "AQ6373",
+        "AQ6373B",
+        "AQ6375",
+        "AQ6375B",
+        "AQ6370Series",
+    ],
+    ".yokogawa7651": ["Yokogawa7651"],
+    ".yokogawags200": ["YokogawaGS200"],
+})
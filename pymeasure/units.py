@@ -22,6 +22,19 @@
 # THE SOFTWARE.
 #
 
-import pint
+from typing import TYPE_CHECKING, Any
 
-ureg = pint.get_application_registry()
+if TYPE_CHECKING:
+    import pint
+
+    ureg: pint.ApplicationRegistry
+
+
+def __getattr__(name: str) -> Any:
+    # pint is imported on the first access of the registry, as it is slow to import
+    if name == "ureg":
+        import pint
+
+        globals()["ureg"] = registry = pint.get_application_registry()
+        return registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
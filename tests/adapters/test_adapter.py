@@ -97,12 +97,63 @@ def test_read_binary_values(response, options, result):
     assert list(a.read_binary_values(**options)) == pytest.approx(result)
 
 
+@pytest.mark.parametrize("response, options, result", (
+    (b"#212\x00\x00\x80?\x00\x00\x00@\x00\x00@@\n", {}, [1, 2, 3]),
+    (b"#0\x00\x00\x80?\x00\x00\x00@\n", {"count": 2}, [1, 2]),
+    (b"#14?\x80\x00\x00", {"dtype": ">f4", "termination_bytes": 0}, [1]),
+    (b"#10\n", {}, []),
+))
+def test_read_ieee_block(response, options, result):
+    a = ProtocolAdapter([(None, response)])
+    assert list(a.read_ieee_block(**options)) == pytest.approx(result)
+
+
+@pytest.mark.parametrize("response", (b"12,3\n", b"#0\x00\x00\x80?\n"))
+def test_read_ieee_block_invalid(response):
+    a = ProtocolAdapter([(None, response)])
+    with pytest.raises(ValueError):
+        a.read_ieee_block()
+
+
 def test_write_binary_values():
     """Test write_binary_values in the ieee header format."""
     a = ProtocolAdapter([(b'CMD#212\x00\x00\x80?\x00\x00\x00@\x00\x00@@\n', None)])
     a.write_binary_values("CMD", [1, 2, 3], termination="\n")
 
 
+def test_write_ieee_block():
+    a = ProtocolAdapter([(b'CMD#212\x00\x00\x80?\x00\x00\x00@\x00\x00@@\n', None)])
+    assert a.write_ieee_block("CMD", [1, 2, 3], termination="\n") == 12
+
+
+def test_write_ieee_block_in_chunks():
+    a = ProtocolAdapter()
+    writes = []
+    a.write_bytes = writes.append
+    progress = []
+    a.write_ieee_block("CMD", [1, 2], dtype=">i2", chunk_size=1,
+                       progress=lambda written, total: progress.append((written, total)))
+    assert writes == [b"CMD#14", b"\x00", b"\x01", b"\x00", b"\x02"]
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_write_ieee_block_cancelled():
+    a = ProtocolAdapter()
+    writes = []
+    a.write_bytes = writes.append
+    assert a.write_ieee_block("CMD", [1, 2], dtype="<i2", chunk_size=2,
+                              should_stop=lambda: len(writes) > 1) == 2
+    assert writes == [b"CMD#14", b"\x01\x00"]
+
+
+def test_write_ieee_block_cancelled_before_last_chunk():
+    a = ProtocolAdapter()
+    writes = []
+    a.write_bytes = writes.append
+    assert a.write_ieee_block("CMD", [1], dtype="<i2", should_stop=lambda: True) == 0
+    assert writes == [b"CMD#12"]
+
+
 class TestLoggingForTestGenerator:
     """The test Generator relies on specific logging in the adapter, these tests ensure that."""
     message = b"some written message"
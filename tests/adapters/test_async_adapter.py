@@ -0,0 +1,107 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters import AsyncAdapter, FakeAdapter, SocketAsyncAdapter, ThreadedAsyncAdapter
+from pymeasure.instruments import Instrument
+
+
+class TestThreadedAsyncAdapter:
+    @pytest.fixture()
+    def adapter(self):
+        adapter = ThreadedAsyncAdapter(FakeAdapter())
+        yield adapter
+        adapter.close()
+
+    def test_write_read(self, adapter):
+        async def communicate():
+            await adapter.write("abc")
+            return await adapter.read()
+
+        assert asyncio.run(communicate()) == "abc"
+
+    def test_write_bytes_read_bytes(self, adapter):
+        async def communicate():
+            await adapter.write_bytes(b"abc")
+            return await adapter.read_bytes(2)
+
+        assert asyncio.run(communicate()) == b"ab"
+
+    def test_run_in_communication_thread(self, adapter):
+        name = asyncio.run(adapter.run(lambda: threading.current_thread().name))
+        assert name.startswith("AsyncAdapter")
+
+
+def test_base_class_not_implemented():
+    with pytest.raises(NotImplementedError):
+        asyncio.run(AsyncAdapter().write("abc"))
+
+
+class TestSocketAsyncAdapter:
+    @staticmethod
+    async def serve(handler, communicate):
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        adapter = SocketAsyncAdapter("127.0.0.1", port, timeout=0.5)
+        try:
+            async with server:
+                return await communicate(adapter)
+        finally:
+            adapter.close()
+
+    @staticmethod
+    async def echo(reader, writer):
+        while line := await reader.readline():
+            writer.write(b"reply " + line)
+            await writer.drain()
+        writer.close()
+
+    def test_ask(self):
+        async def communicate(adapter):
+            inst = Instrument(FakeAdapter(), "test")
+            inst.async_adapter = adapter
+            return await asyncio.gather(inst.aask("A"), inst.aask("B"))
+
+        assert asyncio.run(self.serve(self.echo, communicate)) == ["reply A", "reply B"]
+
+    def test_read_binary_values(self):
+        data = np.arange(4, dtype=np.float32)
+
+        async def send(reader, writer):
+            await reader.readline()
+            writer.write(data.tobytes())
+            await writer.drain()
+            writer.close()
+
+        async def communicate(adapter):
+            await adapter.write("DATA?")
+            return await adapter.read_binary_values()
+
+        np.testing.assert_array_equal(asyncio.run(self.serve(send, communicate)), data)
@@ -121,6 +121,17 @@ def test_write_binary_values(test_input, expected):
         adapter.write_binary_values("OUTP", test_input, datatype='B')
 
 
+def test_write_ieee_block():
+    with expected_protocol(
+            PrologixAdapter,  # type: ignore
+            [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
+             ("++addr 5\n", None), (b"OUTP#17\x1b\x2b\x1b\x1b\x1b\x0a\x1b\x0dabc\n", None)],
+            address=5,
+    ) as adapter:
+        assert adapter.write_ieee_block("OUTP", [43, 27, 10, 13, 97, 98, 99], dtype="u1",
+                                        chunk_size=2) == 7
+
+
 def test_wait_for_srq():
     with expected_protocol(
             PrologixAdapter,  # type: ignore
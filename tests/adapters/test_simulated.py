@@ -0,0 +1,98 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import time
+
+import pytest
+
+from pymeasure.adapters import SimulatedAdapter
+from pymeasure.adapters.simulated import ieee_block_response, values_response
+
+
+def test_fixed_response():
+    adapter = SimulatedAdapter({"*IDN?": "Simulated,Instrument"})
+    adapter.write("*IDN?")
+    assert adapter.read() == "Simulated,Instrument"
+
+
+def test_set_and_query_state():
+    adapter = SimulatedAdapter()
+    adapter.write("VOLT 5")
+    adapter.write("VOLT?")
+    assert adapter.read() == "5"
+    assert adapter.state == {"VOLT": "5"}
+
+
+def test_several_commands():
+    adapter = SimulatedAdapter({"MEAS?": "1"})
+    adapter.write("VOLT 2;VOLT?;MEAS?")
+    assert adapter.read() == "21"
+
+
+def test_unknown_query():
+    adapter = SimulatedAdapter()
+    with pytest.raises(ValueError, match="VOLT?"):
+        adapter.write("VOLT?")
+
+
+def test_read_without_response():
+    with pytest.raises(TimeoutError):
+        SimulatedAdapter().read()
+
+
+def test_values_response():
+    adapter = SimulatedAdapter({"DATA?": values_response(10, seed=1)})
+    adapter.write("DATA?")
+    assert len(adapter.read().split(",")) == 10
+
+
+def test_ieee_block_response():
+    adapter = SimulatedAdapter({"CURV?": ieee_block_response(100, dtype="<f8", seed=1)})
+    adapter.write("CURV?")
+    values = adapter.read_ieee_block(dtype="<f8")
+    assert values.shape == (100,)
+    assert adapter._read_buffer == b""
+
+
+def test_read_bytes_in_parts():
+    adapter = SimulatedAdapter({"A?": b"abcdef"})
+    adapter.write("A?")
+    assert adapter.read_bytes(2) == b"ab"
+    assert adapter.read_bytes(-1) == b"cdef"
+
+
+def test_latency():
+    adapter = SimulatedAdapter({"A?": "1"}, transaction_latency=0.01, byte_latency=0.001)
+    start = time.perf_counter()
+    adapter.write("A?")  # 10 ms + 2 ms
+    adapter.read()  # 10 ms + 1 ms
+    assert time.perf_counter() - start >= 0.023
+
+
+def test_flush_read_buffer():
+    adapter = SimulatedAdapter({"A?": "1"})
+    adapter.write("A?")
+    adapter.flush_read_buffer()
+    with pytest.raises(TimeoutError):
+        adapter.read()
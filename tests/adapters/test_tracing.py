@@ -0,0 +1,130 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import json
+
+import pytest
+
+from pymeasure.adapters import AdapterTracer, FakeAdapter
+from pymeasure.instruments import Instrument
+
+
+@pytest.fixture()
+def tracer():
+    return AdapterTracer()
+
+
+@pytest.fixture()
+def fake(tracer):
+    adapter = FakeAdapter()
+    tracer.attach(adapter, name="fake")
+    return adapter
+
+
+def test_disabled_by_default():
+    assert FakeAdapter().tracer is None
+
+
+def test_record_query(tracer, fake):
+    fake.write("VOLT 5")
+    assert fake.read() == "VOLT 5"
+    write, read = tracer.transactions
+    assert (write.instrument, write.kind, write.command, write.size) == ("fake", "write",
+                                                                        "VOLT", 6)
+    assert write.latency is None
+    assert (read.kind, read.command) == ("read", "VOLT")
+    assert read.latency >= read.duration
+
+
+def test_further_reads_belong_to_command(tracer, fake):
+    fake.write_bytes(b"DATA?")
+    fake.read_bytes(2)
+    fake.read_bytes(-1)
+    first, second = list(tracer.transactions)[1:]
+    assert first.command == second.command == "DATA?"
+    assert first.latency is not None
+    assert second.latency is None
+
+
+def test_statistics(tracer, fake):
+    for _ in range(3):
+        fake.write("MEAS?")
+        fake.read()
+    fake.write("OUTP ON")
+    stats = tracer.statistics()
+    assert stats[("fake", "MEAS?")]["count"] == 6
+    assert stats[("fake", "MEAS?")]["p50"] <= stats[("fake", "MEAS?")]["p99"]
+    assert stats[("fake", "OUTP")]["bytes"] == 7
+    assert tracer.statistics(by="instrument")["fake"]["count"] == 7
+
+
+def test_statistics_invalid_grouping(tracer):
+    with pytest.raises(ValueError):
+        tracer.statistics(by="something")
+
+
+def test_histogram(tracer, fake):
+    fake.write("MEAS?")
+    fake.read()
+    counts, edges = tracer.histogram(command="MEAS?", bins=5)
+    assert counts.sum() == 1
+    assert len(edges) == 6
+
+
+def test_attach_instrument(tracer):
+    instr = Instrument(FakeAdapter(), "Test instrument")
+    tracer.attach(instr)
+    instr.ask("ID?")
+    assert {t.instrument for t in tracer.transactions} == {"Test instrument"}
+    tracer.detach(instr)
+    instr.ask("ID?")
+    assert len(tracer.transactions) == 2
+
+
+def test_instruments_with_the_same_name(tracer):
+    first, second = FakeAdapter(), FakeAdapter()
+    tracer.attach(first, name="same")
+    tracer.attach(second, name="same")
+    first.write("FIRST?")
+    second.write("SECOND?")
+    first.read()
+    second.read()
+    reads = [t for t in tracer.transactions if t.kind == "read"]
+    assert [t.command for t in reads] == ["FIRST?", "SECOND?"]
+
+
+def test_export(tracer, fake):
+    fake.write("MEAS?")
+    fake.read()
+    assert json.loads(tracer.to_json())[1]["command"] == "MEAS?"
+    events = json.loads(tracer.to_chrome_trace())["traceEvents"]
+    assert events[0]["args"]["name"] == "fake"
+    assert [e["name"] for e in events[1:]] == ["write MEAS?", "read MEAS?"]
+    assert events[2]["ph"] == "X"
+
+
+def test_clear(tracer, fake):
+    fake.write("MEAS?")
+    tracer.clear()
+    assert len(tracer.transactions) == 0
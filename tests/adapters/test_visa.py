@@ -106,6 +106,33 @@ class TestClose:
             _ = adapterC.manager.session
 
 
+class TestSharedManager:
+    def test_manager_shared_until_last_close(self):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim', read_termination="\n")
+        a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim', read_termination="\n")
+        assert a1.manager is a2.manager
+        a1.close()
+        assert a2.manager.session is not None
+        a2.close()
+        with pytest.raises(pyvisa.errors.InvalidSession, match="Invalid session"):
+            _ = a2.manager.session
+
+    def test_close_twice_releases_once(self):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a1.close()
+        a1.close()
+        assert a2.manager.session is not None
+        a2.close()
+
+    def test_resource_info_cached(self, monkeypatch):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        monkeypatch.setattr(a1.manager, "resource_info", None)  # must not be called
+        a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a2.close()
+        a1.close()
+
+
 def test_write_read(adapter):
     adapter.write(":VOLT:IMM:AMPL?")
     assert float(adapter.read()) == 1
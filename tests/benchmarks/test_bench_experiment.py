@@ -0,0 +1,108 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Benchmarks of storing and loading results and of running procedures in a worker."""
+
+import numpy as np
+import pytest
+
+from pymeasure.experiment import IntegerParameter, Procedure
+from pymeasure.experiment.results import Results
+from pymeasure.experiment.workers import Worker
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 10_000
+
+
+class FastProcedure(Procedure):
+    """Procedure emitting rows as fast as possible."""
+
+    iterations = IntegerParameter("Loop Iterations", default=ROWS)
+
+    DATA_COLUMNS = ["Iteration", "Voltage (V)", "Current (A)"]
+
+    def execute(self):
+        for i in range(self.iterations):
+            self.emit("results", {"Iteration": i, "Voltage (V)": 0.1 * i,
+                                  "Current (A)": 1e-3 * i})
+
+
+@pytest.fixture()
+def filename(tmp_path):
+    return str(tmp_path / "results.csv")
+
+
+def test_results_format(benchmark, filename):
+    results = Results(FastProcedure(), filename)
+    row = {"Iteration": 1, "Voltage (V)": 0.1, "Current (A)": 1e-3}
+    assert benchmark(results.format, row).startswith("1,")
+
+
+def test_results_format_many(benchmark, filename):
+    results = Results(FastProcedure(), filename)
+    columns = {"Iteration": np.arange(ROWS), "Voltage (V)": np.linspace(0, 1, ROWS),
+               "Current (A)": np.linspace(0, 1e-3, ROWS)}
+    assert len(benchmark(results.formatter.format_many, columns)) == ROWS
+
+
+def test_results_append(benchmark, filename):
+    results = Results(FastProcedure(), filename)
+    rows = [{"Iteration": i, "Voltage (V)": 0.1 * i, "Current (A)": 1e-3 * i}
+            for i in range(ROWS)]
+
+    def append():
+        with open(filename, "a", encoding=Results.ENCODING) as file:
+            file.writelines(results.format(row) + Results.LINE_BREAK for row in rows)
+    benchmark(append)
+
+
+def test_results_reload(benchmark, filename):
+    results = Results(FastProcedure(), filename)
+    with open(filename, "a", encoding=Results.ENCODING) as file:
+        file.writelines(f"{i},{0.1 * i},{1e-3 * i}{Results.LINE_BREAK}" for i in range(ROWS))
+
+    def load():
+        return Results.load(filename, procedure_class=FastProcedure).data
+    assert len(benchmark(load)) == ROWS
+    assert len(results.data) == ROWS
+
+
+def test_worker_rows_per_second(benchmark, tmp_path):
+    files = []
+
+    def setup():
+        files.append(str(tmp_path / f"results{len(files)}.csv"))
+        return (Worker(Results(FastProcedure(), files[-1])),), {}
+
+    def run(worker):
+        worker.start()
+        worker.join(timeout=60)
+        assert not worker.is_alive()
+
+    benchmark.pedantic(run, setup=setup, rounds=3)
+    for file in files:
+        assert len(Results.load(file, procedure_class=FastProcedure).data) == ROWS
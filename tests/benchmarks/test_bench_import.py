@@ -0,0 +1,48 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+"""Benchmarks of the import time of the packages, each in a new interpreter.
+
+The import of ``sys`` measures the startup of the interpreter itself.
+"""
+
+import importlib.util
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+MODULES = ["sys", "pymeasure", "pymeasure.instruments", "pymeasure.instruments.agilent",
+           "pymeasure.experiment", "pymeasure.display", "pymeasure.display.console"]
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import(benchmark, module):
+    if module.startswith("pymeasure.display") and importlib.util.find_spec("qtpy") is None:
+        pytest.skip("GUI dependencies are not installed.")
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", f"import {module}"],),
+                       kwargs={"check": True}, rounds=5, warmup_rounds=1)
@@ -0,0 +1,77 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Benchmarks of the communication hot paths with a simulated instrument without latency,
+such that the overhead of pymeasure itself is measured."""
+
+import pytest
+
+from pymeasure.adapters import SimulatedAdapter
+from pymeasure.adapters.simulated import ieee_block_response, values_response
+from pymeasure.instruments import Instrument
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+class SimulatedInstrument(Instrument):
+    voltage = Instrument.control("VOLT?", "VOLT %g", "Voltage in V.")
+
+    def __init__(self, adapter, name="Simulated instrument", **kwargs):
+        super().__init__(adapter, name, **kwargs)
+
+
+@pytest.fixture()
+def instrument():
+    adapter = SimulatedAdapter({
+        "VALS?": values_response(1000, seed=1),
+        "CURV?": ieee_block_response(1_000_000, seed=1),
+    })
+    return SimulatedInstrument(adapter)
+
+
+def test_property_get(benchmark, instrument):
+    instrument.voltage = 1.5
+    assert benchmark(lambda: instrument.voltage) == 1.5
+
+
+def test_property_set(benchmark, instrument):
+    def set_voltage():
+        instrument.voltage = 2.5
+    benchmark(set_voltage)
+    assert instrument.adapter.state["VOLT"] == "2.5"
+
+
+@pytest.mark.parametrize("as_array", (False, True))
+def test_values_parsing(benchmark, instrument, as_array):
+    values = benchmark(instrument.values, "VALS?", as_array=as_array)
+    assert len(values) == 1000
+
+
+def test_binary_download(benchmark, instrument):
+    def download():
+        instrument.write("CURV?")
+        return instrument.read_ieee_block(dtype="<f4")
+    assert benchmark(download).shape == (1_000_000,)
@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+import subprocess
+import sys
+
 import pytest
 
 from pymeasure.display.console import ConsoleArgumentParser
@@ -93,3 +96,21 @@ class TestArgHelpString:
         assert desc in help_line
         assert 'default' in help_line.lower()
         assert str(default_value) in help_line
+
+
+#: Dependencies, which the console imports only once they are needed.
+DEFERRED_MODULES = {"cloudpickle", "pandas", "pint", "pyqtgraph", "pyvisa", "setuptools_scm",
+                    "zmq"}
+
+
+def imported_modules(module: str) -> set[str]:
+    """Import `module` in a new interpreter and return the names of all imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(*sys.modules, sep='\\n')"],
+        capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestStartup:
+    def test_heavy_dependencies_are_deferred(self):
+        assert DEFERRED_MODULES.isdisjoint(imported_modules("pymeasure.display.console"))
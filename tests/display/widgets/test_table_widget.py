@@ -0,0 +1,132 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pymeasure.display.Qt import QtCore
+from pymeasure.display.widgets.table_widget import (
+    SORT_ROLE,
+    PandasModelByColumn,
+    PandasModelByRow,
+    ResultsTable,
+)
+
+Descending = QtCore.Qt.SortOrder.DescendingOrder
+
+
+def make_table(x, y, column_index=None):
+    results = mock.Mock(data=pd.DataFrame({"x": x, "y": y}), preview=None)
+    return ResultsTable(results, "red", column_index=column_index)
+
+
+def cell(model, row, col, role=QtCore.Qt.ItemDataRole.DisplayRole):
+    return model.data(model.index(row, col), role)
+
+
+@pytest.fixture()
+def model_by_row(qtbot):
+    model = PandasModelByRow()
+    model.add_results(make_table([1, 2, 3], [0.5, 0.25, 1 / 3]))
+    model.add_results(make_table([4, 5], [2.0, 0.125]))
+    return model
+
+
+def test_results_table_text():
+    table = make_table([1, 2], [1 / 3, 2.0])
+    assert table.text(0, 0) == "1"
+    assert table.text(0, 1, float_digits=3) == "0.333"
+    assert table.text(1, 1) == "2"
+
+
+def test_results_table_cache_reset_with_new_data():
+    table = make_table([1, 2], [1.0, 2.0])
+    assert table.text(0, 0) == "1"
+    table.data = pd.DataFrame({"x": [7, 8], "y": [1.0, 2.0]})
+    assert table.text(0, 0) == "7"
+
+
+def test_results_table_float_column():
+    table = make_table(["a", "2"], [1.0, 2.0])
+    np.testing.assert_array_equal(table.float_column(0), [np.nan, 2.0])
+
+
+def test_model_by_row_data(model_by_row):
+    assert model_by_row.rowCount() == 5
+    assert cell(model_by_row, 3, 0) == "4"
+    assert cell(model_by_row, 2, 1) == "0.333333"
+    assert cell(model_by_row, 4, 1, SORT_ROLE) == 0.125
+
+
+def test_model_by_row_sort(model_by_row):
+    model_by_row.sort(1)
+    assert [cell(model_by_row, row, 0) for row in range(5)] == ["5", "2", "3", "1", "4"]
+    model_by_row.sort(0, Descending)
+    assert [cell(model_by_row, row, 0) for row in range(5)] == ["5", "4", "3", "2", "1"]
+    model_by_row.sort(-1)
+    assert [cell(model_by_row, row, 0) for row in range(5)] == ["1", "2", "3", "4", "5"]
+
+
+def test_model_by_row_sort_follows_new_rows(model_by_row):
+    model_by_row.sort(0, Descending)
+    table = model_by_row.results_list[0]
+    table.results.data = pd.DataFrame({"x": [1, 2, 3, 9], "y": [0.5, 0.25, 1 / 3, 0]})
+    table.update_data()
+    assert model_by_row.rowCount() == 6
+    assert cell(model_by_row, 0, 0) == "9"
+
+
+def test_model_sort_keeps_persistent_indexes(model_by_row):
+    model_by_row.sort(0, Descending)
+    index = QtCore.QPersistentModelIndex(model_by_row.index(0, 1))
+    assert cell(model_by_row, index.row(), 1) == "0.125"
+    model_by_row.sort(0)
+    assert index.row() == 4
+    assert cell(model_by_row, index.row(), 1) == "0.125"
+    model_by_row.sort(-1)
+    assert index.row() == 4
+
+
+def test_model_by_column_sort(qtbot):
+    model = PandasModelByColumn()
+    model.add_results(make_table([3, 1, 2], [0.1, 0.2, 0.3]))
+    model.add_results(make_table([5, 4], [0.4, 0.5]))
+    assert model.columnCount() == 4
+    assert cell(model, 2, 2) == ""
+    model.sort(2)
+    assert [cell(model, row, 2) for row in range(3)] == ["4", "5", ""]
+    assert [cell(model, row, 0) for row in range(3)] == ["1", "3", "2"]
+
+
+def test_model_by_column_with_index(qtbot):
+    model = PandasModelByColumn(column_index="x")
+    model.add_results(make_table([3, 1, 2], [0.1, 0.2, 0.3], column_index="x"))
+    model.add_results(make_table([2, 4], [0.4, 0.5], column_index="x"))
+    assert list(model.vertical_header) == [1, 2, 3, 4]
+    assert [cell(model, row, 1) for row in range(4)] == ["", "0.4", "", "0.5"]
+    model.sort(1, Descending)
+    assert [cell(model, row, 1) for row in range(4)] == ["0.5", "0.4", "", ""]
@@ -0,0 +1,175 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+
+import pytest
+from data.procedure_for_testing import RandomProcedure
+
+from pymeasure.experiment.catalog import ResultsCatalog, main, parse_header_sections
+from pymeasure.experiment.procedure import ProcedureStatus
+from pymeasure.experiment.results import Results
+from pymeasure.experiment.workers import Worker
+
+
+def write_results(directory, name, iterations, rows=3, seed="12345"):
+    procedure = RandomProcedure()
+    procedure.iterations = iterations
+    procedure.seed = seed
+    results = Results(procedure, str(directory / name))
+    with open(results.data_filename, "a") as f:
+        f.writelines(results.format({"Iteration": i, "Random Number": 0.5}) + "\n"
+                     for i in range(rows))
+    return results
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    with ResultsCatalog(tmp_path) as catalog:
+        yield catalog
+
+
+def test_parse_header_sections(tmp_path):
+    results = write_results(tmp_path, "a.csv", 7)
+    procedure, parameters, metadata = parse_header_sections(
+        Results.read_header(results.data_filename).text)
+    assert procedure.endswith(".RandomProcedure")
+    assert parameters == {"Loop Iterations": "7", "Delay Time": "0.001 s",
+                          "Random Seed": "12345"}
+    assert metadata == {}
+
+
+def test_index_file(catalog, tmp_path):
+    write_results(tmp_path, "a.csv", 7, rows=5)
+    assert catalog.index_file(tmp_path / "a.csv") is True
+    (entry,) = catalog.find()
+    assert entry.path == str(tmp_path / "a.csv")
+    assert entry.rows == 5
+    assert entry.status is None
+    assert entry.parameters["Loop Iterations"] == "7"
+
+
+def test_index_unchanged_file_is_skipped(catalog, tmp_path):
+    write_results(tmp_path, "a.csv", 7)
+    assert catalog.index_file(tmp_path / "a.csv") is True
+    assert catalog.index_file(tmp_path / "a.csv") is False
+    assert catalog.index_file(tmp_path / "a.csv", force=True) is True
+
+
+def test_index_file_ignores_other_files(catalog, tmp_path):
+    (tmp_path / "notes.csv").write_text("a,b\n1,2\n")
+    assert catalog.index_file(tmp_path / "notes.csv") is False
+    assert catalog.find() == []
+
+
+def test_reindex(catalog, tmp_path):
+    write_results(tmp_path, "a.csv", 7)
+    write_results(tmp_path, "b.csv", 70)
+    (tmp_path / "sub").mkdir()
+    write_results(tmp_path / "sub", "c.csv", 700)
+    assert catalog.reindex() == 2
+    assert catalog.reindex() == 0
+    assert catalog.reindex(recursive=True) == 1
+    os.remove(tmp_path / "a.csv")
+    catalog.reindex(recursive=True)
+    assert [os.path.basename(e.path) for e in catalog.find()] == ["b.csv", "c.csv"]
+
+
+@pytest.mark.parametrize("parameters, names", (
+    ({"Loop Iterations": 70}, ["b.csv"]),
+    ({"Loop Iterations": (10, None)}, ["b.csv", "c.csv"]),
+    ({"Loop Iterations": (None, 100)}, ["a.csv", "b.csv"]),
+    ({"Loop Iterations": (10, 100)}, ["b.csv"]),
+    ({"Delay Time": (0.0005, 0.002)}, ["a.csv", "b.csv", "c.csv"]),
+    ({"Random Seed": "1"}, ["c.csv"]),
+    ({"Random Seed": "12345", "Loop Iterations": 7}, ["a.csv"]),
+    ({"Unknown": 1}, []),
+))
+def test_find_parameters(catalog, tmp_path, parameters, names):
+    write_results(tmp_path, "a.csv", 7)
+    write_results(tmp_path, "b.csv", 70)
+    write_results(tmp_path, "c.csv", 700, seed="1")
+    catalog.reindex()
+    assert [os.path.basename(e.path) for e in catalog.find(parameters=parameters)] == names
+
+
+def test_find_procedure(catalog, tmp_path):
+    write_results(tmp_path, "a.csv", 7)
+    catalog.reindex()
+    assert len(catalog.find(procedure="RandomProcedure")) == 1
+    assert len(catalog.find(procedure=catalog.find()[0].procedure)) == 1
+    assert catalog.find(procedure="OtherProcedure") == []
+
+
+def test_record_status_and_times(catalog, tmp_path):
+    results = write_results(tmp_path, "a.csv", 7, rows=4)
+    catalog.record(results, ProcedureStatus.RUNNING)
+    (entry,) = catalog.find(status=ProcedureStatus.RUNNING)
+    assert entry.started is not None and entry.finished is None
+    catalog.record(results, ProcedureStatus.FINISHED)
+    (entry,) = catalog.find(status=ProcedureStatus.FINISHED)
+    assert entry.finished >= entry.started
+    assert entry.rows == 4
+    assert catalog.find(since=entry.started, until=entry.started) == [entry]
+    assert catalog.find(since=entry.started + 1) == []
+
+
+def test_reindex_keeps_recorded_status(catalog, tmp_path):
+    results = write_results(tmp_path, "a.csv", 7)
+    catalog.record(results, ProcedureStatus.FINISHED)
+    with open(results.data_filename, "a") as f:
+        f.write("3,0.5\n")
+    assert catalog.reindex() == 1
+    (entry,) = catalog.find()
+    assert entry.status == str(ProcedureStatus.FINISHED)
+    assert entry.rows == 4
+
+
+def test_catalog_is_persistent(tmp_path):
+    write_results(tmp_path, "a.csv", 7)
+    with ResultsCatalog(tmp_path) as catalog:
+        catalog.reindex()
+    with ResultsCatalog.for_file(tmp_path / "a.csv") as catalog:
+        assert len(catalog.find()) == 1
+
+
+def test_main(tmp_path, capsys):
+    write_results(tmp_path, "a.csv", 7)
+    main([str(tmp_path)])
+    assert "Indexed 1 results files." in capsys.readouterr().out
+
+
+def test_worker_records_run(tmp_path):
+    procedure = RandomProcedure()
+    procedure.iterations = 10
+    procedure.delay = 0
+    results = Results(procedure, str(tmp_path / "a.csv"))
+    worker = Worker(results, catalog=True)
+    worker.start()
+    worker.join(timeout=20.0)
+    with ResultsCatalog(tmp_path) as catalog:
+        (entry,) = catalog.find()
+    assert entry.status == str(ProcedureStatus.FINISHED)
+    assert entry.rows == 10
+    assert entry.parameters["Loop Iterations"] == "10"
@@ -0,0 +1,93 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from unittest import mock
+
+import pytest
+from data.procedure_for_testing import RandomProcedure
+
+from pymeasure.experiment import Experiment
+from pymeasure.experiment.experiment import _GrowingArray
+
+
+def cumulative_sum(rows, state):
+    rows["Sum"] = rows["Random Number"].cumsum() + (state or 0)
+    cumulative_sum.calls.append(len(rows))
+    return rows, rows["Sum"].iloc[-1] if len(rows) else state
+
+
+@pytest.fixture()
+def experiment(tmp_path, monkeypatch):
+    monkeypatch.setattr("pymeasure.experiment.experiment.create_filename",
+                        lambda title: str(tmp_path / "data.csv"))
+    cumulative_sum.calls = []
+    return Experiment("test", RandomProcedure(), cumulative_sum, incremental=True)
+
+
+def append_rows(experiment, *rows):
+    with open(experiment.results.data_filename, "a") as file:
+        file.writelines(f"{i},{value}\n" for i, value in rows)
+
+
+def test_incremental_analysis(experiment):
+    append_rows(experiment, (0, 1.0), (1, 2.0))
+    assert experiment.data["Sum"].tolist() == [1.0, 3.0]
+    append_rows(experiment, (2, 3.0))
+    assert experiment.data["Sum"].tolist() == [1.0, 3.0, 6.0]
+    assert experiment.data.index.tolist() == [0, 1, 2]
+    assert experiment.data is experiment.data
+    assert cumulative_sum.calls == [2, 1]
+
+
+def test_reset_analysis(experiment):
+    append_rows(experiment, (0, 1.0), (1, 2.0))
+    _ = experiment.data
+    experiment.reset_analysis()
+    assert experiment.data["Sum"].tolist() == [1.0, 3.0]
+    assert cumulative_sum.calls == [2, 2]
+
+
+def test_update_line(experiment):
+    ax, line = mock.Mock(), mock.Mock()
+    append_rows(experiment, (0, 1.0), (1, 2.0))
+    experiment._analyse_new_rows()
+    experiment.update_line(ax, line, "Iteration", "Sum")
+    x, y = line.set_data.call_args.args
+    assert (x.tolist(), y.tolist()) == ([0, 1], [1.0, 3.0])
+    append_rows(experiment, (2, 3.0))
+    experiment._analyse_new_rows()
+    experiment.update_line(ax, line, "Iteration", "Sum")
+    x, y = line.set_data.call_args.args
+    assert (x.tolist(), y.tolist()) == ([0, 1, 2], [1.0, 3.0, 6.0])
+    assert cumulative_sum.calls == [2, 1]
+    # The live plot does not concatenate the analysed rows
+    assert experiment._data == []
+
+
+def test_growing_array():
+    array = _GrowingArray(capacity=2)
+    array.extend([1, 2])
+    array.extend([3.5])
+    assert array.values.tolist() == [1, 2, 3.5]
+    assert array.values.dtype.kind == "f"
@@ -22,19 +22,111 @@
 # THE SOFTWARE.
 #
 
-# import time
-# from multiprocessing import Queue
-
-# from pymeasure.experiment.listeners import Listener, Recorder
-# from pymeasure.experiment.results import Results
-
-# TODO: Make results_for_testing.csv
-# TODO: Make procedure_for_testing.py
-
-"""
-def test_recorder_stop():
-    q = Queue()
-    d = Results.load('results_for_testing.csv')
-    r = Recorder(d, q)
-    r.
-"""
+import tempfile
+from queue import Queue
+
+import pytest
+from data.procedure_for_testing import RandomProcedure
+
+from pymeasure.experiment.listeners import Recorder
+from pymeasure.experiment.results import Results
+
+
+@pytest.fixture()
+def results():
+    return Results(RandomProcedure(), tempfile.mktemp())
+
+
+def records(count):
+    return [{'Iteration': i, 'Random Number': 0.5} for i in range(count)]
+
+
+def load_iterations(results):
+    data = Results.load(results.data_filename, procedure_class=RandomProcedure).data
+    return list(data['Iteration'])
+
+
+def test_recorder_writes_all_records_before_stop(results):
+    recorder = Recorder(results, Queue(maxsize=2))
+    recorder.start()
+    for record in records(100):
+        recorder.put(record)
+    recorder.stop()
+    assert load_iterations(results) == list(range(100))
+    assert recorder.written == recorder.received == 100
+
+
+def test_recorder_drop(results):
+    recorder = Recorder(results, Queue(maxsize=2), overflow="drop")
+    for record in records(5):
+        recorder.put(record)
+    assert recorder.dropped == 3
+    assert recorder.queue_depth == recorder.max_queue_depth == 2
+    recorder.start()
+    recorder.stop()
+    assert load_iterations(results) == [0, 1]
+
+
+def test_recorder_spill(results):
+    recorder = Recorder(results, Queue(maxsize=2), overflow="spill")
+    for record in records(5):
+        recorder.put(record)
+    assert recorder.spilled == 3
+    assert recorder.statistics()["queue_depth"] == 5
+    recorder.start()
+    recorder.stop()
+    assert load_iterations(results) == list(range(5))
+
+
+def test_recorder_spill_keeps_order(results):
+    queue = Queue(maxsize=2)
+    recorder = Recorder(results, queue, overflow="spill")
+    for record in records(4):
+        recorder.put(record)
+    queue.get_nowait()  # make space for one spilled record
+    recorder.put({'Iteration': 4, 'Random Number': 0.5})
+    assert queue.qsize() == 2
+    recorder.start()
+    recorder.stop()
+    assert load_iterations(results) == [1, 2, 3, 4]
+
+
+def test_recorder_stop_closes_spill_file(results):
+    recorder = Recorder(results, Queue(maxsize=1), overflow="spill")
+    for record in records(3):
+        recorder.put(record)
+    spill_file = recorder._spill_file
+    recorder.stop()  # not started
+    assert spill_file.closed
+    assert recorder._spill_count == 0
+
+
+def test_recorder_invalid_overflow(results):
+    with pytest.raises(ValueError):
+        Recorder(results, Queue(), overflow="invalid")
+
+
+def test_recorder_flush(results):
+    recorder = Recorder(results, Queue())
+    recorder.start()
+    for record in records(10):
+        recorder.put(record)
+    assert recorder.flush(timeout=10)
+    assert recorder.written == 10
+    assert load_iterations(results) == list(range(10))
+    recorder.stop()
+
+
+def test_recorder_switch(results):
+    recorder = Recorder(results, Queue())
+    recorder.start()
+    for record in records(3):
+        recorder.put(record)
+    other = Results(RandomProcedure(), tempfile.mktemp())
+    recorder.switch(other)
+    for record in records(2):
+        recorder.put(record)
+    recorder.stop()
+    assert load_iterations(results) == [0, 1, 2]
+    assert load_iterations(other) == [0, 1]
+    assert recorder.written == 2
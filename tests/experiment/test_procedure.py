@@ -27,7 +27,13 @@ import pickle
 import pytest
 from data.procedure_for_testing import RandomProcedure
 
-from pymeasure.experiment.parameters import Parameter
+from pymeasure.experiment.parameters import (
+    Measurable,
+    Metadata,
+    Parameter,
+    PhysicalParameter,
+    VectorParameter,
+)
 from pymeasure.experiment.procedure import Procedure, ProcedureWrapper, UnknownProcedure
 from pymeasure.units import ureg
 
@@ -46,6 +52,36 @@ def test_parameters():
     assert objs['x'].value == p.x
 
 
+def test_instances_do_not_share_values():
+    class TestProcedure(Procedure):
+        v = VectorParameter('V', default=[1, 2, 3])
+        p = PhysicalParameter('P', default=[10, 1])
+
+    first, second = TestProcedure(), TestProcedure()
+    first._parameters['v'].value[0] = 5
+    first._parameters['p'].uncertainty_type = "relative"
+    assert second.v == [1, 2, 3]
+    assert second._parameters['p'].uncertainty_type == "absolute"
+    assert TestProcedure.v.value == [1, 2, 3]
+
+
+def test_members_cached_per_class():
+    class TestProcedure(Procedure):
+        x = Parameter('X', default=5)
+        meta = Metadata('Meta', default=1)
+        current = Measurable('Current (A)')
+
+    class SubProcedure(TestProcedure):
+        y = Parameter('Y', default=6)
+
+    TestProcedure()
+    assert TestProcedure._members() is TestProcedure._members()
+    assert list(SubProcedure().parameter_objects()) == ['x', 'y']
+    assert list(TestProcedure().parameter_objects()) == ['x']
+    assert TestProcedure().MEASURE == {'Current (A)': 'current'}
+    assert sorted(TestProcedure.placeholder_names()) == ['Meta', 'X']
+
+
 # TODO: Add tests for measureables
 
 
@@ -22,8 +22,12 @@
 # THE SOFTWARE.
 #
 
+import builtins
+import importlib.util
+import logging
 import os
 import pickle
+import sys
 import tempfile
 from unittest import mock
 
@@ -32,7 +36,7 @@ import pandas as pd
 import pytest
 from data.procedure_for_testing import RandomProcedure
 
-from pymeasure.experiment import BooleanParameter
+from pymeasure.experiment import BooleanParameter, IntegerParameter
 from pymeasure.experiment.procedure import Parameter, Procedure, UnknownProcedure
 from pymeasure.experiment.results import CSVFormatter, Results
 from pymeasure.units import ureg
@@ -102,6 +106,62 @@ class Test_csv_formatter_format:
         assert formatter.format(data) == "nan,nan,nan"
 
 
+class Test_csv_formatter_format_many:
+    """Tests for CSVFormatter.format_many() with columns of values."""
+
+    def test_numpy_columns(self):
+        formatter = CSVFormatter(columns=['t', 'x (m)', 'flag'])
+        lines = formatter.format_many({'t': np.arange(3), 'x (m)': np.array([0.1, 1.5, -2.0]),
+                                       'flag': np.array([True, False, True])})
+        assert lines == ['0,0.1,True', '1,1.5,False', '2,-2.0,True']
+
+    def test_same_as_format(self):
+        columns = ['t', 'length (m)', 'string']
+        formatter = CSVFormatter(columns=columns)
+        records = [{'t': 1, 'length (m)': "50 cm", 'string': "a"},
+                   {'t': 2, 'length (m)': 3 * ureg.km, 'string': "b"}]
+        lines = formatter.format_many({key: [r[key] for r in records] for key in columns})
+        assert lines == [formatter.format(record) for record in records]
+
+    def test_quantity_array(self):
+        formatter = CSVFormatter(columns=['voltage (V)', 'count'])
+        lines = formatter.format_many({'voltage (V)': np.array([1, 2]) * ureg.kV,
+                                       'count': np.array([5, 6]) * ureg.km})
+        assert lines == ['1000.0,5000.0', '2000.0,6000.0']
+        assert formatter.units['count'] == ureg.m
+
+    def test_scalar_and_missing_columns(self):
+        formatter = CSVFormatter(columns=['a', 'b', 'c'])
+        assert formatter.format_many({'a': np.arange(2), 'b': 7}) == ['0,7,nan', '1,7,nan']
+
+    def test_wrong_units(self):
+        formatter = CSVFormatter(columns=['length (m)'])
+        assert formatter.format_many({'length (m)': np.ones(2) * ureg.V}) == ['nan', 'nan']
+
+    def test_different_lengths(self):
+        formatter = CSVFormatter(columns=['a', 'b'])
+        with pytest.raises(ValueError):
+            formatter.format_many({'a': np.arange(2), 'b': np.arange(3)})
+
+
+def test_csv_formatter_offset_units():
+    formatter = CSVFormatter(columns=['temperature (K)'])
+    assert formatter.format({'temperature (K)': ureg.Quantity(0, ureg.degC)}) == "273.15"
+    assert formatter.format({'temperature (K)': "10 degC"}) == "283.15"
+
+
+def test_csv_formatter_warnings_rate_limited(caplog):
+    formatter = CSVFormatter(columns=['length (m)'])
+    with caplog.at_level(logging.WARNING):
+        for _ in range(5):
+            assert formatter.format({'length (m)': "5 V"}) == "nan"
+    assert len(caplog.records) == 1
+    formatter.WARNING_INTERVAL = 0
+    with caplog.at_level(logging.WARNING):
+        formatter.format({'length (m)': "5 V"})
+    assert "4 similar warnings were suppressed" in caplog.records[-1].getMessage()
+
+
 def test_procedure_filestorage():
     """Pickled Results must round-trip the procedure without mutating class-level defaults."""
     assert RandomProcedure.iterations.value == 100
@@ -116,6 +176,70 @@ def test_procedure_filestorage():
     assert RandomProcedure.iterations.value == 100
 
 
+PROCEDURE_MODULE = """
+import builtins
+from pymeasure.experiment import IntegerParameter, Procedure
+
+builtins.pymeasure_test_imports = getattr(builtins, "pymeasure_test_imports", 0) + 1
+
+
+class ScriptProcedure(Procedure):
+    iterations = IntegerParameter("Loop Iterations", default=1)
+    DATA_COLUMNS = ["Iteration"]
+"""
+
+
+class TestPickling:
+    @pytest.fixture
+    def script(self, tmp_path):
+        """Import a procedure module from a file like a user script."""
+        file = tmp_path / "pymeasure_test_script.py"
+        file.write_text(PROCEDURE_MODULE)
+        spec = importlib.util.spec_from_file_location("pymeasure_test_script", file)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        builtins.pymeasure_test_imports = 0
+        yield module
+        del sys.modules[spec.name]
+        del builtins.pymeasure_test_imports
+
+    def test_imported_module_is_reused(self, script, tmp_path):
+        procedure = script.ScriptProcedure()
+        procedure.iterations = 5
+        results = Results(procedure, str(tmp_path / "data.csv"))
+        for _ in range(3):
+            new_results = pickle.loads(pickle.dumps(results))
+            assert new_results.procedure.iterations == 5
+            assert new_results.procedure_class is script.ScriptProcedure
+        assert builtins.pymeasure_test_imports == 0
+
+    def test_modified_module_is_executed_again(self, script, tmp_path):
+        results = Results(script.ScriptProcedure(), str(tmp_path / "data.csv"))
+        state = pickle.dumps(results)
+        pickle.loads(state)
+        file = tmp_path / "pymeasure_test_script.py"
+        stat = os.stat(file)
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        pickle.loads(state)
+        pickle.loads(state)
+        assert builtins.pymeasure_test_imports == 1
+
+    def test_state_is_compact(self, tmp_path):
+        procedure = RandomProcedure()
+        results = Results(procedure, str(tmp_path / "data.csv"))
+        with open(results.data_filename, "a") as f:
+            f.write("1,0.5\n")
+        assert results.data is not None and len(results.data) == 1
+        state = results.__getstate__()
+        assert not {"procedure", "parameters", "_data", "preview"} & state.keys()
+        assert state["_procedure"].parameters == procedure.parameter_values()
+        new_results = pickle.loads(pickle.dumps(results))
+        assert new_results.data.shape == (1, 2)
+        assert new_results.parameters.keys() == results.parameters.keys()
+
+
 class TestResults:
     """Regression tests for the Results class."""
     # TODO: add a full set of Results tests
@@ -248,6 +372,70 @@ class TestPandas3Numpy2Compat:
         assert len(data) == 0
 
 
+class TestLazyLoading:
+    """Tests for reading only the header or parts of the data of a file."""
+
+    class DummyProcedure(Procedure):
+        x = IntegerParameter('X', default=5)
+        DATA_COLUMNS = ['a', 'b']
+
+    @pytest.fixture()
+    def filename(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'data.csv')
+        results = Results(self.DummyProcedure(), filename)
+        with open(filename, 'a', encoding=Results.ENCODING) as f:
+            f.writelines(results.format({'a': i, 'b': 2 * i}) + Results.LINE_BREAK
+                         for i in range(100))
+        return filename
+
+    def test_load_reads_data_lazily(self, filename):
+        with mock.patch('pymeasure.experiment.results.pd.read_csv') as read_csv:
+            results = Results.load(filename, self.DummyProcedure)
+        read_csv.assert_not_called()
+        assert results.procedure.x == 5
+        assert list(results.data['a']) == list(range(100))
+
+    def test_read_header_cached(self, filename):
+        header = Results.read_header(filename)
+        assert header.labels == ['a', 'b']
+        assert header.count == 4
+        with mock.patch('pymeasure.experiment.results.open') as open_mock:
+            assert Results.read_header(filename) is header
+        open_mock.assert_not_called()
+
+    def test_read_header_changed_file(self, filename):
+        header = Results.read_header(filename)
+        with open(filename, 'a', encoding=Results.ENCODING) as f:
+            f.write("100,200\n")
+        assert Results.read_header(filename) is not header
+
+    def test_head_and_tail(self, filename):
+        results = Results.load(filename, self.DummyProcedure)
+        assert list(results.head(3)['a']) == [0, 1, 2]
+        assert list(results.tail(3)['b']) == [194, 196, 198]
+        assert list(results.tail(3, block_size=8)['a']) == [97, 98, 99]
+
+    @pytest.mark.parametrize("points", (1, 10, 50, 1000))
+    def test_sample(self, filename, points):
+        data = Results.load(filename, self.DummyProcedure).sample(points)
+        assert data['a'].iloc[0] == 0
+        assert data['a'].iloc[-1] == 99
+        assert len(data) <= min(points, 100) + 1
+        assert data['a'].is_monotonic_increasing
+        assert (data['b'] == 2 * data['a']).all()
+
+    def test_load_preview(self, filename):
+        results = Results.load(filename, self.DummyProcedure, preview_points=10)
+        assert results.preview is not None
+        assert 10 <= len(results.preview) <= 11
+        assert len(results.data) == 100
+
+    def test_sample_empty_file(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'empty.csv')
+        Results(self.DummyProcedure(), filename)
+        assert list(Results.load(filename, self.DummyProcedure).sample(10).columns) == ['a', 'b']
+
+
 def test_parameter_reading():
     """Loading a Results CSV must round-trip all declared parameters from the header."""
     data_path = os.path.join(os.path.dirname(__file__), "data/results_for_testing_parameters.csv")
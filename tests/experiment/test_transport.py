@@ -0,0 +1,107 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import importlib.util
+import tempfile
+
+import numpy as np
+import pytest
+from data.procedure_for_testing import RandomProcedure
+
+from pymeasure.experiment.procedure import ProcedureStatus
+from pymeasure.experiment.results import Results
+from pymeasure.experiment.transport import deserialize, serialize
+from pymeasure.experiment.workers import Worker
+
+
+def roundtrip(record, topic="results"):
+    frames = serialize(topic, record)
+    # The frames as bytes, as they arrive over the network
+    received_topic, received = deserialize([bytes(frame) for frame in frames])
+    assert received_topic == topic
+    return frames, received
+
+
+@pytest.mark.parametrize("record", (
+    1.5, 3, "Data 1", None, {"x": 1, "y": 2.5, "name": "a"}, {"x": float("inf")},
+))
+def test_json(record):
+    frames, received = roundtrip(record)
+    assert len(frames) == 2
+    assert received == record
+
+
+def test_arrays():
+    record = {
+        "X": np.arange(12, dtype="<f8").reshape(3, 4),
+        "Y": np.arange(10, dtype=">i2")[::2],  # not contiguous
+        "empty": np.array([], dtype=np.float32),
+        "scalar": np.float32(2.5),
+        "label": "batch",
+    }
+    frames, received = roundtrip(record, "batch results")
+    assert len(frames) == 2 + 4
+    assert list(received) == list(record)
+    for key in ("X", "Y", "empty"):
+        np.testing.assert_array_equal(received[key], record[key])
+        assert received[key].dtype == record[key].dtype
+    assert received["X"].shape == (3, 4)
+    assert received["scalar"] == np.float32(2.5)
+    assert isinstance(received["scalar"], np.float32)
+    assert received["label"] == "batch"
+
+
+def test_arrays_are_not_copied():
+    array = np.arange(1000, dtype=np.float64)
+    frames = serialize("batch results", {"X": array})
+    assert np.shares_memory(np.frombuffer(frames[2], dtype=np.float64), array)
+
+
+@pytest.mark.skipif(importlib.util.find_spec('cloudpickle') is None,
+                    reason='cloudpickle not installed')
+@pytest.mark.parametrize("record", (
+    ProcedureStatus.FINISHED, {"x": [1, 2]}, {1: 2.0}, {"x": np.array([1, "a"], dtype=object)},
+    (1, 2),
+))
+def test_pickle_fallback(record):
+    frames, received = roundtrip(record)
+    assert frames[1] == b'{"type": "pickle"}'
+    if isinstance(record, dict) and isinstance(record.get("x"), np.ndarray):
+        np.testing.assert_array_equal(received["x"], record["x"])
+    else:
+        assert received == record
+
+
+def test_unknown_type():
+    with pytest.raises(ValueError):
+        deserialize([b"results", b'{"type": "unknown"}'])
+
+
+def test_worker_conflates_progress():
+    worker = Worker(Results(RandomProcedure(), tempfile.mktemp()), conflate=True,
+                    conflate_interval=10)
+    assert worker._conflated("progress", 50.) is False
+    assert worker._conflated("progress", 60.) is True
+    assert worker._conflated("progress", 100.) is False
+    assert worker._conflated("status", ProcedureStatus.RUNNING) is False
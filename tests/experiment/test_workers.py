@@ -131,3 +131,80 @@ def test_zmq_topic_filtering_works(caplog):
     assert procedure.status == ProcedureStatus.FINISHED
     assert len(received) == 3
     assert all(item[0] == 'results' for item in received)
+
+
+def test_worker_invalid_recorder_overflow():
+    results = Results(RandomProcedure(), tempfile.mktemp())
+    with pytest.raises(ValueError):
+        Worker(results, recorder_overflow="invalid")
+
+
+def test_worker_spills_records_to_small_queue():
+    procedure = RandomProcedure()
+    procedure.iterations = 100
+    procedure.delay = 0
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results, recorder_queue_size=5, recorder_overflow="spill")
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert worker.recorder.written == 100
+    assert Results.load(file, procedure_class=RandomProcedure).data.shape == (100, 2)
+
+
+def test_persistent_worker_runs_submitted_results():
+    files = [tempfile.mktemp() for _ in range(3)]
+    all_results = []
+    for iterations, file in zip((10, 20, 30), files):
+        procedure = RandomProcedure()
+        procedure.iterations = iterations
+        procedure.delay = 0
+        all_results.append(Results(procedure, file))
+    worker = Worker(all_results[0], persistent=True)
+    worker.start()
+    for results in all_results[1:]:
+        worker.submit(results)
+    worker._results_queue.put(None)  # end the worker after the submitted results
+    worker.join(timeout=20.0)
+
+    assert not worker.is_alive()
+    for iterations, results in zip((10, 20, 30), all_results):
+        assert results.procedure.status == ProcedureStatus.FINISHED
+        data = Results.load(results.data_filename, procedure_class=RandomProcedure).data
+        assert data.shape == (iterations, 2)
+
+
+def test_persistent_worker_close():
+    procedure = RandomProcedure()
+    procedure.iterations = 10
+    procedure.delay = 0
+    worker = Worker(Results(procedure, tempfile.mktemp()), persistent=True)
+    worker.start()
+    worker.close(timeout=20.0)
+    assert not worker.is_alive()
+
+
+def test_submit_requires_persistent_worker():
+    worker = Worker(Results(RandomProcedure(), tempfile.mktemp()))
+    with pytest.raises(RuntimeError):
+        worker.submit(Results(RandomProcedure(), tempfile.mktemp()))
+
+
+@pytest.mark.skipif(not tcp_libs_available,
+                    reason='TCP communication packages not installed')
+def test_worker_waits_for_subscribers():
+    procedure = RandomProcedure()
+    procedure.iterations = 10
+    procedure.delay = 0
+    results = Results(procedure, tempfile.mktemp())
+    worker = Worker(results, port=5889, subscribers=1, subscribe_timeout=10)
+    listener = Listener(port=5889, topic='status', timeout=4.0)
+    worker.start()
+    statuses = []
+    while listener.message_waiting():
+        statuses.append(listener.receive()[1])
+    worker.join(timeout=20.0)
+    # No message is lost, as the worker waited for the listener
+    assert statuses[0] == ProcedureStatus.RUNNING
+    assert worker._subscriptions == 1
@@ -305,3 +305,18 @@ def test_channel_phase_synchronization():
         ]
     ) as inst:
         assert inst.phase_sync() is None
+
+
+def test_data_arb_binary():
+    """
+    Test Agilent 33500 binary upload of an arbitrary trace
+    """
+    with expected_protocol(
+        Agilent33500,
+        [
+            (b"SOUR2:DATA:ARB:DAC test, #14\x00\x01\xff\xff", None),
+            (b"DATA:ARB:DAC test, #14\x00\x01\xff\xff", None),
+        ]
+    ) as inst:
+        inst.ch_2.data_arb("test", [1, -1], data_format="binary")
+        inst.data_arb("test", [1, -1], data_format="binary")
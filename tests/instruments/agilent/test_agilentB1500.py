@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 
 from pymeasure.instruments.agilent import AgilentB1500
@@ -104,6 +105,61 @@ class TestB1500:
         ) as inst:
             inst.adc_setup(ADCType.HSADC, mode=ADCMode.MANUAL)
 
+    def test_read_data(self):
+        """Test read_data decodes all measurement points at once."""
+        with expected_protocol(
+            AgilentB1500Mock,
+            [
+                ("FMT 1, 0", None),
+                ("ERRX?", '+0,"No Error."'),
+                (
+                    None,
+                    ("NCX+000001E+000,NCI+000.005E-09,NCV+001.000E+00,"
+                     "NCX+000002E+000,TCI-000.010E-09,NCV+002.000E+00"),
+                ),
+            ],
+        ) as inst:
+            inst.add_child(SMU, id=1, collection="smus", prefix="smu", smu_type="HRSMU", slot=3)
+            inst.data_format(1)
+            data = inst.read_data(2)
+            assert list(data.columns) == [
+                "SMU1 Sampling index", "SMU1 Current (A)", "SMU1 Voltage (V)"
+            ]
+            assert data["SMU1 Sampling index"].tolist() == [1, 2]
+            assert data["SMU1 Sampling index"].dtype == np.int64
+            assert data["SMU1 Current (A)"].tolist() == [5e-12, -1e-11]
+            assert data["SMU1 Voltage (V)"].tolist() == [1.0, 2.0]
+
+    def test_read_data_fmt21(self):
+        """Test read_data with the three digit status of format 21."""
+        with expected_protocol(
+            AgilentB1500,
+            [
+                ("FMT 21, 0", None),
+                ("ERRX?", '+0,"No Error."'),
+                (None, "000AI+0000.005E-09,000AV+0001.000E+00"),
+            ],
+        ) as inst:
+            inst.data_format(21)
+            data = inst.read_data(1)
+            assert list(data.columns) == ["1 Current Measurement (A)", "1 Voltage Measurement (V)"]
+            assert data.iloc[0].tolist() == [5e-12, 1.0]
+
+    def test_read_data_varying_width(self):
+        """Test read_data falls back to single elements if the width varies."""
+        with expected_protocol(
+            AgilentB1500,
+            [
+                ("FMT 1, 0", None),
+                ("ERRX?", '+0,"No Error."'),
+                (None, "NAI+5E-12,NAV+001.000E+00,NAI+1E-11,NAV+002.000E+00"),
+            ],
+        ) as inst:
+            inst.data_format(1)
+            data = inst.read_data(2)
+            assert list(data.columns) == ["1 Current (A)", "1 Voltage (V)"]
+            assert data["1 Current (A)"].tolist() == [5e-12, 1e-11]
+
 
 class AgilentB1500Mock(AgilentB1500):
     """B1500 with one unit per slot: SPGU in slot 1, CMU in slot 2, SMU in slot 3."""
@@ -136,3 +136,12 @@ def test_id():
         [("*IDN?", "Agilent Technologies,E4408B,US12345678,A.02.00")],
     ) as inst:
         assert inst.id == "Agilent Technologies,E4408B,US12345678,A.02.00"
+
+
+def test_trace():
+    with expected_protocol(
+        AgilentE4408B,
+        [(":FORMat:TRACe:DATA ASCII;", None),
+         (":TRACE:DATA? TRACE1;", "-1.5e+01,-2.25e+01,-3e+01")],
+    ) as inst:
+        assert list(inst.trace()) == [-15, -22.5, -30]
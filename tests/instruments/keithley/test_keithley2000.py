@@ -88,3 +88,33 @@ def test_enable_filter():
          ],
     ) as inst:
         inst.enable_filter(mode='voltage ac', type='repeat', count=10)
+
+
+def test_stream_buffer():
+    with expected_protocol(
+        Keithley2000,
+        [(":INIT", None),
+         ("*STB?", "65"),
+         (":FORM:DATA ASCII", None),
+         (":TRAC:DATA?", "1.5,2.5"),
+         (":TRAC:CLEAR;*CLS;:TRAC:FEED:CONT NEXT;", None),
+         (":INIT", None),
+         ("*STB?", "65"),
+         (":FORM:DATA ASCII", None),
+         (":TRAC:DATA?", "3.5,4.5"),
+         (":TRAC:CLEAR;*CLS;:TRAC:FEED:CONT NEXT;", None),
+         ],
+    ) as instr:
+        chunks = list(instr.stream_buffer(chunks=2))
+        assert [list(c) for c in chunks] == [[1.5, 2.5], [3.5, 4.5]]
+
+
+def test_stream_buffer_stopped():
+    with expected_protocol(
+        Keithley2000,
+        [(":INIT", None),
+         ("*STB?", "0"),
+         (":ABOR", None),
+         ],
+    ) as instr:
+        assert list(instr.stream_buffer(should_stop=lambda: True, interval=0)) == []
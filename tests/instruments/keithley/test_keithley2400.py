@@ -24,6 +24,9 @@
 
 import math
 
+import numpy as np
+import pytest
+
 from pymeasure.instruments.keithley.keithley2400 import Keithley2400
 from pymeasure.test import expected_protocol
 
@@ -914,3 +917,113 @@ def test_front_terminals_enabled_setter():
         [INIT_COMMS, (":ROUTE:TERMINALS REAR", None)],
     ) as inst:
         inst.front_terminals_enabled = False
+
+
+##########
+# BUFFER #
+##########
+
+
+def test_buffer_data_binary():
+    values = np.arange(10, dtype="<f4")
+    with expected_protocol(
+        Keithley2400,
+        [INIT_COMMS,
+         (":TRAC:POIN:ACT?", "2"),
+         (":FORM:ELEM?", "VOLT,CURR,RES,TIME,STAT"),
+         (":FORM:DATA SREAL;:FORM:BORD SWAP", None),
+         (":TRAC:DATA?", b"#0" + values.tobytes() + b"\n"),
+         (":FORM:DATA ASCII", None)],
+    ) as inst:
+        data = inst.buffer_data
+        assert data.dtype == np.float64
+        assert np.array_equal(data, values)
+
+
+def test_buffer_data_ascii():
+    with expected_protocol(
+        Keithley2400,
+        [INIT_COMMS,
+         (":FORM:DATA ASCII", None),
+         (":TRAC:DATA?", "1.5,2.5,3.5,4.5,0")],
+    ) as inst:
+        inst.buffer_binary = False
+        assert list(inst.buffer_data) == [1.5, 2.5, 3.5, 4.5, 0]
+
+
+#########
+# SWEEP #
+#########
+
+
+def test_configure_list_sweep():
+    with expected_protocol(
+        Keithley2400,
+        [INIT_COMMS,
+         (":SOUR:FUNC VOLT;:SOUR:VOLT:MODE LIST", None),
+         (":SOUR:LIST:VOLT 0,0.5,1", None),
+         (":SOUR:DEL 0.01;:ARM:COUN 1;:TRIG:COUN 3", None),
+         (":TRAC:CLEAR;:TRAC:POIN 3;:TRAC:FEED SENS;:TRAC:FEED:CONT NEXT", None),
+         ("SYST:ERR?", '0,"No error"')],
+    ) as inst:
+        assert inst.configure_sweep(values=[0, 0.5, 1], delay=0.01) == 3
+
+
+def test_configure_staircase_sweep():
+    with expected_protocol(
+        Keithley2400,
+        [INIT_COMMS,
+         ((":SOUR:FUNC CURR;:SOUR:CURR:MODE SWE;:SOUR:SWE:SPAC LOG;"
+           ":SOUR:CURR:STAR 1e-06;:SOUR:CURR:STOP 0.001;:SOUR:SWE:POIN 4"), None),
+         (":SOUR:DEL 0;:ARM:COUN 1;:TRIG:COUN 4", None),
+         (":TRAC:CLEAR;:TRAC:POIN 4;:TRAC:FEED SENS;:TRAC:FEED:CONT NEXT", None),
+         ("SYST:ERR?", '0,"No error"')],
+    ) as inst:
+        inst.configure_sweep(start=1e-6, stop=1e-3, points=4, spacing="log", source="current")
+
+
+@pytest.mark.parametrize("kwargs", (
+    {"values": [0, 1], "source": "resistance"},
+    {"values": []},
+    {"start": 0, "stop": 1},
+    {"start": 0, "stop": 1, "points": 2, "spacing": "quadratic"},
+))
+def test_configure_sweep_invalid(kwargs):
+    with expected_protocol(Keithley2400, [INIT_COMMS]) as inst, pytest.raises(ValueError):
+        inst.configure_sweep(**kwargs)
+
+
+def test_sweep():
+    values = np.arange(10, dtype="<f4")
+    with expected_protocol(
+        Keithley2400,
+        [INIT_COMMS,
+         (":SOUR:FUNC VOLT;:SOUR:VOLT:MODE LIST", None),
+         (":SOUR:LIST:VOLT 0,1", None),
+         (":SOUR:DEL 0;:ARM:COUN 1;:TRIG:COUN 2", None),
+         (":TRAC:CLEAR;:TRAC:POIN 2;:TRAC:FEED SENS;:TRAC:FEED:CONT NEXT", None),
+         ("SYST:ERR?", '0,"No error"'),
+         ("*CLS;:INIT;*OPC", None),
+         ("*ESR?", "0"),
+         ("*ESR?", "1"),
+         (":FORM:ELEM?", "VOLT,CURR,RES,TIME,STAT"),
+         (":TRAC:POIN:ACT?", "2"),
+         (":FORM:ELEM?", "VOLT,CURR,RES,TIME,STAT"),
+         (":FORM:DATA SREAL;:FORM:BORD SWAP", None),
+         (":TRAC:DATA?", b"#0" + values.tobytes() + b"\n"),
+         (":FORM:DATA ASCII", None)],
+    ) as inst:
+        data = inst.sweep(values=[0, 1], interval=0)
+        assert list(data["voltage"]) == [0, 5]
+        assert list(data["current"]) == [1, 6]
+        assert list(data["status"]) == [4, 9]
+
+
+def test_sweep_aborted():
+    with expected_protocol(
+        Keithley2400,
+        [INIT_COMMS,
+         ("*ESR?", "0"),
+         (":ABOR", None)],
+    ) as inst:
+        assert inst.wait_for_sweep(should_stop=lambda: True) is False
@@ -0,0 +1,128 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.keithley.keithley2600 import (
+    SWEEP_SCRIPT,
+    SWEEP_SCRIPT_NAME,
+    Keithley2600,
+)
+from pymeasure.test import expected_protocol
+
+SCRIPT_LOAD = ([(f"loadscript {SWEEP_SCRIPT_NAME}", None)]
+               + [(line, None) for line in SWEEP_SCRIPT.splitlines() if line.strip()]
+               + [("endscript", None), (f"{SWEEP_SCRIPT_NAME}.run()", None)])
+
+
+def printbuffer(first, last, channel="a"):
+    return ("format.data = format.REAL32 format.byteorder = format.LITTLEENDIAN "
+            f"printbuffer({first}, {last}, smu{channel}.nvbuffer1.readings, "
+            f"smu{channel}.nvbuffer2.readings)")
+
+
+def block(currents, voltages):
+    data = np.column_stack((currents, voltages)).astype("<f4")
+    return b"#0" + data.tobytes() + b"\n"
+
+
+def test_voltage():
+    with expected_protocol(
+        Keithley2600,
+        [("print(smua.measure.v())", "1.5")],
+    ) as inst:
+        assert inst.ChA.voltage == pytest.approx(1.5)
+
+
+def test_load_script_is_cached():
+    with expected_protocol(
+        Keithley2600,
+        [("loadscript test", None),
+         ("print(1)", None),
+         ("endscript", None),
+         ("test.run()", None),
+         ('script.delete("test")', None)],
+    ) as inst:
+        inst.load_script("test", "print(1)")
+        inst.load_script("test", "print(1)")
+        assert inst.scripts == {"test": "print(1)"}
+        inst.delete_script("test")
+        assert inst.scripts == {}
+
+
+def test_stream_buffers_in_chunks():
+    with expected_protocol(
+        Keithley2600,
+        [("print(smub.nvbuffer1.n)", "3"),
+         (printbuffer(1, 2, "b"), block([1, 2], [3, 4])),
+         ("format.data = format.ASCII", None),
+         (printbuffer(3, 3, "b"), block([5], [6])),
+         ("format.data = format.ASCII", None)],
+    ) as inst:
+        chunks = list(inst.ChB.stream_buffers(chunk_size=2))
+        assert [list(current) for current, _ in chunks] == [[1, 2], [5]]
+        assert [list(voltage) for _, voltage in chunks] == [[3, 4], [6]]
+
+
+def test_linear_sweep():
+    with expected_protocol(
+        Keithley2600,
+        SCRIPT_LOAD
+        + [('pymeasure_linear_sweep(smua, "v", 0.0, 1.0, 2, 0.0, 1.0)', None),
+           (printbuffer(1, 2), block([1e-3, 2e-3], [0, 1])),
+           ("format.data = format.ASCII", None)],
+    ) as inst:
+        currents, voltages = inst.ChA.linear_sweep(0, 1, 2)
+        assert currents == pytest.approx([1e-3, 2e-3])
+        assert list(voltages) == [0, 1]
+
+
+def test_list_sweep():
+    with expected_protocol(
+        Keithley2600,
+        SCRIPT_LOAD
+        + [("pymeasure_values = {}", None),
+           ("pymeasure_append(pymeasure_values, {0.001, 0.002})", None),
+           ('pymeasure_list_sweep(smua, "i", pymeasure_values, 0.0, 1.0)', None),
+           (printbuffer(1, 2), block([1e-3, 2e-3], [0.5, 1])),
+           ("format.data = format.ASCII", None)],
+    ) as inst:
+        _, voltages = inst.ChA.list_sweep([1e-3, 2e-3], source="current")
+        assert list(voltages) == [0.5, 1]
+
+
+def test_invalid_sweep_source():
+    with expected_protocol(Keithley2600, []) as inst, pytest.raises(ValueError):
+        inst.ChA.linear_sweep(0, 1, 2, source="resistance")
+
+
+@pytest.mark.parametrize("sweep", [
+    lambda channel: channel.linear_sweep(0, 1, 0),
+    lambda channel: channel.log_sweep(1e-3, 1, 0),
+    lambda channel: channel.list_sweep([]),
+])
+def test_sweep_without_points(sweep):
+    with expected_protocol(Keithley2600, []) as inst, pytest.raises(ValueError):
+        sweep(inst.ChA)
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 
 from pymeasure.instruments.keithley import KeithleyDMM6500
@@ -877,3 +878,27 @@ def test_trigger_single_autozero():
              (b'AZER:ONCE', None)],
     ) as inst:
         assert inst.trigger_single_autozero() is None
+
+
+def test_configure_sweep():
+    with expected_protocol(
+            KeithleyDMM6500,
+            [(b'*LANG SCPI', None),
+             (b':TRAC:CLE', None),
+             (b':TRIG:LOAD "SimpleLoop", 5, 0.01', None),
+             (b'SYST:ERR?', b'0,"No error;0;0 0"\n')],
+    ) as inst:
+        assert inst.configure_sweep(5, delay=0.01) == 5
+
+
+def test_sweep_data():
+    values = np.array([1.5, 2.5, 3.5], dtype="<f4")
+    with expected_protocol(
+            KeithleyDMM6500,
+            [(b'*LANG SCPI', None),
+             (b'TRAC:ACT?', b'3\n'),
+             (b':FORM:DATA SRE;:FORM:BORD SWAP', None),
+             (b':TRAC:DATA? 1, 3, "defbuffer1", READ', b'#212' + values.tobytes() + b'\n'),
+             (b':FORM:DATA ASC', None)],
+    ) as inst:
+        assert list(inst.sweep_data["reading"]) == [1.5, 2.5, 3.5]
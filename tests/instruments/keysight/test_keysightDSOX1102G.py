@@ -595,6 +595,33 @@ def test_waveform_data_single_element():
         assert inst.waveform_data == [0.5]
 
 
+def test_download_waveforms():
+    raw_preamble = "1,0,2,1,1.0E-03,-1.0E-03,0,1.0E-02,0,100"
+    with expected_protocol(
+        KeysightDSOX1102G,
+        [
+            (":waveform:points:mode NORM", None),
+            (":waveform:points 100", None),
+            (":waveform:format WORD", None),
+            (":waveform:byteorder LSBF;:waveform:unsigned 1", None),
+            (":waveform:source CHAN1", None),
+            (":waveform:preamble?", raw_preamble),
+            (":waveform:data?", b"#14" + (100).to_bytes(2, "little")
+             + (200).to_bytes(2, "little") + b"\n"),
+            (":waveform:source CHAN2", None),
+            (":waveform:preamble?", raw_preamble),
+            (":waveform:data?", b"#14" + (0).to_bytes(2, "little")
+             + (50).to_bytes(2, "little") + b"\n"),
+        ],
+    ) as inst:
+        record, preambles = inst.download_waveforms(["channel1", "channel2"], points=100)
+        assert record.dtype.names == ("time", "channel1", "channel2")
+        assert record["time"] == pytest.approx([-1e-3, 0])
+        assert record["channel1"] == pytest.approx([0, 1])
+        assert record["channel2"] == pytest.approx([-1, -0.5])
+        assert preambles["channel2"]["format"] == "WORD"
+
+
 # ---------------------------
 # System methods
 # ---------------------------
@@ -341,6 +341,53 @@ def test_download_two_points():
         assert y[1] == y[0]
 
 
+def test_download_waveforms_chunked():
+    def chunks(source, data):
+        return [
+            (b"WFSU NP,1", None),
+            (b"WFSU FP,0", None),
+            (f"{source}:WF? DAT2".encode(), b"DAT2,#9000000001" + data[:1] + b"\n\n"),
+            (b"WFSU NP,1", None),
+            (b"WFSU FP,1", None),
+            (f"{source}:WF? DAT2".encode(), b"DAT2,#9000000001" + data[1:] + b"\n\n"),
+        ]
+
+    def preamble(source):
+        return [
+            (b"WFSU?", b"SP,1,NP,1,FP,1"),
+            (b"ACQW?", b"SAMPLING"),
+            (b"SARA?", b"1.00E+09"),
+            (b"SAST?", b"Stop"),
+            (b"MSIZ?", b"7M"),
+            (b"TDIV?", b"5.00E-04"),
+            (b"TRDL?", b"-0.00E+00"),
+            (b"SANU? C1", b"7.00E+06"),
+            (f"{source}:VDIV?".encode(), b"5.00E-02"),
+            (f"{source}:OFST?".encode(), b"-1.50E-01"),
+            (f"{source}:UNIT?".encode(), b"V"),
+        ]
+
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),  # channel 1 and 2 share the ADC
+             (b"SANU? C1", b"7.00E+06"),
+             ] + chunks("C1", b"\x01\x02") + chunks("C2", b"\xff\x00")
+            + preamble("C1") + preamble("C2"),
+            connection_attributes={'chunk_size': 19},  # one point with header and footer
+    ) as instr:
+        record, preambles = instr.download_waveforms(["c1", "c2"], requested_points=2, sparsing=1)
+        assert record.dtype.names == ("time", "C1", "C2")
+        assert record["time"][0] == -5e-4 * 14 / 2.
+        assert record["time"][1] == record["time"][0] + 1 / 1e9
+        assert list(record["C1"]) == [n * 0.05 / 25. + 0.150 for n in (1, 2)]
+        assert list(record["C2"]) == [n * 0.05 / 25. + 0.150 for n in (-1, 0)]
+        assert preambles["C2"]["transmitted_points"] == 2
+
+
 def test_trigger():
     with expected_protocol(
             LeCroyT3DSO1204,
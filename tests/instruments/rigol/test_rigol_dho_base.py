@@ -597,3 +597,46 @@ class TestWaveform:
             assert len(v) == 4
             assert v[0] == pytest.approx(0.1)
             assert len(t) == len(v)
+
+    def test_get_waveforms_max_chunked(self):
+        def block(samples):
+            return b"#1" + str(len(samples)).encode() + bytes(samples) + b"\n"
+
+        with expected_protocol(
+            DHOBase,
+            [
+                (":TRIG:STAT?", "RUN"),
+                (":STOP", None),
+                (":WAV:SOUR CHAN1", None),
+                (":WAV:MODE MAX", None),
+                (":WAV:FORM BYTE", None),
+                (":WAV:SOUR CHAN1", None),
+                (":WAV:PRE?", PREAMBLE),
+                (":ACQ:MDEP?", "3"),
+                (":WAV:STAR 1", None),
+                (":WAV:STOP 2", None),
+                (":WAV:DATA?", block([128, 129])),
+                (":WAV:STAR 3", None),
+                (":WAV:STOP 3", None),
+                (":WAV:DATA?", block([130])),
+                (":WAV:SOUR CHAN2", None),
+                (":WAV:PRE?", PREAMBLE),
+                (":ACQ:MDEP?", "3"),
+                (":WAV:STAR 1", None),
+                (":WAV:STOP 2", None),
+                (":WAV:DATA?", block([127, 126])),
+                (":WAV:STAR 3", None),
+                (":WAV:STOP 3", None),
+                (":WAV:DATA?", block([125])),
+                (":RUN", None),
+            ],
+            connection_attributes={"chunk_size": 14},  # 2 points and block overhead
+        ) as inst:
+            record, preambles = inst.get_waveforms([1, 2], mode="MAX")
+            assert record.dtype.names == ("time", "CHAN1", "CHAN2")
+            assert record["time"] == pytest.approx([-2.0e-4, -2.0e-4 + 4e-7, -2.0e-4 + 8e-7])
+            assert record["CHAN1"] == pytest.approx(
+                [(s + 87 - 128) * 1.6e-3 for s in (128, 129, 130)])
+            assert record["CHAN2"] == pytest.approx(
+                [(s + 87 - 128) * 1.6e-3 for s in (127, 126, 125)])
+            assert preambles[2]["points"] == 1000
@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import numpy as np
 import pytest
 
 from pymeasure.instruments.srs.sr830 import SR830
@@ -111,3 +112,59 @@ def test_aux_out_small_values(value, command):
         [(command, None)],
     ) as inst:
         inst.aux_out_1 = value
+
+
+def test_stream_buffer():
+    """Verify that the buffer is read in chunks of new points and paused at the end."""
+    ch1 = np.array([1, 2, 3], dtype=np.float32)
+    ch2 = np.array([4, 5, 6], dtype=np.float32)
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "1"),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", ch1[:2].tobytes()),
+         ("TRCB?2,0,2", ch2[:2].tobytes()),
+         ("SPTS?", "4"),
+         ("TRCB?1,2,1", ch1[2:].tobytes()),
+         ("TRCB?2,2,1", ch2[2:].tobytes()),
+         ("PAUS", None),
+         ],
+    ) as inst:
+        chunks = list(inst.stream_buffer(chunk=2, count=3, delay=0))
+        assert len(chunks) == 2
+        assert np.array_equal(np.concatenate([c[0] for c in chunks]), ch1)
+        assert np.array_equal(np.concatenate([c[1] for c in chunks]), ch2)
+
+
+def test_stream_buffer_full():
+    """Verify that a full buffer is read, reset and started again."""
+    ch = np.arange(16383, dtype=np.float32)
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "16380"),
+         ("TRCB?1,0,16380", ch[:16380].tobytes()),
+         ("TRCB?2,0,16380", ch[:16380].tobytes()),
+         ("SPTS?", "16383"),
+         ("TRCB?1,16380,3", ch[16380:].tobytes()),
+         ("TRCB?2,16380,3", ch[16380:].tobytes()),
+         ("REST", None),
+         ("STRT", None),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", ch[:2].tobytes()),
+         ("TRCB?2,0,2", ch[:2].tobytes()),
+         ("PAUS", None),
+         ],
+    ) as inst:
+        chunks = list(inst.stream_buffer(chunk=100, count=16385, delay=0))
+        assert [len(c[0]) for c in chunks] == [16380, 3, 2]
+
+
+def test_stream_buffer_aborted():
+    """Verify that an aborted stream pauses the buffer."""
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "0"),
+         ("PAUS", None),
+         ],
+    ) as inst:
+        assert list(inst.stream_buffer(has_aborted=lambda: True, delay=0)) == []
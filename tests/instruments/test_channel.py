@@ -118,6 +118,10 @@ class TestChannelCommunication:
         ch.read_binary_values()
         assert ch.parent.method_calls == [mock.call.read_binary_values()]
 
+    def test_read_ieee_block(self, ch):
+        ch.read_ieee_block(count=3)
+        assert ch.parent.method_calls == [mock.call.read_ieee_block(count=3)]
+
     def test_check_errors(self, ch):
         ch.check_errors()
         assert ch.parent.method_calls == [mock.call.check_errors()]
@@ -23,8 +23,10 @@
 #
 
 import logging
+import warnings
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pytest
 
 try:
@@ -471,6 +473,36 @@ def test_values(value, kwargs, result):
     assert cb.values(value, **kwargs) == result
 
 
+@pytest.mark.parametrize("value, cast, result", (
+    ("5,6.5,-7e3", float, [5.0, 6.5, -7e3]),
+    ("5,6,-7", int, [5, 6, -7]),
+    ("1.5,2,", float, [1.5, 2.0, ""]),
+    ("1_000,2", float, [1000.0, 2.0]),
+    ("99999999999999999999,1", int, [99999999999999999999, 1]),
+))
+def test_values_numeric(value, cast, result):
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        values = cb.values(value, cast=cast)
+    assert values == result
+    assert [type(v) for v in values] == [type(v) for v in result]
+
+
+@pytest.mark.parametrize("value, kwargs, result", (
+    ("5,6.5,7", {}, np.array([5, 6.5, 7])),
+    ("5,6,7", {"cast": int}, np.array([5, 6, 7])),
+    ("5 6 7", {"separator": None}, np.array([5.0, 6.0, 7.0])),
+    ("0,5", {"cast": bool}, np.array([False, True])),
+))
+def test_values_as_array(value, kwargs, result):
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    values = cb.values(value, as_array=True, **kwargs)
+    assert isinstance(values, np.ndarray)
+    assert values.dtype == result.dtype
+    assert np.array_equal(values, result)
+
+
 def test_values_fallback_emits_futurewarning():
     cb = CommonBaseTesting(FakeAdapter(), "test")
     with pytest.warns(FutureWarning, match=r"Cannot cast.*In a future version"):
@@ -0,0 +1,170 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from pymeasure.adapters import FakeAdapter, ProtocolAdapter
+from pymeasure.instruments import Channel, Instrument, call_each, gather, run_concurrently, scatter
+from pymeasure.instruments.concurrency import bus_key
+
+
+class Meter(Instrument):
+    voltage = Instrument.control("V?", "V %g", "Control the voltage.")
+
+    def __init__(self, adapter, name="Meter", **kwargs):
+        super().__init__(adapter, name, **kwargs)
+
+    def scaled(self, factor, offset=0):
+        return self.voltage * factor + offset
+
+
+class Activity:
+    """Record the maximum number of simultaneous calls."""
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.active = 0
+        self.maximum = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.active += 1
+            self.maximum = max(self.maximum, self.active)
+        time.sleep(self.duration)
+        with self.lock:
+            self.active -= 1
+
+
+def meters(*replies):
+    return [Meter(ProtocolAdapter([("V?", reply)])) for reply in replies]
+
+
+def test_gather_ordered():
+    assert gather(meters("1", "2", "3"), "voltage") == [1, 2, 3]
+
+
+def test_scatter():
+    instruments = [Meter(ProtocolAdapter([(f"V {i}", None)])) for i in range(3)]
+    assert scatter(instruments, "voltage", [0, 1, 2]) == [None] * 3
+
+
+def test_scatter_length_mismatch():
+    with pytest.raises(ValueError):
+        scatter(meters("1", "2"), "voltage", [1])
+
+
+def test_call_each():
+    assert call_each(meters("1", "2"), "scaled", 2, offset=1) == [3, 5]
+
+
+def test_different_buses_run_concurrently():
+    activity = Activity()
+    instruments = [Meter(FakeAdapter()) for _ in range(4)]
+    run_concurrently((inst, activity) for inst in instruments)
+    assert activity.maximum > 1
+
+
+def test_same_bus_runs_serially():
+    activity = Activity()
+    parent = Meter(FakeAdapter())
+    channels = [parent.add_child(Channel, i) for i in range(4)]
+    run_concurrently((channel, activity) for channel in channels)
+    assert activity.maximum == 1
+
+
+def test_max_workers():
+    activity = Activity()
+    instruments = [Meter(FakeAdapter()) for _ in range(6)]
+    run_concurrently(((inst, activity) for inst in instruments), max_workers=2)
+    assert activity.maximum == 2
+
+
+def test_exception_raised_after_all_calls():
+    calls = []
+
+    def fail():
+        raise ValueError("fail")
+
+    instruments = [Meter(FakeAdapter()) for _ in range(3)]
+    with pytest.raises(ValueError, match="fail"):
+        run_concurrently([(instruments[0], fail), (instruments[1], lambda: calls.append(1)),
+                          (instruments[2], fail)])
+    assert calls == [1]
+
+
+def test_return_exceptions():
+    def fail():
+        raise ValueError("fail")
+
+    instruments = [Meter(FakeAdapter()) for _ in range(2)]
+    results = run_concurrently([(instruments[0], fail), (instruments[1], lambda: 5)],
+                               return_exceptions=True)
+    assert isinstance(results[0], ValueError)
+    assert results[1] == 5
+
+
+def test_timeout_skips_bus():
+    release = threading.Event()
+    blocked, other = Meter(FakeAdapter()), Meter(FakeAdapter())
+    try:
+        results = run_concurrently(
+            [(blocked, release.wait), (blocked, lambda: 1), (other, lambda: 2)],
+            timeout=0.1, return_exceptions=True,
+        )
+    finally:
+        release.set()
+    assert isinstance(results[0], TimeoutError)
+    assert isinstance(results[1], TimeoutError)
+    assert results[2] == 2
+
+
+def fake_instrument(connection) -> Any:
+    return SimpleNamespace(adapter=SimpleNamespace(connection=connection))
+
+
+class TestBusKey:
+    def test_channel_shares_parent_bus(self):
+        parent = Meter(FakeAdapter())
+        assert bus_key(parent.add_child(Channel, 1)) == bus_key(parent)
+
+    def test_shared_connection(self):
+        connection = SimpleNamespace(resource_name="ASRL1::INSTR")
+        assert bus_key(fake_instrument(connection)) == bus_key(fake_instrument(connection))
+
+    def test_gpib_board(self):
+        def instrument(name):
+            return fake_instrument(SimpleNamespace(resource_name=name))
+
+        assert bus_key(instrument("GPIB0::22::INSTR")) == bus_key(instrument("GPIB0::5::INSTR"))
+        assert bus_key(instrument("GPIB0::22::INSTR")) != bus_key(instrument("GPIB1::22::INSTR"))
+
+    def test_separate_adapters(self):
+        assert bus_key(Meter(FakeAdapter())) != bus_key(Meter(FakeAdapter()))
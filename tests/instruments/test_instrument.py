@@ -23,6 +23,7 @@
 #
 
 
+import asyncio
 import time
 from unittest import mock
 
@@ -239,3 +240,67 @@ class TestMultiFunctionality:
                 [("X:Volt 123.456000", None)]
         ) as inst:
             inst.f_X.voltage = 123.456
+
+
+class TestAsyncCommunication:
+    """Test the awaitable communication methods with the default threaded asyncio adapter."""
+
+    def test_aask(self):
+        with expected_protocol(Instrument, [("ID?", "abc")], name="test") as inst:
+            assert asyncio.run(inst.aask("ID?")) == "abc"
+
+    def test_avalues(self):
+        with expected_protocol(Instrument, [("DATA?", "1,2.5,3")], name="test") as inst:
+            assert asyncio.run(inst.avalues("DATA?")) == [1, 2.5, 3]
+
+    def test_aget_control(self):
+        with expected_protocol(ChannelInstrument, [("CA:control?", "5")]) as inst:
+            assert asyncio.run(inst.ch_A.aget("fake_ctrl")) == 5
+
+    def test_aset_control(self):
+        with expected_protocol(ChannelInstrument, [("CB:control 10", None)]) as inst:
+            asyncio.run(inst.ch_B.aset("fake_ctrl", 15))
+
+    def test_aget_mapped_measurement(self):
+        with expected_protocol(ChannelInstrument, [("CA:measurement?", "2")]) as inst:
+            assert asyncio.run(inst.ch_A.aget("fake_measurement")) == "Y"
+
+    def test_aget_dynamic_property(self):
+        with expected_protocol(ChannelInstrument, [("CA:new?", "3")]) as inst:
+            inst.ch_A.fake_ctrl_get_command = "C{ch}:new?"
+            assert asyncio.run(inst.ch_A.aget("fake_ctrl")) == 3
+
+    def test_aget_attribute_fallback(self):
+        with expected_protocol(TestMultiFunctionality.InstrumentWithFunctionality, []) as inst:
+            assert asyncio.run(inst.aget("name")) == "ChannelInstrument"
+
+    def test_gather_keeps_queries_together(self):
+        async def query_all(inst):
+            return await asyncio.gather(inst.ch_A.aget("fake_ctrl"),
+                                        inst.ch_B.aget("fake_ctrl"))
+
+        with expected_protocol(ChannelInstrument,
+                               [("CA:control?", "1"), ("CB:control?", "2")]) as inst:
+            assert asyncio.run(query_all(inst)) == [1, 2]
+
+    def test_gather_in_several_event_loops(self):
+        async def query_all(inst):
+            return await asyncio.gather(inst.aask("A"), inst.aask("B"))
+
+        with expected_protocol(Instrument, [("A", "1"), ("B", "2")] * 2, name="test") as inst:
+            for _ in range(2):
+                assert asyncio.run(query_all(inst)) == ["1", "2"]
+
+    def test_awrite_waits_for_query(self):
+        async def communicate(inst):
+            return await asyncio.gather(inst.aask("A"), inst.awrite("B 1"))
+
+        with expected_protocol(Instrument, [("A", "1"), ("B 1", None)], name="test") as inst:
+            assert asyncio.run(communicate(inst)) == ["1", None]
+
+    def test_shutdown_closes_async_adapter(self):
+        with expected_protocol(Instrument, [], name="test") as inst:
+            adapter = inst.async_adapter
+            inst.shutdown()
+            assert adapter._executor._shutdown
+            assert inst.async_adapter is not adapter
@@ -0,0 +1,103 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import ast
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pymeasure.instruments
+from pymeasure._lazy import lazy_import
+from pymeasure.instruments import agilent
+
+instruments_dir = Path(pymeasure.instruments.__file__).parent
+vendor_packages = sorted(path.parent.name for path in instruments_dir.glob("*/__init__.py"))
+
+
+def test_driver_modules_are_not_imported():
+    code = ("import sys, pymeasure.instruments.agilent; "
+            "assert 'pymeasure.instruments.agilent.agilent33500' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_attribute():
+    from pymeasure.instruments.agilent.agilent33500 import Agilent33500
+    assert agilent.Agilent33500 is Agilent33500
+
+
+def test_submodule():
+    assert agilent.agilent4156.Agilent4156 is agilent.Agilent4156
+
+
+def test_dir():
+    assert {"Agilent33500", "AgilentB2987"} <= set(dir(agilent))
+    assert "Agilent33500" in agilent.__all__
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        getattr(agilent, "Agilent0000")  # noqa: B009
+
+
+def test_dunder_attribute():
+    with pytest.raises(AttributeError):
+        _ = agilent.__wrapped__
+
+
+def test_missing_optional_module():
+    __getattr__, __dir__, __all__ = lazy_import(agilent.__name__, {
+        ".agilent0000": ["Agilent0000"],
+    }, optional=[".agilent0000"])
+    assert __all__ == []
+    assert "Agilent0000" not in __dir__()
+    with pytest.raises(AttributeError):
+        __getattr__("Agilent0000")
+
+
+@pytest.mark.parametrize("vendor", vendor_packages)
+def test_type_checking_imports_match_lazy_imports(vendor):
+    """The imports for type checkers have to list the same classes as lazy_import."""
+    tree = ast.parse((instruments_dir / vendor / "__init__.py").read_text(encoding="utf-8"))
+    type_checking = set()
+    lazy = set()
+    optional = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING":
+            for statement in node.body:
+                assert isinstance(statement, ast.ImportFrom)
+                module = "." * statement.level + (statement.module or "")
+                type_checking.update((module, alias.name) for alias in statement.names)
+        elif isinstance(node, ast.Call) and ast.unparse(node.func) == "lazy_import":
+            modules = ast.literal_eval(node.args[1])
+            lazy.update((module, name) for module, names in modules.items() for name in names)
+            for keyword in node.keywords:
+                if keyword.arg == "optional":
+                    optional.update(ast.literal_eval(keyword.value))
+    assert type_checking == lazy
+    package = importlib.import_module(f"{pymeasure.instruments.__name__}.{vendor}")
+    assert sorted(package.__all__) == sorted(name for module, name in lazy
+                                             if module not in optional)
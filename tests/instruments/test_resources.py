@@ -0,0 +1,41 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import importlib.util
+
+import pytest
+
+from pymeasure.instruments.resources import list_resources
+
+if not importlib.util.find_spec('pyvisa_sim'):
+    pytest.skip('PyVISA tests require the pyvisa-sim library', allow_module_level=True)
+
+
+def test_list_resources(capsys):
+    resources = list_resources(timeout=1000, max_workers=4, visa_library="@sim")
+    assert "ASRL2::INSTR" in resources
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(resources)
+    for n, (line, resource) in enumerate(zip(lines, resources)):
+        assert line.startswith(f"{n} : {resource} : ")
@@ -0,0 +1,61 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.waveforms import pipelined, transport_chunk_size, waveform_record
+
+
+def test_pipelined_requests_before_processing():
+    log = []
+    steps = [(lambda i=i: log.append(f"request {i}"), lambda i=i: f"response {i}")
+             for i in range(3)]
+    for response in pipelined(steps):
+        log.append(f"process {response}")
+    assert log == ["request 0", "request 1", "process response 0", "request 2",
+                   "process response 1", "process response 2"]
+
+
+def test_pipelined_empty():
+    assert list(pipelined([])) == []
+
+
+@pytest.mark.parametrize("chunk_size, expected", [(4096, 4096), (0, 100), (None, 100)])
+def test_transport_chunk_size(chunk_size, expected):
+    adapter = SimpleNamespace(connection=SimpleNamespace(chunk_size=chunk_size))
+    assert transport_chunk_size(adapter, 100) == expected
+
+
+def test_waveform_record():
+    record = waveform_record(np.array([0, 1.]), {"C1": np.array([2, 3.]), "C2": np.array([4, 5])})
+    assert record.dtype.names == ("time", "C1", "C2")
+    assert list(record["C2"]) == [4, 5]
+
+
+def test_waveform_record_length_mismatch():
+    with pytest.raises(ValueError):
+        waveform_record(np.array([0, 1.]), {"C1": np.array([2.])})
@@ -0,0 +1,59 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2026 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import subprocess
+import sys
+
+import pytest
+
+from pymeasure._lazy import lazy_module
+
+
+def test_module_is_executed_on_attribute_access():
+    code = ("import sys; from pymeasure._lazy import lazy_module; "
+            "json = lazy_module('json'); assert 'json.decoder' not in sys.modules; "
+            "assert json.loads('1') == 1; assert 'json.decoder' in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_concurrent_first_access():
+    code = ("import threading; from pymeasure._lazy import lazy_module; "
+            "pd = lazy_module('pandas'); errors = []\n"
+            "def access():\n"
+            "    try: pd.DataFrame({'x': [1]})\n"
+            "    except Exception as exc: errors.append(exc)\n"
+            "threads = [threading.Thread(target=access) for _ in range(8)]\n"
+            "for thread in threads: thread.start()\n"
+            "for thread in threads: thread.join()\n"
+            "assert not errors, errors")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_imported_module():
+    assert lazy_module("sys") is sys
+
+
+def test_missing_module():
+    with pytest.raises(ModuleNotFoundError):
+        lazy_module("pymeasure_missing_module")